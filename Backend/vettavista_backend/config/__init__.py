@@ -7,22 +7,31 @@ Directory Structure:
     config/
         templates/  - Template files with default values (.yaml)
     {user_data_dir}/local/     - Local override files (OS-dependent)
+
+Each config is exposed as a DynamicConfig whose attributes are the fields of the current model.
+The fields are copied onto the DynamicConfig on every (re)load, so reading them costs the same as
+reading them from the model and modules importing a config still see reloaded values.
+Configs are loaded on first access, load_configs() loads all of them at once.
 """
+import atexit
+import hashlib
 import logging
 import os
 import shutil
-from dataclasses import is_dataclass, fields, dataclass
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
-from threading import Lock
-from typing import Dict, Any, Type, List, Generic, TypeVar, Callable
+from threading import Event, Lock, Thread
+from typing import Dict, Any, Type, List, Generic, TypeVar, Callable, Optional, Set, Tuple, Union, TYPE_CHECKING, get_type_hints, get_origin, get_args
 
+import orjson
 import platformdirs
 import yaml
-from watchdog.events import FileSystemEventHandler, FileSystemEvent, DirMovedEvent, \
-    FileMovedEvent, DirModifiedEvent, FileModifiedEvent, DirCreatedEvent, FileCreatedEvent
-from watchdog.observers import Observer
+from watchfiles import Change, watch
 
 from vettavista_backend.config.global_constants import APP_NAME
 from vettavista_backend.config.models import (
@@ -34,138 +43,346 @@ T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
+# The libyaml based loader is much faster, fall back to the pure Python one if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    logger.warning("PyYAML was built without libyaml, config files are parsed with the slower pure Python loader")
+
+# Parsed YAML files keyed by path as (stat key, content digest, data), reused while the file's (mtime_ns, size)
+# is unchanged. Files with the same content as another cached file reuse its parsed data.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], str, Any]] = {}
+_PARSE_CACHE_LOCK = Lock()
+
+# Bump when the layout of the JSON sidecar files changes
+_SIDECAR_VERSION = 1
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """Get the (mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _read_file(path: str) -> Tuple[Tuple[int, int], bytes]:
+    """Read a whole file as bytes, along with the stat key of the content that was read."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        stat = os.fstat(fd)
+        chunks = [os.read(fd, stat.st_size or 4096)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    return (stat.st_mtime_ns, stat.st_size), b"".join(chunks)
+
+@lru_cache(maxsize=None)
+def _sidecar_path(path: str) -> Path:
+    """Get the path of the JSON sidecar holding the parsed data of a YAML file.
+
+    Sidecars live in the user cache directory, since templates may be installed somewhere read-only.
+    """
+    cache_dir = Path(platformdirs.user_cache_dir(APP_NAME, appauthor=False)) / "config"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path_digest = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+    return cache_dir / f"{Path(path).stem}.{path_digest}.v{_SIDECAR_VERSION}.json"
+
+def _read_sidecar(path: str, stat_key: Tuple[int, int]) -> Optional[Tuple[str, Any]]:
+    """Get (content digest, data) from the sidecar of a YAML file, or None if there is no sidecar for this version of the file."""
+    try:
+        sidecar = orjson.loads(_read_file(str(_sidecar_path(path)))[1])
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if sidecar.get("stat") != list(stat_key) or sidecar.get("yaml") != yaml.__version__:
+        return None
+    return sidecar["digest"], sidecar["data"]
+
+def _write_sidecar(path: str, stat_key: Tuple[int, int], digest: str, data: Any) -> None:
+    """Store parsed YAML data as JSON, unless JSON can't represent it exactly (e.g. YAML dates)."""
+    try:
+        sidecar = orjson.dumps({"stat": stat_key, "yaml": yaml.__version__, "digest": digest, "data": data})
+        if orjson.loads(sidecar)["data"] != data:
+            return
+    except TypeError:
+        return
+
+    target = _sidecar_path(path)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(sidecar)
+        os.replace(tmp, target)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {target}: {e}")
+        tmp.unlink(missing_ok=True)
+
+def _parse_yaml(raw: bytes) -> Any:
+    """Parse YAML, using orjson for documents written as JSON (JSON is a subset of YAML).
+
+    The templates use block style, so only documents starting with { or [ are tried as JSON.
+    """
+    if raw.lstrip()[:1] in (b"{", b"["):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Flow style YAML, e.g. with comments or unquoted strings
+    return yaml.load(raw, Loader=_SafeLoader)
+
+def _load_yaml(path: str, stat_key: Tuple[int, int]) -> Any:
+    """Parse a YAML file, reusing earlier results if the file is unchanged or has the content of another cached file.
+
+    Parsed data is also kept in a JSON sidecar, so later processes skip YAML parsing for unchanged files.
+    """
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[2]
+
+    raw = None
+    from_sidecar = _read_sidecar(path, stat_key)
+    if from_sidecar is not None:
+        digest, data = from_sidecar
+    else:
+        stat_key, raw = _read_file(path)
+        digest, data = hashlib.blake2b(raw).hexdigest(), None
+
+    with _PARSE_CACHE_LOCK:
+        shared = next((other for _, other_digest, other in _PARSE_CACHE.values() if other_digest == digest), None)
+    if shared is not None:
+        data = shared
+    elif raw is not None:
+        data = _parse_yaml(raw)
+        _write_sidecar(path, stat_key, digest, data)
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[path] = (stat_key, digest, data)
+    return data
+
 def convert_datetime(value: str) -> datetime:
     """Convert YAML datetime string to datetime object."""
     if value == "Present":
         return datetime.max
+    # Fast path for the usual YYYY-MM, strptime handles the rest (e.g. single digit months) and reports errors
+    if len(value) == 7 and value[4] == "-" and value[:4].isdigit() and value[5:].isdigit() and 1 <= int(value[5:]) <= 12:
+        return datetime(int(value[:4]), int(value[5:]), 1)
     return datetime.strptime(value, "%Y-%m")
 
-def construct_nested_objects(data: Dict[str, Any], model_class: Type) -> Dict[str, Any]:
-    """Recursively construct nested dataclass objects."""
-    if not is_dataclass(model_class):
-        return data
-
-    field_types = {f.name: f.type for f in fields(model_class)}
-    result = {}
-
-    for key, value in data.items():
-        if key not in field_types:
-            continue
-
-        field_type = field_types[key]
-        
-        # Handle datetime fields
-        if field_type == datetime and isinstance(value, str):
-            result[key] = convert_datetime(value)
-            continue
-
-        # Handle lists of dataclass objects
-        if getattr(field_type, "__origin__", None) == list:
-            item_type = field_type.__args__[0]
-            if is_dataclass(item_type) and isinstance(value, list):
-                result[key] = [
-                    item_type(**construct_nested_objects(item, item_type))
-                    for item in value
-                ]
-                continue
-
-        # Handle nested dataclass
-        if is_dataclass(field_type) and isinstance(value, dict):
-            result[key] = field_type(**construct_nested_objects(value, field_type))
-            continue
-
-        result[key] = value
-
-    return result
-
-class ConfigFileHandler(FileSystemEventHandler):
-    """Handles file system events for config files."""
-    def __init__(self, refresh_callback: Callable):
-        super().__init__()
-        self.watched_filenames = set()
-        self.refresh_callback = refresh_callback
-
-    def add_watched_file(self, filepath):
-        """Add a file's basename to the watch list."""
-        self.watched_filenames.add(filepath)
-
-    def on_created(self, event: DirCreatedEvent | FileCreatedEvent) -> None:
-        self._on_filtered_event(event)
-
-    def on_modified(self, event: DirModifiedEvent | FileModifiedEvent) -> None:
-        self._on_filtered_event(event)
-
-    def _on_filtered_event(self, event: FileSystemEvent) -> None:
-        # Watch for any event affecting our target files
-        if event.src_path in self.watched_filenames:
-            self.refresh_callback()
-            return
-
-        # Check if it's a directory and search recursively
-        if os.path.isdir(event.src_path):
-            for root, _, files in os.walk(event.src_path):
-                if any(os.path.join(root, filename) in self.watched_filenames for filename in files):
-                    self.refresh_callback()
-                    return
-
-    def on_moved(self, event: DirMovedEvent | FileMovedEvent) -> None:
-        if event.dest_path in self.watched_filenames:
-            self.refresh_callback()
-            return
-
-        # Check if it's a directory and search recursively
-        if os.path.isdir(event.dest_path):
-            for root, _, files in os.walk(event.dest_path):
-                if any(os.path.join(root, filename) in self.watched_filenames for filename in files):
-                    self.refresh_callback()
-                    return
-
-@dataclass
-class ConfigState(Generic[T]):
-    data: T
+# Kinds of dataclass fields handled by the generated builders
+_PLAIN, _DATETIME, _LIST_DATACLASS, _NESTED_DATACLASS = range(4)
+
+def _unwrap_optional(field_type: Any) -> Any:
+    """Get X from Optional[X], other types are returned unchanged."""
+    if get_origin(field_type) is Union:
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return field_type
+
+@lru_cache(maxsize=None)
+def _field_spec(model_class: Type) -> Dict[str, Tuple[int, Type]]:
+    """Classify the fields of a dataclass once, mapping field name to (kind, type to construct).
+
+    get_type_hints resolves string annotations, so the classification also holds for postponed annotations.
+    """
+    spec = {}
+    for name, field_type in get_type_hints(model_class).items():
+        field_type = _unwrap_optional(field_type)
+        if field_type is datetime:
+            spec[name] = (_DATETIME, field_type)
+        elif get_origin(field_type) is list and get_args(field_type) and is_dataclass(get_args(field_type)[0]):
+            spec[name] = (_LIST_DATACLASS, get_args(field_type)[0])
+        elif is_dataclass(field_type):
+            spec[name] = (_NESTED_DATACLASS, field_type)
+        else:
+            spec[name] = (_PLAIN, field_type)
+    return spec
+
+# Generated builders keyed by model class, see _get_builder
+_GENERATED_BUILDERS: Dict[Type, Callable[[Dict[str, Any]], Any]] = {}
+
+def _get_builder(model_class: Type) -> Callable[[Dict[str, Any]], Any]:
+    """Get the function that builds a model_class instance from parsed YAML data."""
+    builder = _GENERATED_BUILDERS.get(model_class)
+    if builder is None:
+        builder = _generate_builder(model_class)
+    return builder
+
+def _generate_builder(model_class: Type) -> Callable[[Dict[str, Any]], Any]:
+    """Generate a builder for a dataclass with the handling of each field inlined.
+
+    Only keys present in the data are passed, so dataclass defaults still apply and unknown keys are ignored.
+    Nested and list dataclass fields call the builder of their own class.
+    """
+    namespace = {'model_class': model_class, 'convert_datetime': convert_datetime}
+    lines = ['def build(d):', '    kwargs = {}']
+    for i, (name, (kind, field_type)) in enumerate(_field_spec(model_class).items()):
+        if kind == _DATETIME:
+            value = 'convert_datetime(v) if isinstance(v, str) else v'
+        elif kind == _LIST_DATACLASS:
+            namespace[f'build_{i}'] = _get_builder(field_type)
+            value = f'[build_{i}(item) for item in v] if isinstance(v, list) else v'
+        elif kind == _NESTED_DATACLASS:
+            namespace[f'build_{i}'] = _get_builder(field_type)
+            value = f'build_{i}(v) if isinstance(v, dict) else v'
+        else:
+            value = 'v'
+        lines += [
+            f'    if {name!r} in d:',
+            f'        v = d[{name!r}]',
+            f'        kwargs[{name!r}] = {value}',
+        ]
+    lines.append('    return model_class(**kwargs)')
+
+    exec(compile('\n'.join(lines), f'<config builder {model_class.__name__}>', 'exec'), namespace)
+    builder = namespace['build']
+    _GENERATED_BUILDERS[model_class] = builder
+    return builder
+
+# Set this environment variable to poll for changes instead, for config directories on file systems
+# without native change events (e.g. network shares). Polling is slow, so the interval is long.
+CONFIG_POLLING_ENV = "VETTAVISTA_CONFIG_POLLING"
+CONFIG_POLLING_INTERVAL = 5
+
+class _SharedWatcher:
+    """Watches all config files from one background thread, dispatching changes by exact path.
+
+    Each file's parent directory is watched non-recursively. watchfiles batches the raw events until
+    the directories have been quiet for a moment, and only changes to registered files are passed back
+    to Python, so a burst of writes like an editor's atomic save ends up as a single reload.
+    """
+    def __init__(self):
+        self._callbacks: Dict[str, List[Callable]] = {}
+        self._watched_dirs = set()
+        self._lock = Lock()
+        self._stop_event: Optional[Event] = None
+        # Replaced threads may still be winding down, stop() waits for all of them
+        self._threads: List[Thread] = []
+        self._reload_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="config-reload")
+        atexit.register(self.stop)
+
+    def watch(self, filepath: str, callback: Callable) -> None:
+        """Call the callback when the file is created or modified."""
+        path = sys.intern(os.path.normcase(os.path.realpath(filepath)))
+        directory = os.path.dirname(path)
+        with self._lock:
+            self._callbacks.setdefault(path, []).append(callback)
+            if directory not in self._watched_dirs:
+                self._watched_dirs.add(directory)
+                # watchfiles takes a fixed set of paths, so restart the watcher with the new directory
+                self._start(tuple(self._watched_dirs))
+
+    def stop(self) -> None:
+        """Stop the watcher threads and wait for them to exit."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+            if self._stop_event is not None:
+                self._stop_event.set()
+            self._stop_event = None
+        for thread in threads:
+            thread.join()
+
+    def _start(self, directories: Tuple[str, ...]) -> None:
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self._stop_event = Event()
+        thread = Thread(target=self._run, args=(directories, self._stop_event), name="config-watcher", daemon=True)
+        self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+        thread.start()
+
+    def _is_watched(self, change: Change, path: str) -> bool:
+        # Event paths are built from the resolved directories, so only case needs normalizing
+        return change != Change.deleted and os.path.normcase(path) in self._callbacks
+
+    def _run(self, directories: Tuple[str, ...], stop_event: Event) -> None:
+        polling = bool(os.environ.get(CONFIG_POLLING_ENV))
+        try:
+            for changes in watch(*directories, watch_filter=self._is_watched, stop_event=stop_event,
+                                 recursive=False, raise_interrupt=False, force_polling=polling,
+                                 poll_delay_ms=CONFIG_POLLING_INTERVAL * 1000):
+                self._dispatch({os.path.normcase(path) for _, path in changes})
+        except Exception as e:
+            logger.error(f"Config file watcher stopped: {e}")
+
+    def _dispatch(self, paths: Set[str]) -> None:
+        """Call each callback registered for the changed paths once for the whole batch.
+
+        A config watches both its template and local file, so a batch touching both reloads it only once.
+        """
+        with self._lock:
+            callbacks = {}
+            for path in paths:
+                for callback in self._callbacks.get(path, ()):
+                    callbacks.setdefault(callback, path)
+        if len(callbacks) > 1:
+            # Reload several configs on the pool, libyaml releases the GIL so their parses overlap.
+            # Waiting for them keeps a config's reloads in the order of the batches.
+            try:
+                futures = [self._reload_pool.submit(self._run_callback, callback, path)
+                           for callback, path in callbacks.items()]
+            except RuntimeError:
+                pass  # The pool is shut down once the interpreter starts exiting
+            else:
+                for future in futures:
+                    future.result()
+                return
+        for callback, path in callbacks.items():
+            self._run_callback(callback, path)
+
+    @staticmethod
+    def _run_callback(callback: Callable, path: str) -> None:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Error reloading config {path}: {e}")
+
+_shared_watcher = _SharedWatcher()
+
+@lru_cache(maxsize=1)
+def _local_config_dir() -> Path:
+    """Get the resolved directory of the local config files, creating it on first use.
+
+    Shared by all configs, so the platform lookup, mkdir and path resolution happen once per process.
+    """
+    # Set up platform-specific config directory using platformdirs
+    local_dir = Path(platformdirs.user_config_dir(APP_NAME, appauthor=False)) / "local"
+    local_dir.mkdir(parents=True, exist_ok=True)
+    return local_dir.resolve()
 
 class DynamicConfig(Generic[T]):
-    def __init__(self, name: str, model_class: type[T]):
+    def __init__(self, name: str, model_class: type[T], watch: bool = True):
         self.name = name
         self.model_class = model_class
         self.template_path = resources.files('vettavista_backend.config.templates').joinpath(f"{name}.yaml")
 
-        # Set up platform-specific config directory using platformdirs
-        config_dir = Path(platformdirs.user_config_dir(APP_NAME, appauthor=False))
-        local_dir = config_dir / "local"
-
-        # Create config and local directories if they don't exist
-        local_dir.mkdir(parents=True, exist_ok=True)
-
-        self.local_path = str(local_dir / f"{name}.yaml")
+        self.local_path = str(_local_config_dir() / f"{name}.yaml")
 
         # Copy template to local if local doesn't exist but template does
         if os.path.exists(str(self.template_path)) and not os.path.exists(self.local_path):
             shutil.copy2(str(self.template_path), self.local_path)
 
-        self._state: ConfigState[T] | None = None
+        # The current model, replaced with a single assignment on reload so readers never need the lock
+        self._current: T | None = None
         self._lock = Lock()
+        self._last_stats: Tuple[Optional[Tuple[int, int]], ...] | None = None
+
+        # Fields are mirrored on this object, so they must not collide with its own attributes
+        shadowed = _field_spec(model_class).keys() & set(dir(self))
+        if shadowed:
+            raise ValueError(f"Fields of {model_class.__name__} shadow DynamicConfig attributes: {', '.join(sorted(shadowed))}")
 
         self._load_config()
 
         # List to store callback functions from other classes
         self._listeners: List[Callable[[T], None]] = []
 
-        # Setup file watching
-        self._file_handler = ConfigFileHandler(self.refresh)
-        self._file_handler.add_watched_file(str(self.template_path))
-        self._file_handler.add_watched_file(os.path.realpath(self.local_path))
+        if watch:
+            self.start_watching()
 
-        self._observer = Observer()
-
-        # Watch both template and local directories
-        template_dir = os.path.dirname(str(self.template_path))
-        self._observer.schedule(self._file_handler, template_dir, recursive=False)
-        self._observer.schedule(self._file_handler, str(self.template_path), recursive=False)
-        self._observer.schedule(self._file_handler, str(os.path.realpath(local_dir)), recursive=True)
-        self._observer.schedule(self._file_handler, str(os.path.realpath(self.local_path)), recursive=True)
-
-        self._observer.start()
+    def start_watching(self) -> None:
+        """Reload the config whenever its template or local file changes."""
+        _shared_watcher.watch(str(self.template_path), self.refresh)
+        _shared_watcher.watch(self.local_path, self.refresh)
 
     def register_listener(self, callback: Callable[[T], None]) -> None:
         """
@@ -199,50 +416,98 @@ class DynamicConfig(Generic[T]):
                 # Handle or log errors from listeners
                 logging.error(f"Error in config listener: {e}")
 
-    def _load_config(self) -> None:
-        config = {}
-
-        # Load from template
-        if os.path.exists(str(self.template_path)):
-            with self.template_path.open('r') as f:
-                template_data = yaml.safe_load(f)
-                config.update(template_data or {})
-
-        # Load from platform-specific local path
-        if os.path.exists(self.local_path):
-            with open(self.local_path, "r") as f:
-                local_data = yaml.safe_load(f)
-                config.update(local_data or {})
-
-        processed_config = construct_nested_objects(config, self.model_class)
-        self._state = ConfigState(
-            data=self.model_class(**processed_config)
-        )
+    def _file_stats(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """Get the stat keys of the template and local files."""
+        return _stat_key(str(self.template_path)), _stat_key(self.local_path)
+
+    def _load_config(self, stats: Tuple[Optional[Tuple[int, int]], ...] | None = None) -> None:
+        if stats is None:
+            stats = self._file_stats()
+        template_stat, local_stat = stats
+
+        # Load from template, then from platform-specific local path
+        template_data = _load_yaml(str(self.template_path), template_stat) if template_stat else None
+        local_data = _load_yaml(self.local_path, local_stat) if local_stat else None
+        config = dict(template_data or {})
+        # The local file is usually an unmodified copy of the template, in which case both share the parsed data
+        if local_data and local_data is not template_data:
+            config.update(local_data)
+
+        data = _get_builder(self.model_class)(config)
+        self._current = data
+        # Mirror the fields on this object so reading them is a plain attribute lookup
+        self.__dict__.update({name: getattr(data, name) for name in _field_spec(self.model_class)})
+        self._last_stats = stats
 
     def get(self) -> T:
-        return self._state.data
+        return self._current
 
     def refresh(self):
         with self._lock:
-            self._load_config()
-            config = self._state.data
+            # Events for other files in the watched directories don't change this config
+            stats = self._file_stats()
+            if stats == self._last_stats:
+                return
+            self._load_config(stats)
+            config = self._current
 
         # Notify listeners outside the lock to avoid deadlocks
         if self._listeners:
             self._notify_listeners(config)
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self.get(), name)
-
-    def __del__(self):
-        """Clean up the observer when the config object is destroyed."""
-        self._observer.stop()
-        self._observer.join()
-
-# Initialize dynamic configurations
-personals = DynamicConfig('personals', PersonalsModel)
-resume = DynamicConfig('resume', ResumeModel)
-search = DynamicConfig('search', SearchModel)
-secrets = DynamicConfig('secrets', SecretsModel)
-ai_settings = DynamicConfig('ai_settings', AISettingModel)
-ai_prompts = DynamicConfig('ai_prompts', AIPromptsModel)
\ No newline at end of file
+        # Only reached for non-field attributes of the model, fields are mirrored in __dict__
+        return getattr(self._current, name)
+
+# Configs exposed as module attributes, each one is loaded on first access through __getattr__
+_CONFIG_MODELS: Dict[str, Type] = {
+    'personals': PersonalsModel,
+    'resume': ResumeModel,
+    'search': SearchModel,
+    'secrets': SecretsModel,
+    'ai_settings': AISettingModel,
+    'ai_prompts': AIPromptsModel,
+}
+_configs_lock = Lock()
+
+if TYPE_CHECKING:
+    personals: DynamicConfig[PersonalsModel]
+    resume: DynamicConfig[ResumeModel]
+    search: DynamicConfig[SearchModel]
+    secrets: DynamicConfig[SecretsModel]
+    ai_settings: DynamicConfig[AISettingModel]
+    ai_prompts: DynamicConfig[AIPromptsModel]
+
+def _publish(configs: Dict[str, DynamicConfig]) -> None:
+    """Store loaded configs as module globals so later lookups don't go through __getattr__."""
+    globals().update(configs)
+
+def load_configs() -> None:
+    """Load every config that hasn't been loaded yet in parallel, then start watching their files.
+
+    Meant for entrypoints that need all configs anyway, everything else loads configs on first access.
+    """
+    with _configs_lock:
+        specs = [(name, model_class) for name, model_class in _CONFIG_MODELS.items() if name not in globals()]
+        if not specs:
+            return
+        with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+            configs = dict(zip(
+                (name for name, _ in specs),
+                executor.map(lambda spec: DynamicConfig(*spec, watch=False), specs)
+            ))
+        for config in configs.values():
+            config.start_watching()
+        _publish(configs)
+
+def __getattr__(name: str) -> DynamicConfig:
+    model_class = _CONFIG_MODELS.get(name)
+    if model_class is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _configs_lock:
+        # Another thread may have loaded it while this one waited for the lock
+        config = globals().get(name)
+        if config is None:
+            config = DynamicConfig(name, model_class)
+            _publish({name: config})
+    return config
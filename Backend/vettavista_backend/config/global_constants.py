@@ -10,10 +10,20 @@ LOW_THRESHOLD = 0.45   # For "possible_match"
 
 # Title matching settings
 TITLE_MATCH_SETTINGS = {
-    'model_name': 'intfloat/multilingual-e5-large',  # Model for semantic similarity
+    'model_name': 'intfloat/multilingual-e5-small',  # Model for semantic similarity
+    'prompt': 'query: ',  # e5 input prefix, "query: " on both sides for symmetric similarity
     'cache_size': 1000,  # Number of title embeddings to cache
 }
 
+# Near duplicate job description detection, used when ai_settings.semantic_cache is enabled
+SEMANTIC_CACHE_SETTINGS = {
+    'model_name': TITLE_MATCH_SETTINGS['model_name'],  # Multilingual like the job posts, and usually cached already
+    'prompt': 'query: ',
+    'threshold': 0.97,  # Cosine similarity above which two descriptions get the same analysis
+    'chunk_chars': 1000,  # Descriptions are embedded in chunks of this size, the model truncates long inputs
+    'max_pending': 256,  # Embeddings kept between lookup and the analysis being stored
+}
+
 # Storage settings
 STORAGE_SETTINGS = {
     'blacklist_key': 'blacklisted_companies',
@@ -22,6 +32,11 @@ STORAGE_SETTINGS = {
     'history_file': 'job_history.csv',
     'blacklist_file': 'blacklist.csv',
     'backup_interval': 86400,
+    'history_batch_size': 256,  # Max job history updates written in one batch
+    'history_batch_wait': 0.05,  # Seconds to wait for more updates before writing a batch
+    'history_write_attempts': 3,  # Times a job history batch is written before its updates are dropped
+    'history_retry_wait': 1.0,  # Seconds to wait before writing a failed job history batch again
+    'history_search_ttl': 60,  # Seconds a job history search result is reused if nothing was written
 }
 
 # Application status definitions
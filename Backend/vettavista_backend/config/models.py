@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Education:
     degree: str
     university: str
@@ -15,7 +15,7 @@ class Education:
     start: datetime  # Will be formatted as YYYY-MM when used
     graduation: datetime  # Will be formatted as YYYY-MM when used
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersonalsModel:
     # Contact info
     email: str
@@ -31,7 +31,7 @@ class PersonalsModel:
     zipcode: str
     country: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExperienceEntry:
     title: str
     start: datetime  # Will be formatted as YYYY-MM when used
@@ -39,33 +39,17 @@ class ExperienceEntry:
     organization: str  # Note: this matches the field name in YAML
     location: str
     details: List[str]
-    _exp_id: Optional[str] = field(default=None, init=False)  # Private field for ID
+    # ID used to match Claude's output to the entry, set on copies with dataclasses.replace
+    exp_id: Optional[str] = field(default=None, compare=False)
 
-    @property
-    def exp_id(self) -> Optional[str]:
-        """Get the experience ID."""
-        return self._exp_id
-
-    def set_id(self, value: str) -> None:
-        """Set the experience ID."""
-        object.__setattr__(self, '_exp_id', value)
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectEntry:
     name: str
     details: List[str]
-    _proj_id: Optional[str] = field(default=None, init=False)  # Private field for ID
-
-    @property
-    def proj_id(self) -> Optional[str]:
-        """Get the project ID."""
-        return self._proj_id
-
-    def set_id(self, value: str):
-        """Set the project ID"""
-        object.__setattr__(self, '_proj_id', value)
+    # ID used to match Claude's output to the entry, set on copies with dataclasses.replace
+    proj_id: Optional[str] = field(default=None, compare=False)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResumeModel:
     # Profile
     website: str
@@ -86,11 +70,11 @@ class ResumeModel:
     # Cover Letter Template
     cover_letter_template: Optional[str]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SecretsModel:
     claude_api_key: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchModel:
     # Job preferences
     preferred_titles: List[str]
@@ -100,7 +84,7 @@ class SearchModel:
     # Language detection
     lang_detect_remove_words: List[str] = field(default_factory=list)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AISettingModel:
     # Claude Settings
     # Temperature settings
@@ -114,7 +98,21 @@ class AISettingModel:
     # Other settings
     claude_thinking: bool
 
-@dataclass(frozen=True)
+    # Days a cached job extraction is reused before Claude is asked again
+    llm_cache_ttl_days: float = 30
+
+    # Rate limits of the API key, adjusted automatically from the limits reported by the API
+    claude_requests_per_minute: int = 50
+    claude_input_tokens_per_minute: int = 30000
+
+    # Job descriptions shorter than this are not sent to Claude, there is nothing to extract from them
+    min_extract_chars: int = 200
+
+    # Reuse the analysis of near duplicate job descriptions, e.g. the same job posted on several boards.
+    # Loads an embedding model, and a near duplicate that differs in its requirements gets the wrong analysis.
+    semantic_cache: bool = False
+
+@dataclass(frozen=True, slots=True)
 class AIPromptsModel:
     # Claude Prompts
     claude_extraction_prompt_base: str
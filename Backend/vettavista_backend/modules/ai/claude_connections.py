@@ -5,25 +5,32 @@ Claude integration for job application processing.
 import asyncio
 import json
 import logging
+import re
+from dataclasses import replace
 from datetime import datetime
-from typing import Dict, Union, AsyncGenerator, Tuple, List, Any
+from typing import Dict, Union, AsyncGenerator, Tuple, List, Any, Optional
 
 import demjson3
-from anthropic import AsyncAnthropic, DefaultAioHttpClient
-from anthropic._exceptions import ServiceUnavailableError, OverloadedError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import orjson
+from anthropic import AsyncAnthropic, DefaultAioHttpClient, DEFAULT_CONNECTION_LIMITS
+from anthropic._exceptions import ServiceUnavailableError, OverloadedError, RateLimitError
+from anthropic.types import Message
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random, retry_if_exception_type
 
 from vettavista_backend.config import resume, ResumeModel, DynamicConfig, global_constants, ai_prompts
 from vettavista_backend.modules.ai import ClaudeServiceProtocol
 from vettavista_backend.modules.business.cache.job_cache_service import JobCacheService
 from vettavista_backend.modules.business.utils.language_detector import HybridLanguageDetector
-from vettavista_backend.modules.utils import DataClassJSONEncoder
+from vettavista_backend.modules.utils import dumps_json
 
 logger = logging.getLogger(__name__)
 
 # Import settings from config
 from vettavista_backend.config import secrets, ai_settings
-from vettavista_backend.modules.ai.prompts import claude_system_messages, create_extraction_prompt, get_cultural_context
+from vettavista_backend.modules.ai.llm_cache import LLMCache, cache_key
+from vettavista_backend.modules.ai.semantic_cache import SemanticCache
+from vettavista_backend.modules.ai.rate_limiter import ClaudeRateLimiter, estimate_tokens, wait_for_rate_limit_reset
+from vettavista_backend.modules.ai.prompts import claude_system_messages, claude_system_blocks, create_extraction_prompt, get_cultural_context
 from vettavista_backend.modules.models.services import JobDetailedInfo, JobAnalysisInfo, VisaSupport
 from vettavista_backend.config.models import ExperienceEntry, ProjectEntry
 
@@ -31,14 +38,70 @@ class ClaudeResponseError(Exception):
     """Raised when Claude's response doesn't meet our requirements."""
     pass
 
+# Skill categories every extraction result has, possibly empty
+REQUIRED_SKILL_KEYS = (
+    "programming languages",
+    "frameworks",
+    "mobile development",
+    "other technical",
+    "soft skills"
+)
+
+# Visa support statuses by their value, unknown values map to UNKNOWN
+VISA_SUPPORT_BY_VALUE: Dict[str, VisaSupport] = {member.value: member for member in VisaSupport}
+
+# Fields every achievement of Claude's experience and project responses must have
+ACHIEVEMENT_FIELDS = frozenset({"text", "is_critical", "domain", "relevance_score"})
+PROJECT_DETAIL_FIELDS = frozenset({"text", "domain"})
+
+# Retries wait until the time given by the failed response's headers, or back off exponentially with jitter
+CLAUDE_RETRY_WAIT = wait_for_rate_limit_reset(wait_exponential(multiplier=2, min=4, max=10) + wait_random(0, 1))
+
+# Responses asked for per extraction, the later ones correct the errors of the previous response
+EXTRACTION_ATTEMPTS = 3
+
+# Contents of a markdown code block, preferring one marked as JSON. An unclosed block runs to the end of the text.
+JSON_FENCE_PATTERN = re.compile(r'```json(.*?)(?:```|\Z)', re.S)
+FENCE_PATTERN = re.compile(r'```(.*?)(?:```|\Z)', re.S)
+
+# A comma right before a closing bracket, the most common way Claude's JSON is invalid
+TRAILING_COMMA_PATTERN = re.compile(r',(\s*[}\]])')
+
+# Seconds between checks whether a message batch has finished
+BATCH_POLL_INTERVAL = 30
+# Seconds to wait for a message batch before cancelling it and extracting its jobs one by one
+BATCH_MAX_WAIT = 15 * 60
+
+# The SDK refuses non-streaming requests that may take longer than 10 minutes, judged by max_tokens
+NON_STREAMING_MAX_TOKENS = 21_333
+
+# Connection pool of the Claude client. Calls are spaced out by user actions, so idle connections are kept
+# much longer than the SDK's 5 second default to skip the TCP and TLS handshakes on the next call.
+# The Limits class is httpx's or httpx2's depending on the SDK version, so it is taken from the SDK default.
+CLAUDE_CONNECTION_LIMITS = type(DEFAULT_CONNECTION_LIMITS)(
+    max_connections=4,
+    max_keepalive_connections=4,
+    keepalive_expiry=75,
+)
+
 class ClaudeService(ClaudeServiceProtocol):
     def __init__(self):
-        self.anthropic = AsyncAnthropic(api_key=secrets.claude_api_key, http_client=DefaultAioHttpClient())
+        self.anthropic = AsyncAnthropic(
+            api_key=secrets.claude_api_key,
+            http_client=DefaultAioHttpClient(limits=CLAUDE_CONNECTION_LIMITS)
+        )
 
         # The sdk needs to be re-initialized if secrets changed
         secrets.register_listener(self.on_secrets_changed)
 
-        self.api_semaphore = asyncio.Semaphore(2)  # Allow max 2 concurrent API calls
+        self.api_semaphore = asyncio.Semaphore(4)  # Safety cap of 4 concurrent API calls, one per pooled connection
+        # Keeps bursts under the per-minute limits, retuned from the rate limit headers of each response
+        self.rate_limiter = ClaudeRateLimiter(ai_settings.claude_requests_per_minute,
+                                              ai_settings.claude_input_tokens_per_minute)
+        self.llm_cache = LLMCache()  # Parsed extraction responses, reused across runs
+        self.semantic_cache = SemanticCache()  # Finds the cached extractions of near duplicate descriptions
+        self._original_skills_cache: Tuple[Dict, Dict[str, str]] | None = None  # See _get_original_skills
+        self._resume_with_ids_cache: Tuple[ResumeModel, ResumeModel] | None = None  # See _get_resume_with_ids
 
     def config_thinking_temperature(self, high_temperature=False):
         """
@@ -59,18 +122,32 @@ class ClaudeService(ClaudeServiceProtocol):
                 else ai_settings.claude_extraction_temperature,
             }
 
+    async def _get_message(self, stream: bool = False, **kwargs) -> Message:
+        """Send one request to Claude within the concurrency and rate limits and return the final message.
+
+        The keyword arguments are passed to messages.create. Requests are only streamed when asked to or when
+        max_tokens is too large for a non-streaming request, as parsing the stream costs extra CPU time.
+        """
+        estimated_tokens = estimate_tokens(kwargs.get("system", []), kwargs["messages"])
+        async with self.api_semaphore:
+            await self.rate_limiter.acquire(estimated_tokens)
+            if stream or kwargs["max_tokens"] > NON_STREAMING_MAX_TOKENS:
+                async with self.anthropic.messages.stream(**kwargs) as message_stream:
+                    message = await message_stream.get_final_message()
+                headers = message_stream.response.headers
+            else:
+                raw_response = await self.anthropic.messages.with_raw_response.create(**kwargs)
+                message = raw_response.parse()
+                headers = raw_response.headers
+            self.rate_limiter.update_from_headers(headers)
+        return message
+
     def validate_and_clean_skills_dict(self, skills_dict: Dict) -> Dict:
         """
         Validate and clean the skills dictionary.
         Ensures all required keys exist and values are lists of strings.
         """
-        required_keys = [
-            "programming languages",
-            "frameworks",
-            "mobile development",
-            "other technical",
-            "soft skills"
-        ]
+        required_keys = REQUIRED_SKILL_KEYS
 
         # Create default structure
         clean_dict = {
@@ -121,18 +198,33 @@ class ClaudeService(ClaudeServiceProtocol):
         Handles various formats and common issues.
         """
         # Remove any markdown formatting
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
+        fence = JSON_FENCE_PATTERN.search(text) or FENCE_PATTERN.search(text)
+        if fence:
+            text = fence.group(1)
 
         # Clean up the text
         text = text.strip()
 
+        # Responses are almost always valid JSON, or only off by trailing commas or surrounding commentary,
+        # which orjson parses much faster than the lenient parser
+        candidates = [text]
+        start, end = text.find("{"), text.rfind("}") + 1
+        if 0 <= start < end and (start, end) != (0, len(text)):
+            candidates.append(text[start:end])
+        for candidate in candidates:
+            try:
+                return orjson.loads(candidate)
+            except orjson.JSONDecodeError:
+                pass
+            try:
+                return orjson.loads(TRAILING_COMMA_PATTERN.sub(r'\1', candidate))
+            except orjson.JSONDecodeError:
+                pass
+
         try:
-            # Try parsing the cleaned text
-            return demjson3.decode(text)
-        except json.JSONDecodeError as e:
+            # Fall back to the lenient parser for anything else
+            return demjson3.decode(candidates[-1])
+        except (json.JSONDecodeError, demjson3.JSONDecodeError) as e:
             logger.error(f"Failed to parse JSON: {e}")
             raise ClaudeResponseError("Failed to parse JSON response")
         except UnicodeDecodeError as e:
@@ -179,8 +271,8 @@ class ClaudeService(ClaudeServiceProtocol):
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=10),
-        retry=retry_if_exception_type((ClaudeResponseError, ServiceUnavailableError, OverloadedError))
+        wait=CLAUDE_RETRY_WAIT,
+        retry=retry_if_exception_type((ClaudeResponseError, ServiceUnavailableError, OverloadedError, RateLimitError))
     )
     async def answer_question(self, question: str, user_info: str) -> Union[str, AsyncGenerator[str, None]]:
         """
@@ -194,31 +286,24 @@ class ClaudeService(ClaudeServiceProtocol):
                 user_info=user_info
             )
 
-            async with self.anthropic.messages.stream(
-                    model=global_constants.claude_4_0_sonnet_model,
-                    max_tokens=ai_settings.claude_max_tokens,
-                    **self.config_thinking_temperature(high_temperature=True),
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": prompt,
-                                    "cache_control": {"type": "ephemeral"}
-                                }
-                            ]
-                        }
-                    ],
-                    system=[
-                        {
-                            "type": "text",
-                            "text": claude_system_messages["answer_question"],
-                            "cache_control": {"type": "ephemeral", "ttl": "1h"}
-                        }
-                    ],
-            ) as stream:
-                message = await stream.get_final_message()
+            message = await self._get_message(
+                stream=True,
+                model=global_constants.claude_4_0_sonnet_model,
+                max_tokens=ai_settings.claude_max_tokens,
+                **self.config_thinking_temperature(high_temperature=True),
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": prompt
+                            }
+                        ]
+                    }
+                ],
+                system=claude_system_blocks["answer_question"],
+            )
 
 
             if ai_settings.claude_thinking:
@@ -266,9 +351,9 @@ class ClaudeService(ClaudeServiceProtocol):
         reasons = red_flags_dict.get("reasons", [])
         if isinstance(reasons, list):
             clean_dict["reasons"] = [
-                str(reason).strip() 
-                for reason in reasons 
-                if isinstance(reason, str) and reason.strip()
+                stripped
+                for reason in reasons
+                if isinstance(reason, str) and (stripped := reason.strip())
             ]
         else:
             logger.error(f"Invalid red flags reasons: {reasons}")
@@ -284,18 +369,107 @@ class ClaudeService(ClaudeServiceProtocol):
         Returns:
             VisaSupport enum value (SUPPORTED/UNSUPPORTED/UNKNOWN)
         """
-        try:
-            # Convert input to uppercase string and try to create enum
-            status = str(support_status).strip().upper()
-            return VisaSupport(status)
-        except (ValueError, AttributeError):
+        visa_support = VISA_SUPPORT_BY_VALUE.get(str(support_status).strip().upper())
+        if visa_support is None:
             logger.error(f"Invalid visa support status: {support_status}")
             return VisaSupport.UNKNOWN
+        return visa_support
+
+    def validate_extraction(self, response_dict: Dict, post_lang: str) -> Tuple[Dict, Dict, Dict, VisaSupport]:
+        """Validate a parsed extraction response, see batch_extract_job_info for the returned values"""
+        # Extract and validate skills part
+        skills_dict = self.validate_and_clean_skills_dict(response_dict.get('skills', {}))
+
+        # Process language requirements from job description
+        self.process_language_requirements(post_lang, skills_dict)
+
+        # Verify we got some data
+        if not any(skills_dict.values()):
+            raise ClaudeResponseError("No skills extracted")
+
+        # Extract and validate experience part
+        exp_dict = response_dict.get('experience', {})
+        self.validate_experience_dict(exp_dict)
+
+        # Extract and validate new fields
+        red_flags_dict = self.validate_red_flags(response_dict.get('red_flags', {}))
+        visa_support = self.validate_visa_support(response_dict.get('supports_visa', 'UNKNOWN'))
+
+        return skills_dict, exp_dict, red_flags_dict, visa_support
+
+    def _extraction_request(self, job_description: str) -> Tuple[str, Dict[str, Any]]:
+        """Build the extraction request for a job description.
+
+        Returns:
+            Tuple of the LLM cache key and the keyword arguments for messages.create
+        """
+        # Combine both prompts into a single request
+        rules, job_input = create_extraction_prompt(job_description)
+        model = global_constants.claude_4_0_sonnet_model
+        key = cache_key(model, claude_system_messages["extract_requirements"], rules, job_input)
+        params = {
+            "model": model,
+            "max_tokens": ai_settings.claude_max_tokens,
+            **self.config_thinking_temperature(high_temperature=False),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        # Only the rules are cached, the job description is different for every request
+                        {
+                            "type": "text",
+                            "text": rules,
+                            "cache_control": {"type": "ephemeral", "ttl": "1h"}
+                        },
+                        {
+                            "type": "text",
+                            "text": job_input
+                        }
+                    ]
+                }
+            ],
+            "system": claude_system_blocks["extract_requirements"],  # Use unified extraction system message
+        }
+        return key, params
+
+    async def _get_cached_extraction(self, key: str, job_description: str, post_lang: str) -> Optional[Tuple[Dict, Dict, Dict, VisaSupport]]:
+        """Get a validated extraction from the LLM cache, or None if there is no valid one.
+
+        Without an exact match, the extraction of a near duplicate description is used if the semantic cache is enabled.
+        """
+        cached = await self.llm_cache.get(key, ai_settings.llm_cache_ttl_days)
+        if cached is None and ai_settings.semantic_cache:
+            similar_key = await self.semantic_cache.find(key, job_description)
+            if similar_key is not None:
+                cached = await self.llm_cache.get(similar_key, ai_settings.llm_cache_ttl_days)
+        if cached is None:
+            return None
+        try:
+            return self.validate_extraction(cached, post_lang)
+        except ClaudeResponseError as e:
+            logger.warning(f"Ignoring invalid cached extraction: {str(e)}")
+            return None
+
+    async def _cache_extraction(self, key: str, job_description: str, response_dict: Dict) -> None:
+        """Store a validated extraction response in the LLM cache and, if enabled, the semantic cache"""
+        await self.llm_cache.set(key, response_dict)
+        if ai_settings.semantic_cache:
+            await self.semantic_cache.add(key, job_description)
+
+    def _placeholder_extraction(self, job_description: str, post_lang: str) -> Optional[Tuple[Dict, Dict, Dict, VisaSupport]]:
+        """Get an empty extraction for job descriptions too short to extract anything from, otherwise None"""
+        if len(job_description.strip()) >= ai_settings.min_extract_chars:
+            return None
+        logger.warning(f"Job description has fewer than {ai_settings.min_extract_chars} characters, skipping extraction")
+        skills_dict = self.validate_and_clean_skills_dict({})
+        self.process_language_requirements(post_lang, skills_dict)
+        exp_dict = {"years": 0, "months": 0, "is_minimum": True, "context": ""}
+        return skills_dict, exp_dict, {"score": 0, "reasons": []}, VisaSupport.UNKNOWN
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=10),
-        retry=retry_if_exception_type((ClaudeResponseError, ServiceUnavailableError, OverloadedError))
+        wait=CLAUDE_RETRY_WAIT,
+        retry=retry_if_exception_type((ServiceUnavailableError, OverloadedError, RateLimitError))
     )
     async def batch_extract_job_info(self, job_description: str, post_lang: str) -> Tuple[Dict, Dict, Dict, VisaSupport]:
         """
@@ -312,35 +486,20 @@ class ClaudeService(ClaudeServiceProtocol):
             - red_flags_dict: Dictionary with red flags score and reasons
             - visa_support: Visa support status string
         """
+        placeholder = self._placeholder_extraction(job_description, post_lang)
+        if placeholder is not None:
+            return placeholder
+
         try:
-            async with self.api_semaphore:
-                # Combine both prompts into a single request
-                prompt = create_extraction_prompt(job_description)
-                async with self.anthropic.messages.stream(
-                        model=global_constants.claude_4_0_sonnet_model,
-                        max_tokens=ai_settings.claude_max_tokens,
-                        **self.config_thinking_temperature(high_temperature=False),
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": prompt,
-                                        "cache_control": {"type": "ephemeral"}
-                                    }
-                                ]
-                            }
-                        ],
-                        system=[
-                            {
-                                "type": "text",
-                                "text": claude_system_messages["extract_requirements"],
-                                "cache_control": {"type": "ephemeral", "ttl": "1h"}
-                            }
-                        ],  # Use unified extraction system message
-                ) as stream:
-                    message = await stream.get_final_message()
+            # The same job description may have been extracted in an earlier run
+            key, params = self._extraction_request(job_description)
+            cached = await self._get_cached_extraction(key, job_description, post_lang)
+            if cached is not None:
+                return cached
+
+            messages = params.pop("messages")
+            for attempt in range(EXTRACTION_ATTEMPTS):
+                message = await self._get_message(messages=messages, **params)
 
                 # Extract and validate JSON
                 if ai_settings.claude_thinking:
@@ -348,29 +507,34 @@ class ClaudeService(ClaudeServiceProtocol):
                 else:
                     response_text = message.content[0].text
 
-                # Parse JSON and validate structure
-                response_dict = self.extract_json_from_response(response_text)
-                print(response_dict)
-
-                # Extract and validate skills part
-                skills_dict = self.validate_and_clean_skills_dict(response_dict.get('skills', {}))
-
-                # Process language requirements from job description
-                self.process_language_requirements(post_lang, skills_dict)
-
-                # Verify we got some data
-                if not any(skills_dict.values()):
-                    raise ClaudeResponseError("No skills extracted")
-
-                # Extract and validate experience part
-                exp_dict = response_dict.get('experience', {})
-                self.validate_experience_dict(exp_dict)
-
-                # Extract and validate new fields
-                red_flags_dict = self.validate_red_flags(response_dict.get('red_flags', {}))
-                visa_support = self.validate_visa_support(response_dict.get('supports_visa', 'UNKNOWN'))
+                try:
+                    # Parse JSON and validate structure
+                    response_dict = self.extract_json_from_response(response_text)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Claude extraction response: {response_dict}")
+                    result = self.validate_extraction(response_dict, post_lang)
+                except ClaudeResponseError as e:
+                    if attempt == EXTRACTION_ATTEMPTS - 1:
+                        raise
+                    # Let Claude fix its answer instead of generating a new one from scratch
+                    logger.warning(f"Invalid extraction response, asking Claude to correct it: {str(e)}")
+                    messages = messages + [
+                        {"role": "assistant", "content": message.content},
+                        {
+                            "role": "user",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": f"Your previous JSON had an error: {e}. Return only the corrected JSON, with the same schema."
+                                }
+                            ]
+                        }
+                    ]
+                    continue
 
-                return skills_dict, exp_dict, red_flags_dict, visa_support
+                # Only responses that passed validation are cached
+                await self._cache_extraction(key, job_description, response_dict)
+                return result
 
         except ServiceUnavailableError as e:
             logger.warning(f"Claude service unavailable: {str(e)}")
@@ -379,11 +543,110 @@ class ClaudeService(ClaudeServiceProtocol):
             logger.warning(f"Claude overloaded: {str(e)}")
             raise  # Let retry handle it
         except Exception as e:
-            if isinstance(e, ClaudeResponseError):
-                raise  # Let retry handle these
             logger.error(f"Error in batch extraction: {str(e)}")
             raise
 
+    async def _wait_for_batch(self, batch_id: str) -> bool:
+        """Poll a message batch until it has ended.
+
+        Batches can take up to a day, so a batch still running after BATCH_MAX_WAIT seconds is cancelled.
+
+        Returns:
+            Whether the batch ended in time and its results can be read
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + BATCH_MAX_WAIT
+        while loop.time() < deadline:
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            batch = await self.anthropic.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return True
+        logger.warning(f"Extraction batch {batch_id} did not end within {BATCH_MAX_WAIT}s, cancelling it")
+        await self.anthropic.messages.batches.cancel(batch_id)
+        return False
+
+    async def batch_extract_many(self, jobs: List[Tuple[str, str]]) -> List[Tuple[Dict, Dict, Dict, VisaSupport]]:
+        """Extract job information for several jobs at once through the Message Batches API.
+
+        Batches are billed at half price and don't count against the per-minute rate limits, but may take
+        minutes to finish, so this is meant for background processing of many jobs rather than the UI.
+        Jobs whose batch result is missing or invalid, or whose batch didn't end within BATCH_MAX_WAIT, are
+        extracted again with batch_extract_job_info.
+
+        Args:
+            jobs: List of (job description, post language) tuples
+
+        Returns:
+            The extracted information of each job in the same order, see batch_extract_job_info
+        """
+        results: List[Optional[Tuple[Dict, Dict, Dict, VisaSupport]]] = [None] * len(jobs)
+        keys: Dict[str, str] = {}
+        requests = []
+        for i, (job_description, post_lang) in enumerate(jobs):
+            results[i] = self._placeholder_extraction(job_description, post_lang)
+            if results[i] is not None:
+                continue
+            key, params = self._extraction_request(job_description)
+            results[i] = await self._get_cached_extraction(key, job_description, post_lang)
+            if results[i] is None:
+                keys[str(i)] = key
+                requests.append({"custom_id": str(i), "params": params})
+
+        if len(requests) > 1:
+            batch = await self.anthropic.messages.batches.create(requests=requests)
+            logger.info(f"Submitted extraction batch {batch.id} with {len(requests)} jobs")
+            if await self._wait_for_batch(batch.id):
+                async for entry in await self.anthropic.messages.batches.results(batch.id):
+                    i = int(entry.custom_id)
+                    if entry.result.type != "succeeded":
+                        logger.warning(f"Batch extraction of job {i} did not succeed: {entry.result.type}")
+                        continue
+                    content = entry.result.message.content
+                    response_text = content[1].text if ai_settings.claude_thinking else content[0].text
+                    try:
+                        response_dict = self.extract_json_from_response(response_text)
+                        results[i] = self.validate_extraction(response_dict, jobs[i][1])
+                    except ClaudeResponseError as e:
+                        logger.warning(f"Invalid batch extraction response for job {i}: {str(e)}")
+                        continue
+                    await self._cache_extraction(keys[entry.custom_id], jobs[i][0], response_dict)
+
+        # Single jobs aren't worth a batch, these and failed batch entries are extracted one by one
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = await self.batch_extract_job_info(*jobs[i])
+        return results
+
+    def _get_original_skills(self) -> Dict[str, str]:
+        """Map the lowercase skills of the resume to their original capitalization.
+
+        Rebuilt only when the resume is reloaded, which replaces resume.skills. The cache holds a reference to
+        the skills it was built from, so the identity check can't be fooled by a reused id.
+        """
+        skills = resume.skills
+        if self._original_skills_cache is None or self._original_skills_cache[0] is not skills:
+            original_skills = {str(skill).strip().lower(): str(skill).strip()
+                               for category in skills.values()
+                               for skill in category}
+            self._original_skills_cache = (skills, original_skills)
+        return self._original_skills_cache[1]
+
+    def _get_resume_with_ids(self) -> ResumeModel:
+        """Get the resume with IDs on its experience and project entries, which Claude refers to them by.
+
+        Rebuilt only when the resume is reloaded, the same way as _get_original_skills. The resume is
+        never modified, so the same copy is shared by all customizations.
+        """
+        current = resume.get()
+        if self._resume_with_ids_cache is None or self._resume_with_ids_cache[0] is not current:
+            resume_with_ids = replace(
+                current,
+                experience=[replace(exp, exp_id=str(i)) for i, exp in enumerate(current.experience)],
+                projects=[replace(proj, proj_id=str(i)) for i, proj in enumerate(current.projects)]
+            )
+            self._resume_with_ids_cache = (current, resume_with_ids)
+        return self._resume_with_ids_cache[1]
+
     def validate_resume_skills(self, skills_json: Dict) -> Dict:
         """Validate and clean the skills JSON to match resume config structure.
         
@@ -398,9 +661,7 @@ class ClaudeService(ClaudeServiceProtocol):
             return {"Recommended Skills": []}
         
         # Get original skills as a case-insensitive set for reference
-        original_skills = {str(skill).strip().lower(): str(skill).strip() 
-                          for category in resume.skills.values() 
-                          for skill in category}
+        original_skills = self._get_original_skills()
         
         clean_dict = {}
         
@@ -433,10 +694,38 @@ class ClaudeService(ClaudeServiceProtocol):
                 
         return clean_dict
 
+    async def _resume_turn(self, messages: List[Dict], prompt: str) -> str:
+        """Ask one follow-up question of the resume conversation and return Claude's answer.
+
+        The conversation in messages is not modified, so several turns can branch off it concurrently.
+        The initial context already carries the cache breakpoint, so every branch reads it from the prompt cache.
+        The prompt itself is not cached, no other request continues from it.
+        """
+        branch = messages + [{
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": prompt
+                }
+            ]
+        }]
+        response = await self._get_message(
+            model=global_constants.claude_4_0_sonnet_model,
+            max_tokens=ai_settings.claude_max_tokens,
+            **self.config_thinking_temperature(high_temperature=True),
+            messages=branch,
+            system=claude_system_blocks["customize_resume"],
+        )
+
+        if ai_settings.claude_thinking:
+            return response.content[1].text
+        return response.content[0].text
+
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=10),
-        retry=retry_if_exception_type((ClaudeResponseError, ServiceUnavailableError, OverloadedError))
+        wait=CLAUDE_RETRY_WAIT,
+        retry=retry_if_exception_type((ClaudeResponseError, ServiceUnavailableError, OverloadedError, RateLimitError))
     )
     async def customize_resume(self, job_info: JobDetailedInfo, job_cache_service: JobCacheService) -> Tuple[ResumeModel, ResumeModel]:
         """Customize resume based on job requirements using Claude.
@@ -446,6 +735,7 @@ class ClaudeService(ClaudeServiceProtocol):
         2. Optimize skills section
         3. Tailor experience entries
         4. Adapt projects section
+        Steps 2-4 only depend on the initial context and run concurrently.
         
         Args:
             job_info: Detailed job information including description and requirements
@@ -455,303 +745,149 @@ class ClaudeService(ClaudeServiceProtocol):
             Tuple[ResumeModel, ResumeModel]: A tuple containing (original_resume, customized_resume)
         """
         try:
-            async with self.api_semaphore:
             # Check cache first
-                cached_resume = await job_cache_service.get_customized_resume(job_info.jobId)
-                if cached_resume:
-                    logger.info(f"Using cached customized resume for job {job_info.jobId}")
-                    # Return both original and cached resume
-                    return resume, cached_resume
-
-                # Get cached analysis results
-                cached_analysis = await job_cache_service.get_job_analysis(job_info.jobId)
-                if not cached_analysis:
-                    logger.warning(f"No cached analysis found for job {job_info.jobId}, performing new analysis")
-                    post_lang, _ = HybridLanguageDetector().detect_language(job_info.description)
-                    post_lang = post_lang if post_lang else 'ENGLISH'
-                    skills_dict, exp_dict, red_flags_dict, visa_support = await self.batch_extract_job_info(job_info.description, post_lang)
-                    analysis_info = JobAnalysisInfo(
-                        skills_dict=skills_dict,
-                        experience_dict=exp_dict,
-                        red_flags_dict=red_flags_dict,
-                        visa_support=visa_support,
-                        post_language=post_lang
-                    )
-                    await job_cache_service.set_job_analysis(job_info.jobId, analysis_info)
-                else:
-                    logger.info(f"Using cached analysis for job {job_info.jobId}")
-                    skills_dict = cached_analysis.skills_dict
-                    exp_dict = cached_analysis.experience_dict
-
-                # Prepare resume data with IDs
-                experiences_with_ids = []
-                for i, exp in enumerate(resume.experience):
-                    # Create a copy of the experience
-                    exp_copy = ExperienceEntry(
-                        title=exp.title,
-                        organization=exp.organization,
-                        start=exp.start,
-                        end=exp.end,
-                        location=exp.location,
-                        details=exp.details
-                    )
-                    # Set the ID using the property
-                    exp_copy.set_id(str(i))
-                    experiences_with_ids.append(exp_copy)
-
-                projects_with_ids = []
-                for i, proj in enumerate(resume.projects):
-                    # Create a copy of the project
-                    proj_copy = ProjectEntry(
-                        name=proj.name,
-                        details=proj.details
-                    )
-                    # Set the ID using the property
-                    proj_copy.set_id(str(i))
-                    projects_with_ids.append(proj_copy)
-
-                # Create resume data with typed objects
-                resume_data = {
-                    "skills": resume.skills,
-                    "experience": experiences_with_ids,
-                    "projects": projects_with_ids
-                }
+            cached_resume = await job_cache_service.get_customized_resume(job_info.jobId)
+            if cached_resume:
+                logger.info(f"Using cached customized resume for job {job_info.jobId}")
+                # Return both original and cached resume
+                return resume, cached_resume
+
+            # Get cached analysis results
+            cached_analysis = await job_cache_service.get_job_analysis(job_info.jobId)
+            if not cached_analysis:
+                logger.warning(f"No cached analysis found for job {job_info.jobId}, performing new analysis")
+                post_lang, _ = HybridLanguageDetector().detect_language(job_info.description)
+                post_lang = post_lang if post_lang else 'ENGLISH'
+                skills_dict, exp_dict, red_flags_dict, visa_support = await self.batch_extract_job_info(job_info.description, post_lang)
+                analysis_info = JobAnalysisInfo(
+                    skills_dict=skills_dict,
+                    experience_dict=exp_dict,
+                    red_flags_dict=red_flags_dict,
+                    visa_support=visa_support,
+                    post_language=post_lang
+                )
+                await job_cache_service.set_job_analysis(job_info.jobId, analysis_info)
+            else:
+                logger.info(f"Using cached analysis for job {job_info.jobId}")
+                skills_dict = cached_analysis.skills_dict
+                exp_dict = cached_analysis.experience_dict
+
+            # Prepare resume data with IDs
+            resume_with_ids = self._get_resume_with_ids()
+
+            # Create resume data with typed objects
+            resume_data = {
+                "skills": resume_with_ids.skills,
+                "experience": resume_with_ids.experience,
+                "projects": resume_with_ids.projects
+            }
 
-                # Create previous analysis dict
-                job_post_analysis = {
-                    "skills": skills_dict,
-                    "experience": exp_dict
-                }
+            # Create previous analysis dict
+            job_post_analysis = {
+                "skills": skills_dict,
+                "experience": exp_dict
+            }
 
-                # Get cultural context based on job location/company
-                cultural_context = get_cultural_context(job_info)
-                
-                try:
-                    # Initialize conversation with context
-                    logger.info("\n=== Starting Conversation with Claude ===")
-                    messages = [
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": ai_prompts.claude_resume_init.format(
-                                        job_description=job_info.description,
-                                        resume_data=resume_data,
-                                        job_post_analysis=json.dumps(job_post_analysis, indent=2),
-                                        cultural_context=cultural_context
-                                    ),
-                                    "cache_control": {"type": "ephemeral"}
-                                }
-                            ]
-                        }
-                    ]
-                    
-                    # Log initial prompt
-                    logger.info("\nInitial Prompt:")
-                    logger.info(messages[0]["content"])
-                    
-                    # Get initial understanding confirmation
-                    async with self.anthropic.messages.stream(
-                            model=global_constants.claude_4_0_sonnet_model,
-                            max_tokens=ai_settings.claude_max_tokens,
-                            **self.config_thinking_temperature(high_temperature=True),
-                            messages=messages,
-                            system=[
-                                {
-                                    "type": "text",
-                                    "text": claude_system_messages["customize_resume"],
-                                    "cache_control": {"type": "ephemeral", "ttl": "1h"}
-                                }
-                            ],
-                    ) as stream:
-                        response = await stream.get_final_message()
-
-                    logger.info("\nClaude's Initial Response:")
-                    if ai_settings.claude_thinking:
-                        logger.info(response.content[1].text)
-                    else:
-                        logger.info(response.content[0].text)
-                    messages.append({
-                        "role": "assistant",
-                        "content": response.content
-                    })
-                    
-                    # Optimize skills section
-                    logger.info("\n=== Skills Section Optimization ===")
-                    # Remove previous cache checkpoints
-                    for message in messages:
-                        if message.get('content', None):
-                            for content in message['content']:
-                                if isinstance(content,dict) and 'content' in content:
-                                    del content['cache_control']
-                    messages.append({
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": ai_prompts.claude_resume_skills,
-                                "cache_control": {"type": "ephemeral"}
-                            }
-                        ]
-                    })
-
-                    async with self.anthropic.messages.stream(
-                            model=global_constants.claude_4_0_sonnet_model,
-                            max_tokens=ai_settings.claude_max_tokens,
-                            **self.config_thinking_temperature(high_temperature=True),
-                            messages=messages,
-                            system=[
-                                {
-                                    "type": "text",
-                                    "text": claude_system_messages["customize_resume"],
-                                }
-                            ],
-                    ) as stream:
-                        response = await stream.get_final_message()
-
-                    if ai_settings.claude_thinking:
-                        skills_response = response.content[1].text
-                    else:
-                        skills_response = response.content[0].text
-                    logger.info("\nClaude's Skills Response:")
-                    logger.info(skills_response)
-                    skills_json = self.extract_json_from_response(skills_response)
-                    skills_json = self.validate_resume_skills(skills_json)
-                    logger.info("\nValidated Skills JSON:")
-                    logger.info(json.dumps(skills_json, indent=2))
-                    messages.append({
-                        "role": "assistant",
-                        "content": response.content
-                    })
-                    
-                    # Tailor experience section
-                    logger.info("\n=== Experience Section Customization ===")
-                    # Remove previous cache checkpoints
-                    for message in messages:
-                        if message.get('content', None):
-                            for content in message['content']:
-                                if isinstance(content, dict) and 'content' in content:
-                                    del content['cache_control']
-                    messages.append({
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": ai_prompts.claude_resume_experience,
-                                "cache_control": {"type": "ephemeral"}
-                            }
-                        ]
-                    })
-                    async with self.anthropic.messages.stream(
-                            model=global_constants.claude_4_0_sonnet_model,
-                            max_tokens=ai_settings.claude_max_tokens,
-                            **self.config_thinking_temperature(high_temperature=True),
-                            messages=messages,
-                            system=[
-                                {
-                                    "type": "text",
-                                    "text": claude_system_messages["customize_resume"],
-                                }
-                            ],
-                    ) as stream:
-                        response = await stream.get_final_message()
-
-                    if ai_settings.claude_thinking:
-                        experience_response = response.content[1].text
-                    else:
-                        experience_response = response.content[0].text
-                    logger.info("\nClaude's Experience Response:")
-                    logger.info(experience_response)
-                    experience_json = self.extract_json_from_response(experience_response)
-                    experience_json = self.validate_resume_experience(experience_json, resume_data["experience"])
-                    logger.info("\nValidated Experience JSON:")
-                    logger.info(json.dumps(experience_json, cls=DataClassJSONEncoder, indent=2))
-                    messages.append({
-                        "role": "assistant",
-                        "content": response.content
-                    })
-                    
-                    # Adapt projects section
-                    logger.info("\n=== Projects Section Adaptation ===")
-                    # Remove previous cache checkpoints
-                    for message in messages:
-                        if message.get('content', None):
-                            for content in message['content']:
-                                if isinstance(content, dict) and 'content' in content:
-                                    del content['cache_control']
-                    messages.append({
+            # Get cultural context based on job location/company
+            cultural_context = get_cultural_context(job_info)
+            
+            try:
+                # Initialize conversation with context
+                logger.info("\n=== Starting Conversation with Claude ===")
+                messages = [
+                    {
                         "role": "user",
                         "content": [
                             {
                                 "type": "text",
-                                "text": ai_prompts.claude_resume_projects,
+                                "text": ai_prompts.claude_resume_init.format(
+                                    job_description=job_info.description,
+                                    resume_data=resume_data,
+                                    job_post_analysis=dumps_json(job_post_analysis, indent=True),
+                                    cultural_context=cultural_context
+                                ),
                                 "cache_control": {"type": "ephemeral"}
                             }
                         ]
-                    })
-                    async with self.anthropic.messages.stream(
-                            model=global_constants.claude_4_0_sonnet_model,
-                            max_tokens=ai_settings.claude_max_tokens,
-                            **self.config_thinking_temperature(high_temperature=True),
-                            messages=messages,
-                            system=[
-                                {
-                                    "type": "text",
-                                    "text": claude_system_messages["customize_resume"],
-                                }
-                            ],
-                    ) as stream:
-                        response = await stream.get_final_message()
-
-                    if ai_settings.claude_thinking:
-                        projects_response = response.content[1].text
-                    else:
-                        projects_response = response.content[0].text
-                    logger.info("\nClaude's Projects Response:")
-                    logger.info(projects_response)
-                    projects_json = self.extract_json_from_response(projects_response)
-                    projects_json = self.validate_resume_projects(projects_json, resume_data["projects"])
-                    logger.info("\nValidated Projects JSON:")
-                    logger.info(json.dumps(projects_json, cls=DataClassJSONEncoder, indent=2))
-
-                    # Create ResumeModel directly
-                    customized = ResumeModel(
-                        website=resume.website,
-                        linkedIn=resume.linkedIn,
-                        skills=skills_json,
-                        experience=experience_json,
-                        projects=projects_json,
-                        educations=resume.educations,
-                        did_masters=resume.did_masters,
-                        highest_degree=resume.highest_degree,
-                        cover_letter_template=resume.cover_letter_template
-                    )
-                    
-                    logger.info("\n=== Resume Customization Complete ===")
-                    logger.info("\nFinal Customized Resume:")
-                    logger.info(json.dumps(customized, cls=DataClassJSONEncoder, indent=2))
-
-                    # Reconstruct ResumeModel from resume_data for type safety
-                    original_resume_data = ResumeModel(
-                        website=resume.website,
-                        linkedIn=resume.linkedIn,
-                        skills=resume.skills,
-                        experience=experiences_with_ids,
-                        projects=projects_with_ids,
-                        educations=resume.educations,
-                        did_masters=resume.did_masters,
-                        highest_degree=resume.highest_degree,
-                        cover_letter_template=resume.cover_letter_template
-                    )
-                        
-                    # Cache the customized resume before returning
-                    await job_cache_service.set_customized_resume(job_info.jobId, customized)
-                    return original_resume_data, customized
-                    
-                except Exception as e:
-                    logger.error(f"Error customizing resume: {str(e)}")
-                    raise
+                    }
+                ]
+                
+                # Log initial prompt
+                logger.info("\nInitial Prompt:")
+                logger.info(messages[0]["content"])
+                
+                # Get initial understanding confirmation
+                response = await self._get_message(
+                    model=global_constants.claude_4_0_sonnet_model,
+                    max_tokens=ai_settings.claude_max_tokens,
+                    **self.config_thinking_temperature(high_temperature=True),
+                    messages=messages,
+                    system=claude_system_blocks["customize_resume"],
+                )
+
+                logger.info("\nClaude's Initial Response:")
+                if ai_settings.claude_thinking:
+                    logger.info(response.content[1].text)
+                else:
+                    logger.info(response.content[0].text)
+                messages.append({
+                    "role": "assistant",
+                    "content": response.content
+                })
+                
+                # Skills, experience and projects each only build on the initial context, so the three
+                # turns branch off the same conversation and run concurrently
+                logger.info("\n=== Skills, Experience and Projects Customization ===")
+                skills_response, experience_response, projects_response = await asyncio.gather(
+                    self._resume_turn(messages, ai_prompts.claude_resume_skills),
+                    self._resume_turn(messages, ai_prompts.claude_resume_experience),
+                    self._resume_turn(messages, ai_prompts.claude_resume_projects),
+                )
+
+                logger.info("\nClaude's Skills Response:")
+                logger.info(skills_response)
+                skills_json = self.extract_json_from_response(skills_response)
+                skills_json = self.validate_resume_skills(skills_json)
+                logger.info("\nValidated Skills JSON:")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(dumps_json(skills_json, indent=True))
+
+                logger.info("\nClaude's Experience Response:")
+                logger.info(experience_response)
+                experience_json = self.extract_json_from_response(experience_response)
+                experience_json = self.validate_resume_experience(experience_json, resume_data["experience"])
+                logger.info("\nValidated Experience JSON:")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(dumps_json(experience_json, indent=True))
+
+                logger.info("\nClaude's Projects Response:")
+                logger.info(projects_response)
+                projects_json = self.extract_json_from_response(projects_response)
+                projects_json = self.validate_resume_projects(projects_json, resume_data["projects"])
+                logger.info("\nValidated Projects JSON:")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(dumps_json(projects_json, indent=True))
+
+                # Copy the resume with the customized sections, the other fields are used as they are
+                customized = replace(
+                    resume_with_ids,
+                    skills=skills_json,
+                    experience=experience_json,
+                    projects=projects_json
+                )
+                
+                logger.info("\n=== Resume Customization Complete ===")
+                logger.info("\nFinal Customized Resume:")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(dumps_json(customized, indent=True))
+
+                # Cache the customized resume before returning
+                await job_cache_service.set_customized_resume(job_info.jobId, customized)
+                return resume_with_ids, customized
+                
+            except Exception as e:
+                logger.error(f"Error customizing resume: {str(e)}")
+                raise
 
         except Exception as e:
             logger.error(f"Error customizing resume: {str(e)}")
@@ -789,12 +925,11 @@ class ClaudeService(ClaudeServiceProtocol):
                     continue
                 
                 exp_id = exp.get("exp_id")
-                if not exp_id or exp_id not in exp_map:
+                original = exp_map.get(exp_id)
+                if original is None:
                     logger.error(f"Invalid or missing exp_id: {exp_id}")
                     continue
                 
-                original = exp_map[exp_id]
-                
                 # Validate achievements
                 achievements = exp.get("achievements", [])
                 if not isinstance(achievements, list):
@@ -806,32 +941,23 @@ class ClaudeService(ClaudeServiceProtocol):
                     if not isinstance(achievement, dict):
                         continue
                     
-                    if not all(k in achievement for k in ["text", "is_critical", "domain", "relevance_score"]):
+                    if not ACHIEVEMENT_FIELDS <= achievement.keys():
                         logger.error(f"Missing required fields in achievement: {achievement}")
                         continue
                     
                     # Type validation and normalization
-                    if not isinstance(achievement["text"], str):
+                    text = achievement["text"]
+                    if not isinstance(text, str):
                         continue
                     
-                    clean_achievements.append(achievement["text"].strip())
+                    clean_achievements.append(text.strip())
                 
                 # Warn about minimum achievements
                 if len(clean_achievements) < 2:
                     logger.warning(f"Less than 2 achievements for experience: {exp_id}")
                 
                 # Create typed ExperienceEntry using original data + cleaned achievements
-                validated_exp = ExperienceEntry(
-                    title=original.title,
-                    organization=original.organization,
-                    start=original.start,
-                    end=original.end,
-                    location=original.location,
-                    details=clean_achievements,
-                )
-                
-                # Copy over the ID from original
-                validated_exp.set_id(original.exp_id)
+                validated_exp = replace(original, details=clean_achievements)
                 
                 validated_experiences.append(validated_exp)
                 
@@ -872,12 +998,11 @@ class ClaudeService(ClaudeServiceProtocol):
                     continue
                 
                 proj_id = proj.get("proj_id")
-                if not proj_id or proj_id not in proj_map:
+                original = proj_map.get(proj_id)
+                if original is None:
                     logger.error(f"Invalid or missing proj_id: {proj_id}")
                     continue
                 
-                original = proj_map[proj_id]
-                
                 # Validate achievements/details
                 details = proj.get("achievements", [])
                 if not isinstance(details, list):
@@ -889,23 +1014,18 @@ class ClaudeService(ClaudeServiceProtocol):
                     if not isinstance(detail, dict):
                         continue
                     
-                    if not all(k in detail for k in ["text", "domain"]):
+                    if not PROJECT_DETAIL_FIELDS <= detail.keys():
                         logger.error(f"Missing required fields in detail: {detail}")
                         continue
                     
-                    if not isinstance(detail["text"], str):
+                    text = detail["text"]
+                    if not isinstance(text, str):
                         continue
                     
-                    clean_details.append(detail["text"].strip())
+                    clean_details.append(text.strip())
                 
                 # Create typed ProjectEntry using original data + cleaned details
-                validated_proj = ProjectEntry(
-                    name=original.name,
-                    details=clean_details
-                )
-
-                # Copy over the ID from original
-                validated_proj.set_id(original.proj_id)
+                validated_proj = replace(original, details=clean_details)
                 
                 validated_projects.append(validated_proj)
                 
@@ -917,58 +1037,49 @@ class ClaudeService(ClaudeServiceProtocol):
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=10),
-        retry=retry_if_exception_type((ClaudeResponseError, ServiceUnavailableError, OverloadedError))
+        wait=CLAUDE_RETRY_WAIT,
+        retry=retry_if_exception_type((ClaudeResponseError, ServiceUnavailableError, OverloadedError, RateLimitError))
     )
     async def customize_cover_letter(self, resume_latex: str, job_info: JobDetailedInfo, job_cache_service: JobCacheService) -> str:
         """Customize cover letter using Claude"""
         try:
-            async with self.api_semaphore:
-                # Format prompt with resume and job description
-                current_date = datetime.now().strftime("%B %Y")
-                prompt = ai_prompts.claude_cover_letter.format(
-                    resume_content=resume_latex,
-                    job_description=job_info.description,
-                    current_date=current_date,
-                    cover_letter_template=resume.cover_letter_template
-                )
+            # Format prompt with resume and job description
+            current_date = datetime.now().strftime("%B %Y")
+            prompt = ai_prompts.claude_cover_letter.format(
+                resume_content=resume_latex,
+                job_description=job_info.description,
+                current_date=current_date,
+                cover_letter_template=resume.cover_letter_template
+            )
 
-                async with self.anthropic.messages.stream(
-                        model=global_constants.claude_4_0_sonnet_model,
-                        max_tokens=ai_settings.claude_max_tokens,
-                        **self.config_thinking_temperature(high_temperature=True),
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": prompt,
-                                        "cache_control": {"type": "ephemeral"}
-                                    }
-                                ]
-                            }
-                        ],
-                        system=[
+            message = await self._get_message(
+                model=global_constants.claude_4_0_sonnet_model,
+                max_tokens=ai_settings.claude_max_tokens,
+                **self.config_thinking_temperature(high_temperature=True),
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
                             {
                                 "type": "text",
-                                "text": claude_system_messages["generate_cover_letter"],
-                                "cache_control": {"type": "ephemeral", "ttl": "1h"}
+                                "text": prompt
                             }
-                        ],
-                ) as stream:
-                    message = await stream.get_final_message()
+                        ]
+                    }
+                ],
+                system=claude_system_blocks["generate_cover_letter"],
+            )
 
-                if ai_settings.claude_thinking:
-                    cover_letter = message.content[1].text.strip()
-                else:
-                    cover_letter = message.content[0].text.strip()
-                if not cover_letter:
-                    raise ClaudeResponseError("Empty response received")
+            if ai_settings.claude_thinking:
+                cover_letter = message.content[1].text.strip()
+            else:
+                cover_letter = message.content[0].text.strip()
+            if not cover_letter:
+                raise ClaudeResponseError("Empty response received")
 
-                await job_cache_service.set_cover_letter(job_info.jobId, cover_letter)
-                logger.info("Successfully generated cover letter")
-                return cover_letter
+            await job_cache_service.set_cover_letter(job_info.jobId, cover_letter)
+            logger.info("Successfully generated cover letter")
+            return cover_letter
 
         except Exception as e:
             logger.error(f"Error generating cover letter: {str(e)}")
@@ -976,7 +1087,8 @@ class ClaudeService(ClaudeServiceProtocol):
 
     def on_secrets_changed(self, new_secrets: DynamicConfig):
         logger.info(f"Secrets changes detected, re-initializing Anthropics SDK.")
-        self.anthropic = AsyncAnthropic(api_key=new_secrets.claude_api_key, http_client=DefaultAioHttpClient())
+        # The copy shares the HTTP client, so pooled connections survive the key change
+        self.anthropic = self.anthropic.with_options(api_key=new_secrets.claude_api_key)
 
     def cleanup(self):
         # Remove listener
@@ -0,0 +1,72 @@
+"""
+On-disk cache of parsed Claude responses, keyed by a hash of everything that was sent.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import orjson
+import platformdirs
+
+from vettavista_backend.config.global_constants import APP_NAME
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(*parts: str) -> str:
+    """Hash the parts of a request into a cache key.
+
+    Each part is length-prefixed, so different splits of the same text never produce the same key.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode()
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class LLMCache:
+    """Stores one JSON file per key in a tree sharded by the first two characters of the key"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or Path(platformdirs.user_cache_dir(APP_NAME, appauthor=False)) / "llm_cache"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    async def get(self, key: str, ttl_days: float) -> Optional[Dict]:
+        """Get the cached value, or None if there is none or it is older than ttl_days"""
+        return await asyncio.to_thread(self._read, self._path(key), ttl_days * 86400)
+
+    async def set(self, key: str, value: Dict) -> None:
+        """Store the value, failures are logged and otherwise ignored"""
+        await asyncio.to_thread(self._write, self._path(key), value)
+
+    @staticmethod
+    def _read(path: Path, max_age: float) -> Optional[Dict]:
+        try:
+            if time.time() - path.stat().st_mtime > max_age:
+                return None
+            return orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {path}: {e}")
+            return None
+
+    @staticmethod
+    def _write(path: Path, value: Dict) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(orjson.dumps(value))
+            os.replace(tmp, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write LLM cache entry {path}: {e}")
+            tmp.unlink(missing_ok=True)
@@ -1,85 +1,106 @@
+from bisect import bisect_right
+from typing import Any, Dict, Tuple
+
 from vettavista_backend.config import ai_settings, ai_prompts
 from vettavista_backend.modules.models.services import JobDetailedInfo
 from vettavista_backend.modules.utils import parse_employee_count
 
 
 # Claude Prompts
-# Combine all rules and format with job description
-def create_extraction_prompt(job_description: str) -> str:
-    return (f"{ai_prompts.claude_extraction_prompt_base}\n"
-            f"{ai_prompts.claude_experience_rules}\n"
-            f"{ai_prompts.claude_skills_rules}\n"
-            f"{ai_prompts.claude_visa_rules}\n"
-            f"{ai_prompts.claude_scoring_rules}\n\n"
-            f"INPUT:\n{job_description}")
+# The combined extraction rules with the prompts model they were built from, rebuilt when the prompts are reloaded
+_extraction_rules_cache: Tuple[Any, str] | None = None
 
-def get_cultural_context(job_info: JobDetailedInfo) -> str:
-    """Get cultural context based on job location and company.
+def _extraction_rules() -> str:
+    global _extraction_rules_cache
+    prompts = ai_prompts.get()
+    if _extraction_rules_cache is None or _extraction_rules_cache[0] is not prompts:
+        rules = (f"{prompts.claude_extraction_prompt_base}\n"
+                 f"{prompts.claude_experience_rules}\n"
+                 f"{prompts.claude_skills_rules}\n"
+                 f"{prompts.claude_visa_rules}\n"
+                 f"{prompts.claude_scoring_rules}\n\n")
+        _extraction_rules_cache = (prompts, rules)
+    return _extraction_rules_cache[1]
 
-    Args:
-        job_info: Job information including location and company size
+# Combine all rules and format with job description
+def create_extraction_prompt(job_description: str) -> Tuple[str, str]:
+    """Get the extraction prompt as the rules, which are the same for every job, and the job specific input"""
+    return _extraction_rules(), f"INPUT:\n{job_description}"
 
-    Returns:
-        Formatted cultural context string based on location and company size
-    """
-    # Extract country from location (usually last part after comma)
-    country = job_info.location.split(',')[-1].strip()
+# Lower bounds of the company size ranges and their company types, a company belongs to the last range it reaches
+_COMPANY_SIZE_BOUNDS = (1, 51, 201, 1001, 5001)
+_COMPANY_TYPES = ("Early-stage Startup", "Growing Startup", "Mid-size Company", "Large Company", "Enterprise")
+
+# Default context for unknown countries
+_DEFAULT_CULTURAL_CONTEXT = {
+    "language": "English",
+    "work_culture": [
+        "Professional environment",
+        "Team collaboration",
+        "Clear communication",
+        "Result-oriented approach"
+    ],
+    "business_practices": [
+        "International standards",
+        "Quality focus",
+        "Customer orientation",
+        "Professional development"
+    ]
+}
 
-    # Parse company size
-    size_ranges = {
-        (1, 50): "Early-stage Startup",
-        (51, 200): "Growing Startup",
-        (201, 1000): "Mid-size Company",
-        (1001, 5000): "Large Company",
-        (5001, float('inf')): "Enterprise"
-    }
+# Formatted cultural contexts by (country, company size) with the prompts model they were built from,
+# cleared when the prompts are reloaded. Both keys come from a small set of values, the size limit is a safeguard.
+_CULTURAL_CONTEXT_CACHE_SIZE = 512
+_cultural_context_cache: Tuple[Any, Dict[Tuple[str, str], str]] | None = None
 
+def _format_cultural_context(prompts: Any, country: str, company_size: str) -> str:
     # Use utility function to parse employee count
-    min_employees, _ = parse_employee_count(job_info.companySize)
+    min_employees, _ = parse_employee_count(company_size)
     employee_count = min_employees  # Use lower bound for company type determination
 
-    company_type = "Unknown Size"
-    for (min_size, max_size), type_name in size_ranges.items():
-        if min_size <= employee_count <= max_size:
-            company_type = type_name
-            break
-
-    # Default context for unknown countries
-    default_context = {
-        "language": "English",
-        "work_culture": [
-            "Professional environment",
-            "Team collaboration",
-            "Clear communication",
-            "Result-oriented approach"
-        ],
-        "business_practices": [
-            "International standards",
-            "Quality focus",
-            "Customer orientation",
-            "Professional development"
-        ]
-    }
+    index = bisect_right(_COMPANY_SIZE_BOUNDS, employee_count) - 1
+    company_type = _COMPANY_TYPES[index] if index >= 0 else "Unknown Size"
 
     # Get context for country or use default
-    context = ai_prompts.claude_cultural_contexts_dict.get(country, default_context)
+    context = prompts.claude_cultural_contexts_dict.get(country, _DEFAULT_CULTURAL_CONTEXT)
 
     company_size_context = f"""- {company_type} environment
     - {"Rapid growth and adaptation" if employee_count < 200 else "Established processes"}
     - {"Flexible roles and responsibilities" if employee_count < 200 else "Specialized roles"}
     - {"Direct access to leadership" if employee_count < 200 else "Structured hierarchy"}"""
 
-    cultural_context_prompt = ai_prompts.claude_cultural_context.format(
+    return prompts.claude_cultural_context.format(
         country=country,
         company_type=company_type,
-        company_size=job_info.companySize or "Unknown",
+        company_size=company_size or "Unknown",
         working_language=context['language'],
         work_culture=chr(10).join(f'   - {item}' for item in context['work_culture']),
         business_context=chr(10).join(f'   - {item}' for item in context['business_practices']),
         company_size_context=company_size_context
     )
 
-    return cultural_context_prompt
+def get_cultural_context(job_info: JobDetailedInfo) -> str:
+    """Get cultural context based on job location and company.
+
+    Args:
+        job_info: Job information including location and company size
+
+    Returns:
+        Formatted cultural context string based on location and company size
+    """
+    global _cultural_context_cache
+    # Extract country from location (usually last part after comma)
+    country = job_info.location.split(',')[-1].strip()
+    key = (country, job_info.companySize)
+
+    prompts = ai_prompts.get()
+    if (_cultural_context_cache is None or _cultural_context_cache[0] is not prompts
+            or len(_cultural_context_cache[1]) >= _CULTURAL_CONTEXT_CACHE_SIZE):
+        _cultural_context_cache = (prompts, {})
+    contexts = _cultural_context_cache[1]
+    if key not in contexts:
+        contexts[key] = _format_cultural_context(prompts, *key)
+    return contexts[key]
 
 # System Messages (Claude)
 claude_system_messages = {
@@ -88,3 +109,15 @@ claude_system_messages = {
     "customize_resume": "You are a professional resume consultant with expertise in international markets. Help customize this resume to highlight the most relevant qualifications for the target role. Focus on matching skills and experiences without fabricating information. Maintain conversation context and build upon previous exchanges. Pay special attention to cultural context and technical domain integrity.",
     "generate_cover_letter": "You are a cover letter specialist crafting technically-grounded narratives that integrate professional, cultural, and career elements while maintaining natural sentence structure."
 }
+
+# System messages as request blocks, built once so every request sends the same cached prefix
+claude_system_blocks = {
+    name: [
+        {
+            "type": "text",
+            "text": message,
+            "cache_control": {"type": "ephemeral", "ttl": "1h"}
+        }
+    ]
+    for name, message in claude_system_messages.items()
+}
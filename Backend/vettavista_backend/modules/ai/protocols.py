@@ -13,4 +13,4 @@ class ClaudeServiceProtocol(Protocol):
         ...
 
     async def batch_extract_job_info(self, job_description: str, post_lang: str) -> Tuple[Dict, Dict, Dict, VisaSupport]:
-        ... 
\ No newline at end of file
+        ...
@@ -0,0 +1,145 @@
+"""
+Client side rate limiting for the Claude API, so bursts wait locally instead of failing with 429s.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, Mapping, Optional
+
+from tenacity import RetryCallState
+from tenacity.wait import wait_base
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at capacity per minute"""
+
+    def __init__(self, capacity: float):
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()  # Waiters are served in order
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.capacity / 60)
+        self._updated = now
+
+    async def acquire(self, amount: float) -> None:
+        """Wait until amount tokens are available and take them.
+
+        Amounts above the capacity take the whole bucket, otherwise they could never be served.
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                needed = min(amount, self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= needed
+                    return
+                await asyncio.sleep((needed - self._tokens) * 60 / self.capacity)
+
+    def update(self, capacity: float, remaining: float) -> None:
+        """Adjust the bucket to the limit and remaining amount reported by the server"""
+        self._refill()
+        self.capacity = capacity
+        self._tokens = min(self._tokens, remaining, capacity)
+
+
+def estimate_tokens(*blocks: Iterable[Any]) -> int:
+    """Roughly estimate the input tokens of message and system blocks, at about 4 characters per token"""
+    characters = 0
+    for block_list in blocks:
+        for block in block_list:
+            content = block.get("content", [block]) if isinstance(block, dict) else [block]
+            for part in content if isinstance(content, list) else [content]:
+                text = part.get("text") if isinstance(part, dict) else getattr(part, "text", part)
+                if isinstance(text, str):
+                    characters += len(text)
+    return characters // 4
+
+
+class ClaudeRateLimiter:
+    """Limits requests and input tokens per minute, tuned from the rate limit headers of each response"""
+
+    def __init__(self, requests_per_minute: int, input_tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute)
+        self.input_tokens = TokenBucket(input_tokens_per_minute)
+
+    async def acquire(self, estimated_input_tokens: int) -> None:
+        """Wait until one more request with the estimated input tokens fits in the limits"""
+        await self.requests.acquire(1)
+        await self.input_tokens.acquire(estimated_input_tokens)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Apply the anthropic-ratelimit-* headers of a response, missing or malformed headers are ignored"""
+        for bucket, name in ((self.requests, "requests"), (self.input_tokens, "input-tokens")):
+            try:
+                limit = float(headers[f"anthropic-ratelimit-{name}-limit"])
+                remaining = float(headers[f"anthropic-ratelimit-{name}-remaining"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if limit > 0:
+                bucket.update(limit, remaining)
+
+
+def _seconds_until(timestamp: str) -> Optional[float]:
+    """Seconds from now until an RFC 3339 or HTTP date timestamp, None if it can't be parsed"""
+    try:
+        moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(timestamp)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - datetime.now(timezone.utc)).total_seconds()
+
+
+def retry_delay_from_headers(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Get how long to wait before retrying from the headers of a failed response.
+
+    Uses retry-after if present, otherwise the latest reset time of the exhausted rate limits.
+    Returns None if the headers don't say.
+    """
+    if not headers:
+        return None
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            delay = _seconds_until(retry_after)
+            if delay is not None:
+                return max(0.0, delay)
+
+    delays = []
+    for name in ("requests", "tokens", "input-tokens", "output-tokens"):
+        reset = headers.get(f"anthropic-ratelimit-{name}-reset")
+        if reset and headers.get(f"anthropic-ratelimit-{name}-remaining") == "0":
+            delay = _seconds_until(reset)
+            if delay is not None:
+                delays.append(max(0.0, delay))
+    return max(delays) if delays else None
+
+
+class wait_for_rate_limit_reset(wait_base):
+    """Tenacity wait that waits as long as the failed response asks, falling back to another wait strategy"""
+
+    def __init__(self, fallback: wait_base, max_wait: float = 60):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        response = getattr(exception, "response", None)
+        delay = retry_delay_from_headers(getattr(response, "headers", None))
+        if delay is None:
+            return self.fallback(retry_state)
+        logger.info(f"Retrying Claude request in {delay:.1f}s as requested by the API")
+        return min(delay, self.max_wait)
@@ -0,0 +1,106 @@
+"""
+Finds earlier job descriptions that are near duplicates of a new one, so their cached analysis can be reused.
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import platformdirs
+
+from vettavista_backend.config.global_constants import APP_NAME, SEMANTIC_CACHE_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Maps description embeddings to the LLM cache keys of their analyses.
+
+    Embeddings are normalized, so a matrix-vector product gives the cosine similarity to every known description.
+    The index is kept in memory and saved to disk after every addition.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or Path(platformdirs.user_cache_dir(APP_NAME, appauthor=False)) / "llm_cache"
+        self._model = None
+        self._keys: List[str] = []
+        self._embeddings: Optional[np.ndarray] = None
+        self._pending: Dict[str, np.ndarray] = {}  # Embeddings of looked up descriptions, until they are added
+        self._lock = asyncio.Lock()
+        self._save_lock = asyncio.Lock()
+
+    @property
+    def _path(self) -> Path:
+        return self.cache_dir / "semantic_index.npz"
+
+    def _load(self) -> None:
+        """Load the model and the saved index, runs once in a worker thread"""
+        from vettavista_backend.modules.business.utils.utils import load_model_prefer_cache
+        self._model = load_model_prefer_cache(SEMANTIC_CACHE_SETTINGS['model_name'],
+                                              prompt=SEMANTIC_CACHE_SETTINGS['prompt'])
+        try:
+            with np.load(self._path) as index:
+                self._keys = index["keys"].tolist()
+                self._embeddings = index["embeddings"]
+        except FileNotFoundError:
+            pass
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable semantic cache index {self._path}: {e}")
+
+    def _save(self, keys: List[str], embeddings: np.ndarray) -> None:
+        tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp.npz")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(tmp, keys=np.array(keys), embeddings=embeddings)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            logger.warning(f"Could not save semantic cache index {self._path}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _encode(self, text: str) -> np.ndarray:
+        """Embed the whole text as the mean of its chunk embeddings, the model only sees the start of long inputs"""
+        size = SEMANTIC_CACHE_SETTINGS['chunk_chars']
+        chunks = [text[i:i + size] for i in range(0, len(text), size)] or [""]
+        embedding = self._model.encode(chunks).mean(axis=0)
+        return (embedding / (np.linalg.norm(embedding) + 1e-8)).astype(np.float32)
+
+    async def find(self, key: str, text: str) -> Optional[str]:
+        """Get the key of the most similar known description, or None if none is similar enough.
+
+        The embedding of text is kept for add, so a miss that is analyzed afterwards isn't embedded twice.
+        """
+        async with self._lock:
+            if self._model is None:
+                await asyncio.to_thread(self._load)
+        embedding = await asyncio.to_thread(self._encode, text)
+        if len(self._pending) >= SEMANTIC_CACHE_SETTINGS['max_pending']:
+            self._pending.clear()
+        self._pending[key] = embedding
+
+        if self._embeddings is None:
+            return None
+        similarities = self._embeddings @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < SEMANTIC_CACHE_SETTINGS['threshold']:
+            return None
+        logger.info(f"Found a near duplicate job description, similarity {similarities[best]:.3f}")
+        return self._keys[best]
+
+    async def add(self, key: str, text: str) -> None:
+        """Remember the analysis stored under key for descriptions similar to text"""
+        embedding = self._pending.pop(key, None)
+        if embedding is None:
+            if self._model is None:
+                return  # Only descriptions that were looked up are added
+            embedding = await asyncio.to_thread(self._encode, text)
+        if key in self._keys:
+            return
+        self._keys = self._keys + [key]
+        self._embeddings = (embedding[None, :] if self._embeddings is None
+                            else np.vstack([self._embeddings, embedding]))
+        async with self._save_lock:
+            # Saves the latest index, which includes additions made while waiting for the lock
+            await asyncio.to_thread(self._save, self._keys, self._embeddings)
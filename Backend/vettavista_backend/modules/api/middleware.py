@@ -1,16 +1,54 @@
 import asyncio
 import logging
+from typing import Dict, Optional
+
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
-# Global semaphore to limit concurrent requests
-api_semaphore = asyncio.Semaphore(2)  # Allow max 2 concurrent requests
+# Concurrency limits for expensive routes, keyed by path prefix. Routes not listed here are not limited,
+# so cheap reads like GET /api/blacklist never wait behind Claude-backed requests.
+ROUTE_LIMITS: Dict[str, asyncio.Semaphore] = {
+    "/api/apply": asyncio.Semaphore(2),
+    "/api/editor": asyncio.Semaphore(2),
+    "/api/detailed-filter": asyncio.Semaphore(2),
+    "/api/preliminary-filter": asyncio.Semaphore(4),
+}
+
+# Routes where requests for the same path (i.e. the same job) must run one at a time
+SINGLE_FLIGHT_PREFIXES = ("/api/apply/",)
+# Fixed set of locks shared by hash, so no per-path state is kept. Colliding paths just wait for each other.
+_PATH_LOCKS = tuple(asyncio.Lock() for _ in range(64))
+
+
+def get_route_semaphore(path: str) -> Optional[asyncio.Semaphore]:
+    """Get the semaphore limiting the given path, or None if the path is unlimited"""
+    for prefix, semaphore in ROUTE_LIMITS.items():
+        if path.startswith(prefix):
+            return semaphore
+    return None
+
+
+def get_path_lock(path: str) -> asyncio.Lock:
+    """Get the lock serializing requests for the given path"""
+    return _PATH_LOCKS[hash(path) % len(_PATH_LOCKS)]
+
 
 class RequestLimitMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        async with api_semaphore:
-            logger.info(f"Processing request to {request.url.path}")
-            response = await call_next(request)
-            return response 
\ No newline at end of file
+        path = request.url.path
+        semaphore = get_route_semaphore(path)
+        if semaphore is None:
+            return await call_next(request)
+
+        if path.startswith(SINGLE_FLIGHT_PREFIXES):
+            # Wait for the same job outside the semaphore so waiters don't hold a slot
+            async with get_path_lock(path):
+                async with semaphore:
+                    logger.info(f"Processing request to {path}")
+                    return await call_next(request)
+
+        async with semaphore:
+            logger.info(f"Processing request to {path}")
+            return await call_next(request)
@@ -7,7 +7,6 @@ from vettavista_backend.modules.api.rest.job_history_endpoints import JobHistory
 from vettavista_backend.modules.business.application.application_service import ApplicationService
 from vettavista_backend.modules.business.filter import PreliminaryFilterService, DetailedFilterService
 from vettavista_backend.modules.storage.blacklist_storage import BlacklistStorage
-from vettavista_backend.modules.storage.job_history_storage import JobHistoryStorage
 from vettavista_backend.modules.sync.base import DataBroadcaster
 
 
@@ -15,17 +14,19 @@ def create_rest_api(
     preliminary_filter_service: PreliminaryFilterService,
     detailed_filter_service: DetailedFilterService,
     blacklist_storage: BlacklistStorage,
-    job_history_storage: JobHistoryStorage,
+    job_history_endpoints: JobHistoryEndpoints,
     broadcaster: DataBroadcaster,
     application_service: ApplicationService
 ) -> APIRouter:
-    """Create and configure the REST API router."""
+    """Create and configure the REST API router.
+
+    The job history endpoints are created by the caller, which stops their batch writer on shutdown.
+    """
     api_router = APIRouter()
     
     # Initialize endpoints
     filter_endpoints = FilterEndpoints(preliminary_filter_service, detailed_filter_service)
     blacklist_endpoints = BlacklistEndpoints(blacklist_storage, broadcaster)
-    job_history_endpoints = JobHistoryEndpoints(job_history_storage, broadcaster)
     application_endpoints = ApplicationEndpoints(application_service)
     
     # Include all routes
@@ -1,12 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-from fastapi import APIRouter
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """Request that decodes its JSON body with orjson instead of the stdlib json module."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that hands ORJSONRequest to FastAPI's body parsing."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
 
 class BaseRESTEndpoint(ABC):
     """Base class for REST endpoints."""
     
     def __init__(self):
-        self.router = APIRouter()
+        self.router = APIRouter(route_class=ORJSONRoute)
         self.setup_routes()
     
     @abstractmethod
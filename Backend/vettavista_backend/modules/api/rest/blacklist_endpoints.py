@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from typing import Dict
 
@@ -24,12 +23,11 @@ class BlacklistEndpoints(BaseRESTEndpoint):
             if not company:
                 raise ValueError("Company name required")
             
-            reason = data.get('reason', '')
-            notes = data.get('notes', '')
+            reason = data.get('reason') or ''
+            notes = data.get('notes') or ''
             await self.blacklist_storage.add_company(company, reason=reason, notes=notes)
             
-            # Add small delay to ensure storage operation completes
-            await asyncio.sleep(0.1)
+            # Served from the in-memory blacklist, no CSV re-read
             blacklist = await self.blacklist_storage.get_all_companies()
             await self.broadcaster.broadcast_update({
                 "blacklist": blacklist
@@ -51,5 +49,5 @@ class BlacklistEndpoints(BaseRESTEndpoint):
         @handle_endpoint_errors
         async def get_blacklist():
             """Get all blacklisted companies."""
-            blacklist = await self.blacklist_storage.get_all()
+            blacklist = await self.blacklist_storage.get_all_companies()
             return {"blacklist": blacklist}
\ No newline at end of file
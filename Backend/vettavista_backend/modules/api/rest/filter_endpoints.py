@@ -1,12 +1,14 @@
 import logging
-from dataclasses import asdict
-from typing import Dict, List
+from typing import Dict
+
+import orjson
+from fastapi import Request, Response
 
 from vettavista_backend.modules.api.rest.base import BaseRESTEndpoint
 from vettavista_backend.modules.api.utils import handle_endpoint_errors
 from vettavista_backend.modules.business.filter import PreliminaryFilterService, DetailedFilterService
 from vettavista_backend.modules.models.services import JobInfo, JobDetailedInfo
-from vettavista_backend.modules.utils import decode_dataclass
+from vettavista_backend.modules.utils import decode_dataclass, dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +21,15 @@ class FilterEndpoints(BaseRESTEndpoint):
     def setup_routes(self) -> None:
         @self.router.post("/api/preliminary-filter")
         @handle_endpoint_errors
-        async def preliminary_filter(job_data_list: List[Dict]):
-            """Quick filtering based on job title and location"""
+        async def preliminary_filter(request: Request) -> Response:
+            """Quick filtering based on job title and location.
+
+            Batches can be large, so the body is parsed and the results serialized with orjson
+            instead of going through FastAPI's validation and jsonable_encoder.
+            """
+            job_data_list = orjson.loads(await request.body())
+            if not isinstance(job_data_list, list) or not all(isinstance(job_data, dict) for job_data in job_data_list):
+                raise ValueError("Expected a list of jobs")
             logger.info(f"\n=== Preliminary Filter Request ===")
             logger.info(f"Number of jobs to filter: {len(job_data_list)}")
             
@@ -30,20 +39,21 @@ class FilterEndpoints(BaseRESTEndpoint):
             # Get filter results
             results = await self.preliminary_filter_service.preliminary_filter(jobs)
             
-            # Convert responses to dicts
-            return [asdict(result) for result in results]
+            # Serialize the result dataclasses directly, without converting them to dicts first
+            return Response(content=dumps_json(results), media_type="application/json")
         
         @self.router.post("/api/detailed-filter")
         @handle_endpoint_errors
-        async def detailed_filter(job_data: Dict):
+        async def detailed_filter(job_data: Dict) -> Response:
             """Detailed filtering using Claude for skill analysis"""
-            logger.info(f"\n=== Detailed Filter Request ===")
-            logger.info(f"Job ID: {job_data.get('jobId')}")
-            logger.info(f"Title: {job_data.get('title')}")
-            logger.info(f"Company: {job_data.get('company')}")
-            logger.info(f"Company Size: {job_data.get('companySize')}")
-            logger.info(f"About Company Length: {len(job_data.get('aboutCompany', ''))}")
-            logger.info(f"Description Length: {len(job_data.get('description', ''))}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"\n=== Detailed Filter Request ===")
+                logger.info(f"Job ID: {job_data.get('jobId')}")
+                logger.info(f"Title: {job_data.get('title')}")
+                logger.info(f"Company: {job_data.get('company')}")
+                logger.info(f"Company Size: {job_data.get('companySize')}")
+                logger.info(f"About Company Length: {len(job_data.get('aboutCompany', ''))}")
+                logger.info(f"Description Length: {len(job_data.get('description', ''))}")
             
             # Convert dict to JobDetailedInfo
             job = decode_dataclass(JobDetailedInfo, job_data)
@@ -51,5 +61,11 @@ class FilterEndpoints(BaseRESTEndpoint):
             # Get filter result
             result = await self.detailed_filter_service.detailed_filter(job)
             
-            # Convert response to dict
-            return asdict(result)
\ No newline at end of file
+            # Serialize the result dataclass directly, without converting it to a dict first
+            return Response(content=dumps_json(result), media_type="application/json")
+
+        @self.router.get("/api/cache/stats")
+        @handle_endpoint_errors
+        async def cache_stats():
+            """Get title matcher cache statistics"""
+            return self.preliminary_filter_service.title_matcher.get_cache_stats()
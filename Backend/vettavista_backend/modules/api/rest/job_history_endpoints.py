@@ -1,39 +1,128 @@
+import asyncio
 import logging
-from typing import Dict
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
 
-from vettavista_backend.config.global_constants import ApplicationStatus
+from fastapi import status
+
+from vettavista_backend.config.global_constants import ApplicationStatus, STORAGE_SETTINGS
 from vettavista_backend.modules.api.rest.base import BaseRESTEndpoint
 from vettavista_backend.modules.api.utils import handle_endpoint_errors
+from vettavista_backend.modules.models.storage import JobHistoryEntry
 from vettavista_backend.modules.storage.job_history_storage import JobHistoryStorage
 from vettavista_backend.modules.sync.base import DataBroadcaster
+from vettavista_backend.modules.utils import decode_dataclass
 
 logger = logging.getLogger(__name__)
 
+# Fields a job history update must contain
+REQUIRED_JOB_FIELDS = frozenset({'jobId', 'title', 'company'})
+
+# Only jobs that are being applied to are stored
+STORED_STATUSES = frozenset({
+    ApplicationStatus.APPLIED,
+    ApplicationStatus.IN_PROGRESS,
+    ApplicationStatus.OFFER,
+    ApplicationStatus.ACCEPTED,
+    ApplicationStatus.DECLINED
+})
+
 class JobHistoryEndpoints(BaseRESTEndpoint):
     def __init__(self, job_history_storage: JobHistoryStorage, broadcaster: DataBroadcaster):
         self.job_history_storage = job_history_storage
         self.broadcaster = broadcaster
+        self._update_queue: Optional[asyncio.Queue] = None  # None in the queue asks the writer to stop
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._failed_updates: List[JobHistoryEntry] = []  # Written again with the next batch
+        self._failed_attempts = 0
         super().__init__()
-    
+
+    def _enqueue_update(self, entry: JobHistoryEntry) -> None:
+        """Queue a job history update, starting the batch writer if needed"""
+        if self._update_queue is None:
+            self._update_queue = asyncio.Queue()
+        if self._consumer_task is None or self._consumer_task.done():
+            self._consumer_task = asyncio.create_task(self._consume_updates())
+        self._update_queue.put_nowait(entry)
+
+    async def stop(self) -> None:
+        """Write all queued updates and stop the batch writer"""
+        if self._consumer_task is None or self._consumer_task.done():
+            return
+        self._update_queue.put_nowait(None)
+        await self._consumer_task
+
+    async def _collect_batch(self) -> Tuple[List[JobHistoryEntry], bool]:
+        """Wait for one update, then collect more until the batch is full or the wait time is up.
+
+        Failed updates start the batch. Also returns whether the writer should stop after this batch.
+        """
+        batch, self._failed_updates = self._failed_updates, []
+        if not batch:
+            entry = await self._update_queue.get()
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STORAGE_SETTINGS['history_batch_wait']
+        while len(batch) < STORAGE_SETTINGS['history_batch_size']:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                entry = await asyncio.wait_for(self._update_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    async def _consume_updates(self) -> None:
+        """Write queued updates in batches and broadcast only the changed jobs once per batch"""
+        while True:
+            batch, stopping = await self._collect_batch()
+            if batch:
+                await self._write_batch(batch, retry=not stopping)
+            if stopping:
+                return
+
+    async def _write_batch(self, batch: List[JobHistoryEntry], retry: bool) -> None:
+        """Write and broadcast one batch. A failed batch is kept for the next one, up to history_write_attempts."""
+        try:
+            await self.job_history_storage.add_or_update_jobs(batch)
+        except Exception as e:
+            self._failed_attempts += 1
+            if retry and self._failed_attempts < STORAGE_SETTINGS['history_write_attempts']:
+                logger.warning(f"Failed to write {len(batch)} job history updates, retrying: {str(e)}")
+                self._failed_updates = batch
+                await asyncio.sleep(STORAGE_SETTINGS['history_retry_wait'])
+            else:
+                logger.error(f"Dropped {len(batch)} job history updates after failed writes: {str(e)}")
+                self._failed_attempts = 0
+            return
+        self._failed_attempts = 0
+
+        try:
+            # Clients merge these by job_id, the full history is sent by the periodic snapshot
+            upserted = {entry.job_id: asdict(entry) for entry in batch}
+            await self.broadcaster.broadcast_update({
+                "history_upsert": list(upserted.values())
+            })
+        except Exception as e:
+            logger.error(f"Failed to broadcast {len(batch)} job history updates: {str(e)}")
+
     def setup_routes(self) -> None:
-        @self.router.post("/api/job-history")
+        @self.router.post("/api/job-history", status_code=status.HTTP_202_ACCEPTED)
         @handle_endpoint_errors
         async def add_or_update_job(job_data: Dict):
-            """Add or update job in history."""
-            if not all(k in job_data for k in ['jobId', 'title', 'company']):
-                raise ValueError("Missing required fields: jobId, title, company")
-            
+            """Add or update job in history. The write happens in the background."""
+            if not REQUIRED_JOB_FIELDS <= job_data.keys():
+                missing = REQUIRED_JOB_FIELDS - job_data.keys()
+                raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
+
             # Only store jobs that are being applied to
-            if job_data.get('application_status') in [
-                ApplicationStatus.APPLIED,
-                ApplicationStatus.IN_PROGRESS,
-                ApplicationStatus.OFFER,
-                ApplicationStatus.ACCEPTED,
-                ApplicationStatus.DECLINED
-            ]:
-                # Add/update job and broadcast to connected clients
-                await self.job_history_storage.add_or_update_job(job_data)
-                history = await self.job_history_storage.search_jobs(days=30)
-                await self.broadcaster.broadcast_update({
-                    "history": history
-                })
\ No newline at end of file
+            if job_data.get('application_status') in STORED_STATUSES:
+                # Queue the update, it is written and broadcast together with other pending updates
+                entry = decode_dataclass(JobHistoryEntry, {**job_data, 'job_id': job_data['jobId']})
+                self._enqueue_update(entry)
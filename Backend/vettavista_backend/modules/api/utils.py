@@ -1,30 +1,70 @@
-from typing import Dict, Tuple, Callable
+from typing import Any, Dict, Tuple, Callable, Union, get_args, get_origin
 from functools import wraps
+import inspect
 import logging
-from fastapi import HTTPException
-import traceback
+from fastapi import HTTPException, Response
 
 logger = logging.getLogger(__name__)
 
+# Missing required fields and validation errors, reported to the client as 400
+_CLIENT_ERRORS = (KeyError, ValueError)
+
+def _client_error(e: Exception) -> HTTPException:
+    """Build the 400 response for an expected client error, no traceback is formatted"""
+    logger.error(str(e))
+    return HTTPException(status_code=400, detail=str(e))
+
+def _server_error(func: Callable, e: Exception) -> HTTPException:
+    """Build the 500 response for an unexpected error and log its traceback"""
+    logger.error(f"Error in {func.__name__}: {str(e)}", exc_info=e)
+    return HTTPException(status_code=500, detail=str(e))
+
+def _get_return_kind(func: Callable) -> str:
+    """Classify an endpoint by its return annotation: 'none', 'optional' or 'value'"""
+    annotation = inspect.signature(func).return_annotation
+    if annotation is None or annotation is type(None):
+        return 'none'
+    if annotation is inspect.Signature.empty or annotation is Any:
+        return 'optional'
+    if get_origin(annotation) is Union and type(None) in get_args(annotation):
+        return 'optional'
+    return 'value'
+
 def handle_endpoint_errors(func: Callable):
-    """Decorator to handle common error patterns in HTTP endpoints"""
+    """Decorator to handle common error patterns in HTTP endpoints.
+    
+    The wrapper is picked once from the return annotation: endpoints annotated to return a value skip the
+    None check, endpoints annotated to return None respond with an empty 204, and unannotated or Optional
+    endpoints return an empty dict for None.
+    """
     @wraps(func)
-    async def wrapper(*args, **kwargs):
+    async def call_endpoint(*args, **kwargs):
         try:
-            result = await func(*args, **kwargs)
-            # Return empty dict for None responses
-            if result is None:
-                return {}
-            return result
+            return await func(*args, **kwargs)
         except HTTPException:
             # Re-raise HTTP exceptions as they're already properly formatted
             raise
-        except (KeyError, ValueError) as e:
-            # Handle missing required fields and validation errors as 400
-            logger.error(str(e))
-            raise HTTPException(status_code=400, detail=str(e))
+        except _CLIENT_ERRORS as e:
+            raise _client_error(e)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            logger.error(f"Error details: {traceback.format_exc()}")
-            raise HTTPException(status_code=500, detail=str(e))
+            raise _server_error(func, e)
+
+    return_kind = _get_return_kind(func)
+    if return_kind == 'value':
+        return call_endpoint
+
+    if return_kind == 'none':
+        @wraps(func)
+        async def no_content_wrapper(*args, **kwargs):
+            await call_endpoint(*args, **kwargs)
+            return Response(status_code=204)
+        return no_content_wrapper
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        result = await call_endpoint(*args, **kwargs)
+        # Return empty dict for None responses
+        if result is None:
+            return {}
+        return result
     return wrapper
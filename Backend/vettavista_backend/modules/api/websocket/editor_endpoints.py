@@ -8,7 +8,7 @@ from starlette.websockets import WebSocketDisconnect
 from vettavista_backend.modules.api.websocket.base import WebSocketEndpoint
 from vettavista_backend.modules.editor.manager import EditorManager
 from vettavista_backend.modules.editor.types import ServerMessage, MessageType, PhaseData, EditorUpdate
-from vettavista_backend.modules.utils import DataClassJSONEncoder
+from vettavista_backend.modules.utils import dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +41,10 @@ class EditorEndpoints(WebSocketEndpoint):
         logger.error(f"Error for client {client_id}: {error_message}")
         websocket = self.editor_manager.active_connections.get(client_id)
         if websocket is not None:   # needed for testing mocks
-            await websocket.send_text(json.dumps(ServerMessage(
+            await websocket.send_text(dumps_json(ServerMessage(
                 type=MessageType.ERROR,
                 error_message=error_message
-            ), cls=DataClassJSONEncoder))
+            )))
 
     async def handle_connection(self, websocket: WebSocket, session_id: str) -> None:
         """Handle incoming WebSocket connection"""
@@ -62,14 +62,14 @@ class EditorEndpoints(WebSocketEndpoint):
             await self.editor_manager.register_client(session_id, websocket)
 
             # Send initial state
-            await websocket.send_text(json.dumps(ServerMessage(
+            await websocket.send_text(dumps_json(ServerMessage(
                 type=MessageType.INIT,
                 phase_data=PhaseData(
                     original=task.resume_data.original,
                     customized=task.resume_data.customized,
                     recommended_skills=task.recommended_skills
                 )
-            ), cls=DataClassJSONEncoder))
+            )))
             logger.info(f"Sent initial data to session {session_id}")
 
         except Exception as e:
@@ -3,14 +3,15 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from vettavista_backend.modules.api.websocket.sync_endpoints import SyncEndpoints
 from vettavista_backend.modules.api.websocket.editor_endpoints import EditorEndpoints
 from vettavista_backend.modules.editor.manager import EditorManager
+from vettavista_backend.modules.sync.websocket_manager import WebSocketSyncManager
 
 logger = logging.getLogger(__name__)
 
-def create_router(editor_manager: EditorManager) -> APIRouter:
+def create_router(editor_manager: EditorManager, sync_manager: WebSocketSyncManager) -> APIRouter:
     router = APIRouter()
 
     # Initialize endpoints
-    sync_endpoints = SyncEndpoints()
+    sync_endpoints = SyncEndpoints(sync_manager)
     editor_endpoints = EditorEndpoints(editor_manager)
 
     # Include routers
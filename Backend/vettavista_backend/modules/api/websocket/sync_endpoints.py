@@ -1,24 +1,22 @@
-import json
 import logging
 from typing import Dict
 
 from fastapi import WebSocket, WebSocketDisconnect, APIRouter
 
 from vettavista_backend.modules.api.websocket.base import WebSocketEndpoint
-from vettavista_backend.modules.storage.blacklist_storage import BlacklistStorage
-from vettavista_backend.modules.storage.job_history_storage import JobHistoryStorage
 from vettavista_backend.modules.sync.websocket_manager import WebSocketSyncManager
-from vettavista_backend.modules.utils import DataClassJSONEncoder
 
 logger = logging.getLogger(__name__)
 
 class SyncEndpoints(WebSocketEndpoint):
     """WebSocket endpoints for syncing data between server and client."""
     
-    def __init__(self):
-        self.job_history = JobHistoryStorage()
-        self.blacklist = BlacklistStorage()
-        self.manager = WebSocketSyncManager(blacklist_storage=self.blacklist, job_history_storage=self.job_history)
+    def __init__(self, sync_manager: WebSocketSyncManager):
+        # Share the server's sync manager and storages so REST broadcasts reach these clients
+        # and the in-memory storage state stays consistent
+        self.manager = sync_manager
+        self.job_history = sync_manager.job_history_storage
+        self.blacklist = sync_manager.blacklist_storage
         self.router = APIRouter()
         self.setup_routes()
         
@@ -86,17 +84,12 @@ class SyncEndpoints(WebSocketEndpoint):
             # Get recent job history (last 30 days)
             history = await self.job_history.search_jobs(days=30)
             
-            # Use DataClassJSONEncoder to properly handle dataclasses and enums
-            data = {
+            # Dataclasses and enums are serialized by broadcast_update
+            return {
                 "blacklist": blacklisted,
                 "history": history
             }
             
-            # Convert to JSON and back to get a fully serializable dictionary
-            return json.loads(
-                json.dumps(data, cls=DataClassJSONEncoder)
-            )
-            
         except Exception as e:
             logger.error(f"Error getting sync data: {e}")
             return {"blacklist": [], "history": []} 
\ No newline at end of file
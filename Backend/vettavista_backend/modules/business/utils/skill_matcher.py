@@ -16,7 +16,8 @@ logger = logging.getLogger(__name__)
 class SimpleSkillMatcher(SkillMatcher):
     def __init__(self):
         """Initialize the skill matcher with embedding model"""
-        self.model = load_model_prefer_cache(TITLE_MATCH_SETTINGS['model_name'])
+        self.model = load_model_prefer_cache(TITLE_MATCH_SETTINGS['model_name'],
+                                             prompt=TITLE_MATCH_SETTINGS['prompt'])
         self.fuzzy_threshold = 85  # Fuzzy match threshold
         self.embedding_threshold = 0.85  # Semantic similarity threshold
 
@@ -6,8 +6,8 @@ from sklearn.metrics.pairwise import cosine_similarity
 
 from vettavista_backend.config.global_constants import TITLE_MATCH_SETTINGS
 from vettavista_backend.modules.business.utils.base import TitleMatcher
-from vettavista_backend.modules.business.utils.utils import batch_encode_strings, batch_encode_grouped_strings, calculate_pairwise_similarities, \
-    find_best_match_from_cache, load_model_prefer_cache
+from vettavista_backend.modules.business.utils.utils import batch_encode_strings, batch_encode_grouped_strings, \
+    load_model_prefer_cache, LRUCache, normalize_title
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +18,12 @@ class SentenceTransformerMatcher(TitleMatcher):
         ["Software Engineer", "Software Developer", "Python Developer"]
         """
         # Load a lightweight model suitable for semantic similarity
-        self.model = load_model_prefer_cache(TITLE_MATCH_SETTINGS['model_name'])
-        # Pre-compute embeddings for preferred titles
-        self.preferred_embeddings = self.model.encode(preferred_titles)
+        self.model = load_model_prefer_cache(TITLE_MATCH_SETTINGS['model_name'],
+                                             prompt=TITLE_MATCH_SETTINGS['prompt'])
+        # Pre-compute normalized embeddings for preferred titles as one (N, D) matrix
+        preferred_embeddings = self.model.encode(preferred_titles)
+        preferred_embeddings /= np.linalg.norm(preferred_embeddings, axis=1, keepdims=True) + 1e-8
+        self.preferred_embeddings = np.ascontiguousarray(preferred_embeddings, dtype=np.float32)
         # Initialize cache
         self.cache = {}
         self.preferred_titles = preferred_titles  # Store for logging
@@ -38,10 +41,9 @@ class SentenceTransformerMatcher(TitleMatcher):
             
         # Get embedding for job title
         job_embedding = self.model.encode([job_title])[0]
-        # Calculate cosine similarities with all preferred titles
-        similarities = np.dot(self.preferred_embeddings, job_embedding) / (
-            np.linalg.norm(self.preferred_embeddings, axis=1) * np.linalg.norm(job_embedding)
-        )
+        # Calculate cosine similarities with all preferred titles in a single matrix-vector product
+        job_embedding = job_embedding / (np.linalg.norm(job_embedding) + 1e-8)
+        similarities = self.preferred_embeddings @ job_embedding
         
         # Log individual similarities
         for i, score in enumerate(similarities):
@@ -64,11 +66,17 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
         ["Software Engineer", "Software Developer", "Python Developer"]
         """
         print(f"Loading model: {TITLE_MATCH_SETTINGS['model_name']}")
-        self.model = load_model_prefer_cache(TITLE_MATCH_SETTINGS['model_name'])
+        self.model = load_model_prefer_cache(TITLE_MATCH_SETTINGS['model_name'],
+                                             prompt=TITLE_MATCH_SETTINGS['prompt'])
         self.temperature = temperature
         self.preferred_titles = preferred_titles
-        self.cache = {}  # For score cache
-        self.embedding_cache = {}  # For embedding cache
+        # Score cache maps a normalized title to its best score, so a title is always evicted as a whole
+        self.cache = LRUCache(TITLE_MATCH_SETTINGS['cache_size'])
+        # Unit-length embeddings, encode() keeps its temperature-scaled ones apart
+        self.embedding_cache = LRUCache(TITLE_MATCH_SETTINGS['cache_size'])
+        self.scaled_embedding_cache = LRUCache(TITLE_MATCH_SETTINGS['cache_size'])
+        self.cache_hits = 0
+        self.cache_misses = 0
 
         # Define domain prototypes with multiple examples
         self.domain_prototypes = {
@@ -171,8 +179,13 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
             model=self.model,
             embedding_cache=self.embedding_cache
         )
-        # Convert preferred embeddings to numpy array for later use
-        self.preferred_embeddings = np.stack([self.preferred_embeddings[t] for t in preferred_titles])
+        # Stack preferred embeddings into a contiguous (N, D) matrix for matrix-vector scoring
+        self.preferred_embeddings = np.ascontiguousarray(
+            np.stack([self.preferred_embeddings[t] for t in preferred_titles]), dtype=np.float32)
+        # Same for domain prototypes, so domain detection is a single product as well
+        self.domain_names = list(self.domain_prototypes.keys())
+        self.domain_matrix = np.ascontiguousarray(
+            np.stack([self.domain_embeddings[d] for d in self.domain_names]), dtype=np.float32)
 
         # Domain relationship weights
         self.domain_relationships = {
@@ -204,6 +217,10 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
             'director': 5
         }
 
+        # Preferred titles are static, so their domains and seniorities are computed once
+        self.preferred_domains = [self.get_domain(t) for t in preferred_titles]
+        self.preferred_seniorities = self.get_seniority(preferred_titles)
+
     def get_domain_similarity(self, embedding, domain):
         """Calculate similarity with domain prototype"""
         domain_emb = self.domain_embeddings[domain]
@@ -252,16 +269,11 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
         ]):
             return 'mobile'
 
-        # Semantic similarity check
+        # Semantic similarity check against all domain prototypes at once
         title_emb = self.encode([title])[0]
-        similarities = {
-            domain: self.get_domain_similarity(title_emb, domain)
-            for domain in self.domain_prototypes.keys()
-        }
-
-        # Sort similarities in descending order
-        sorted_sims = sorted(similarities.items(), key=lambda x: x[1], reverse=True)
-        best_domain, best_sim = sorted_sims[0]
+        similarities = self.domain_matrix @ (title_emb / (np.linalg.norm(title_emb) + 1e-8))
+        best_idx = int(np.argmax(similarities))
+        best_domain, best_sim = self.domain_names[best_idx], similarities[best_idx]
 
         # Only fall back to 'general' if really uncertain
         if best_sim < 0.3:
@@ -312,7 +324,7 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
             texts = [texts]
         
         # Get uncached texts
-        uncached = [t for t in texts if t not in self.embedding_cache]
+        uncached = [t for t in texts if t not in self.scaled_embedding_cache]
         
         # Encode uncached texts
         if uncached:
@@ -320,10 +332,10 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
             embeddings = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-8) * self.temperature
             # Cache the new embeddings
             for text, emb in zip(uncached, embeddings):
-                self.embedding_cache[text] = emb
+                self.scaled_embedding_cache[text] = emb
         
         # Return embeddings in original order
-        result = np.array([self.embedding_cache[t] for t in texts])
+        result = np.array([self.scaled_embedding_cache[t] for t in texts])
         return result[0] if single_text else result
 
     def get_domain_penalties(self, domains1: List[str], domains2: List[str]) -> np.ndarray:
@@ -349,42 +361,30 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
         
     def get_similarity_with_preferred(self, job_title: str) -> List[Tuple[float, Dict]]:
         """Optimized version of get_similarity that uses pre-calculated preferred embeddings"""
-        # Get domains
+        # Get domain, preferred domains are pre-calculated
         job_domain = self.get_domain(job_title)
-        preferred_domains = [self.get_domain(t) for t in self.preferred_titles]
-        
-        # Calculate base similarities using batch operations with pre-calculated embeddings
-        job_embedding = batch_encode_strings([job_title], self.model, self.embedding_cache)
         
-        # Pre-calculate penalties once
-        domain_penalties = self.get_domain_penalties([job_domain], preferred_domains)
-        seniority_penalties = self.get_seniority_penalties([job_title], self.preferred_titles)
+        # Base similarities as one matrix-vector product against the normalized preferred matrix
+        job_embedding = batch_encode_strings([job_title], self.model, self.embedding_cache)[job_title]
+        base_similarities = self.preferred_embeddings @ job_embedding
         
-        def adjust_similarities(sim_matrix: np.ndarray) -> np.ndarray:
-            adjusted = sim_matrix - domain_penalties - seniority_penalties
-            return np.maximum(0.1, adjusted)
-        
-        # Use pre-calculated preferred embeddings
-        similarities = calculate_pairwise_similarities(
-            embeddings1=job_embedding,
-            embeddings2={t: emb for t, emb in zip(self.preferred_titles, self.preferred_embeddings)},
-            matrix_fn=adjust_similarities,
-            similarity_cache=self.cache
-        )
+        # Penalties against the pre-calculated preferred domains and seniorities
+        domain_penalties = self.get_domain_penalties([job_domain], self.preferred_domains)[0]
+        seniority_penalties = np.minimum(
+            0.2, np.abs(self.get_seniority(job_title) - self.preferred_seniorities) * 0.1)
+        similarities = np.maximum(0.1, base_similarities - domain_penalties - seniority_penalties)
         
         # Prepare results with details
         results = []
-        for j, t2 in enumerate(self.preferred_titles):
-            sim = similarities[(job_title, t2)]
-            # Use pre-calculated penalties
-            domain_penalty = domain_penalties[0, j]
-            seniority_penalty = seniority_penalties[0, j]
-            base_sim = sim + domain_penalty + seniority_penalty
+        for j in range(len(self.preferred_titles)):
+            sim = float(similarities[j])
+            domain_penalty = domain_penalties[j]
+            seniority_penalty = seniority_penalties[j]
             
             results.append((sim, {
-                'base_similarity': base_sim,
+                'base_similarity': float(base_similarities[j]),
                 'domain1': job_domain,
-                'domain2': preferred_domains[j],
+                'domain2': self.preferred_domains[j],
                 'domain_penalty': domain_penalty,
                 'seniority_penalty': seniority_penalty
             }))
@@ -394,12 +394,15 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
     def match_title(self, job_title: str) -> float:
         """Returns similarity score 0-1"""
         logger.info(f"\n=== Title Matching for: {job_title} ===")
+        job_title = normalize_title(job_title)
         
-        # Check cache first - try each preferred title
-        score, match = find_best_match_from_cache(self.cache, job_title, self.preferred_titles)
-        if match is not None:
+        # Check cache first
+        score = self.cache.get(job_title)
+        if score is not None:
+            self.cache_hits += 1
             logger.info(f"Cache hit! Score: {score:.3f}")
             return score
+        self.cache_misses += 1
         
         # Calculate similarities using optimized method
         similarities = self.get_similarity_with_preferred(job_title)
@@ -414,8 +417,16 @@ class AdvancedEmbeddingMatcher(TitleMatcher):
                 
         logger.info(f"Best match: '{best_match}' with score: {best_score:.3f}")
         
-        # Cache the result with tuple key if cache not full
-        if len(self.cache) < TITLE_MATCH_SETTINGS['cache_size']:
-            self.cache[(job_title, best_match)] = best_score
+        # Cache the best score, the LRU cache evicts old titles when full
+        self.cache[job_title] = best_score
             
-        return best_score
\ No newline at end of file
+        return best_score
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and current sizes of the title caches."""
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'score_cache_size': len(self.cache),
+            'embedding_cache_size': len(self.embedding_cache) + len(self.scaled_embedding_cache)
+        }
@@ -1,4 +1,5 @@
 import os
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Tuple, Any
@@ -9,6 +10,39 @@ from sklearn.preprocessing import normalize
 from sklearn.metrics.pairwise import cosine_similarity
 
 
+class LRUCache(OrderedDict):
+    """Dict with a size bound that evicts the least recently used entry.
+
+    Reads through [] or get() mark the entry as recently used, so it can be passed
+    anywhere the plain dict caches are used.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a job title for use as a cache key."""
+    return ' '.join(title.split()).lower()
+
+
 def calculate_date_posted(time_string: str) -> datetime | None | ValueError:
     """
     Function to calculate date posted from string.
@@ -196,7 +230,12 @@ def calculate_pairwise_similarities(
     return result
 
 
-def load_model_prefer_cache(model_name, cache_dir=None):
+def load_model_prefer_cache(model_name, cache_dir=None, prompt=None):
+    """Load a SentenceTransformer, preferring the local huggingface cache.
+
+    If prompt is given it is registered as the default prompt, so every encode() call
+    gets it prepended (e5 models expect a "query: "/"passage: " prefix).
+    """
     # Get default cache dir if not specified
     if cache_dir is None:
         cache_dir = os.path.expanduser('~/.cache/huggingface/hub')
@@ -208,14 +247,24 @@ def load_model_prefer_cache(model_name, cache_dir=None):
         cache_name = model_name
 
     model_path = Path(cache_dir) / cache_name / 'snapshots'
+    model_kwargs = {}
+    if prompt:
+        model_kwargs = {'prompts': {'query': prompt}, 'default_prompt_name': 'query'}
 
     # Find the snapshot directory (usually contains a hash)
+    model = None
     if model_path.exists():
         snapshot_dirs = list(model_path.iterdir())
         if snapshot_dirs:
             actual_model_path = snapshot_dirs[0]  # Use the first snapshot
             print(f"Loading model from cache: {actual_model_path}")
-            return SentenceTransformer(str(actual_model_path))
+            model = SentenceTransformer(str(actual_model_path), **model_kwargs)
+
+    if model is None:
+        print(f"Model not found in cache, downloading: {model_name}")
+        model = SentenceTransformer(model_name, **model_kwargs)
 
-    print(f"Model not found in cache, downloading: {model_name}")
-    return SentenceTransformer(model_name)
\ No newline at end of file
+    # Half precision is only a win on GPU; CPU fp16 matmuls are slower than fp32
+    if model.device.type == 'cuda':
+        model.half()
+    return model
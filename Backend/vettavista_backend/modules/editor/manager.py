@@ -1,4 +1,3 @@
-import json
 import os
 import base64
 from typing import Dict, Optional, Union
@@ -12,7 +11,7 @@ from vettavista_backend.modules.business.cache.job_cache_service import JobCache
 from vettavista_backend.modules.editor.types import EditorUpdate, EditorResponse, ServerMessage, MessageType, PhaseData
 from vettavista_backend.modules.sync.base import SyncManager, DataBroadcaster
 from vettavista_backend.modules.generators.resume_generator import ResumeGenerator
-from vettavista_backend.modules.utils import DataClassJSONEncoder
+from vettavista_backend.modules.utils import dumps_json
 from vettavista_backend.modules.generators.cover_letter_generator import CoverLetterGenerator
 from vettavista_backend.modules.models.services import ActiveTask, CustomizedContent, ApplicationPhase
 
@@ -44,14 +43,13 @@ class EditorManager(SyncManager, DataBroadcaster):
 
     async def broadcast_update(self, message_or_data: Union[ServerMessage, Dict]):
         """Broadcast a message to all connected clients."""
-        if isinstance(message_or_data, ServerMessage):
-            logger.info(f"Broadcasting message: {json.dumps(message_or_data, cls=DataClassJSONEncoder)}")
-        else:
-            logger.info(f"Broadcasting message: {message_or_data}")
+        # Serialize once for logging and all clients
+        message_text = dumps_json(message_or_data)
+        logger.info(f"Broadcasting message: {message_text}")
         
         for client_id, websocket in self.active_connections.items():
             try:
-                await websocket.send_text(json.dumps(message_or_data, cls=DataClassJSONEncoder))
+                await websocket.send_text(message_text)
                 logger.info(f"Message sent to client {client_id}")
             except Exception as e:
                 logger.error(f"Error sending message to client {client_id}: {e}")
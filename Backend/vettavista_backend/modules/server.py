@@ -1,11 +1,9 @@
 import logging
 import os
-import traceback
+import sys
 from contextlib import asynccontextmanager
-from functools import wraps
 from importlib import resources
 from importlib.resources import as_file
-from typing import Callable
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING)
@@ -17,17 +15,23 @@ logger = logging.getLogger(__name__)
 #     sys.path.insert(0, project_root)
 #     logger.info(f"Added {project_root} to Python path")
 
-from vettavista_backend.modules.sync import WebSocketSyncManager
+# The server needs every config, load them in parallel before the modules below access them one by one
+from vettavista_backend.config import load_configs
+load_configs()
+
+from vettavista_backend.modules.sync import WebSocketSyncManager, DebouncedBroadcaster
 from vettavista_backend.modules.business.utils.skill_matcher import SimpleSkillMatcher
 from vettavista_backend.modules.business.utils.title_matcher import AdvancedEmbeddingMatcher
 from vettavista_backend.modules.api.websocket import create_router
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 from fastapi.staticfiles import StaticFiles
 
 # Import configurations using the new system
 from vettavista_backend.config import search
+from vettavista_backend.config.global_constants import STORAGE_SETTINGS
 
 # Now import project modules
 from vettavista_backend.modules.storage.blacklist_storage import BlacklistStorage
@@ -37,6 +41,7 @@ from vettavista_backend.modules.business.application.application_service import
 from vettavista_backend.modules.business.cache.job_cache_service import JobCacheService
 from vettavista_backend.modules.api.middleware import RequestLimitMiddleware
 from vettavista_backend.modules.api.rest import create_rest_api
+from vettavista_backend.modules.api.rest.job_history_endpoints import JobHistoryEndpoints
 from vettavista_backend.modules.editor.manager import EditorManager
 
 # TODO: needs proper dependency injection and lifecycle
@@ -84,45 +89,26 @@ application_service = ApplicationService(
     broadcaster=websocket_sync_manager  # Add broadcaster
 )
 
-# Create REST API router with the WebSocket sync manager as the broadcaster
+# Create REST API router with the WebSocket sync manager as the broadcaster.
+# Blacklist and history updates come in bursts, so they are coalesced before broadcasting.
+rest_broadcaster = DebouncedBroadcaster(websocket_sync_manager)
+# Kept here so shutdown can write the job history updates that are still queued
+job_history_endpoints = JobHistoryEndpoints(job_history_storage, rest_broadcaster)
 rest_api_router = create_rest_api(
     preliminary_filter_service=preliminary_filter_service,
     detailed_filter_service=detailed_filter_service,
     blacklist_storage=blacklist_storage,
-    job_history_storage=job_history_storage,
-    broadcaster=websocket_sync_manager,
+    job_history_endpoints=job_history_endpoints,
+    broadcaster=rest_broadcaster,
     application_service=application_service
 )
 
-# Create WebSocket router with shared editor manager
-websocket_router = create_router(editor_manager)
+# Create WebSocket router with shared editor and sync managers
+websocket_router = create_router(editor_manager, websocket_sync_manager)
 
 # Define regex pattern for experience extraction
 re_experience = r'(\d+)(?:\+|\s*-\s*\d+)?\s*(?:years?|yrs?)'
 
-def handle_endpoint_errors(func: Callable):
-    """Decorator to handle common error patterns in HTTP endpoints"""
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        try:
-            result = await func(*args, **kwargs)
-            # Return empty dict for None responses
-            if result is None:
-                return {}
-            return result
-        except HTTPException:
-            # Re-raise HTTP exceptions as they're already properly formatted
-            raise
-        except (KeyError, ValueError) as e:
-            # Handle missing required fields and validation errors as 400
-            logger.error(str(e))
-            raise HTTPException(status_code=400, detail=str(e))
-        except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            logger.error(f"Error details: {traceback.format_exc()}")
-            raise HTTPException(status_code=500, detail=str(e))
-    return wrapper
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI application."""
@@ -132,14 +118,17 @@ async def lifespan(app: FastAPI):
     await detailed_filter_service.clear_cache()  # Clear cache on startup
     await job_history_storage.start_backup_scheduler()
     await blacklist_storage.start_backup_scheduler()
+    websocket_sync_manager.start_snapshot_scheduler(STORAGE_SETTINGS['sync_interval'])
     yield
     # Shutdown
     logger.info("Shutting down server...")
+    await job_history_endpoints.stop()
     job_history_storage.stop_backup_scheduler()
     blacklist_storage.stop_backup_scheduler()
+    websocket_sync_manager.stop_snapshot_scheduler()
 
 # Initialize FastAPI with lifespan
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Configure CORS
 app.add_middleware(
@@ -166,7 +155,9 @@ app.include_router(rest_api_router)
 
 
 def main():
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # uvloop and httptools are installed with uvicorn[standard], uvloop is not available on Windows
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop=loop, http="httptools")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
+import asyncio
 import logging
 import os
 from dataclasses import asdict
-from typing import Optional, List
+from typing import Dict, FrozenSet, Optional, List
 
 from platformdirs import user_documents_dir
 
@@ -13,6 +14,10 @@ from vettavista_backend.modules.utils import block_base_methods
 
 logger = logging.getLogger(__name__)
 
+def _fold_company(company: str) -> str:
+    """Normalize a company name for case-insensitive comparison"""
+    return company.strip().casefold()
+
 @block_base_methods(allowed_methods=["start_backup_scheduler", "stop_backup_scheduler"])
 class BlacklistStorage(CSVStorageService):
     """Storage service for blacklisted companies"""
@@ -24,6 +29,30 @@ class BlacklistStorage(CSVStorageService):
             data_class=BlacklistEntry,
             backup_enabled=True
         )
+        # In-memory copy of the blacklist, loaded from the CSV on first use and kept in sync on writes
+        self._companies: Optional[Dict[str, BlacklistEntry]] = None
+        # Case-folded company names for membership checks, rebuilt whenever the blacklist changes
+        self._companies_folded: FrozenSet[str] = frozenset()
+        self._lock = asyncio.Lock()
+        
+    async def _get_companies(self) -> Dict[str, BlacklistEntry]:
+        """Get the in-memory blacklist, loading it from the CSV file once"""
+        if self._companies is None:
+            data = await self.get_all()
+            self._companies = {item['company']: BlacklistEntry(**item) for item in data}
+            self._refresh_folded()
+        return self._companies
+        
+    def _refresh_folded(self) -> None:
+        """Rebuild the set of normalized company names"""
+        self._companies_folded = frozenset(_fold_company(c) for c in self._companies)
+        
+    async def _store_company(self, company: str, value: Dict) -> None:
+        """Write a company to the CSV file and the in-memory blacklist"""
+        companies = await self._get_companies()
+        await self.set(company, value)
+        companies[company] = BlacklistEntry(**value)
+        self._refresh_folded()
         
     async def add_company(self, company: str, reason: str = "", notes: str = "") -> None:
         """Add a company to the blacklist"""
@@ -32,29 +61,35 @@ class BlacklistStorage(CSVStorageService):
             reason=reason,
             notes=notes
         )
-        await self.set(company, asdict(entry))
+        async with self._lock:
+            await self._store_company(company, asdict(entry))
         
     async def remove_company(self, company: str) -> None:
         """Remove a company from the blacklist"""
-        await self.delete(company)
+        async with self._lock:
+            companies = await self._get_companies()
+            await self.delete(company)
+            companies.pop(company, None)
+            self._refresh_folded()
         
     async def is_blacklisted(self, company: str) -> bool:
-        """Check if a company is blacklisted"""
-        return await self.get(company) is not None
+        """Check if a company is blacklisted, ignoring case and surrounding whitespace"""
+        await self._get_companies()
+        return _fold_company(company) in self._companies_folded
         
     async def get_company(self, company: str) -> Optional[BlacklistEntry]:
         """Get details for a blacklisted company"""
-        data = await self.get(company)
-        return BlacklistEntry(**data) if data else None
+        return (await self._get_companies()).get(company)
         
     async def update_notes(self, company: str, notes: str) -> None:
         """Update notes for a blacklisted company"""
-        entry = await self.get_company(company)
-        if entry:
-            entry.notes = notes
-            await self.set(company, asdict(entry))
+        async with self._lock:
+            entry = await self.get_company(company)
+            if entry:
+                value = asdict(entry)
+                value['notes'] = notes
+                await self._store_company(company, value)
             
     async def get_all_companies(self) -> List[BlacklistEntry]:
         """Get all blacklisted companies"""
-        data = await self.get_all()
-        return [BlacklistEntry(**item) for item in data] 
\ No newline at end of file
+        return list((await self._get_companies()).values())
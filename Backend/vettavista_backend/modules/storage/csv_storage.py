@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Cell values read back as empty strings
+_NA_STRINGS = ['nan', 'NaN', 'NAN']
+_NA_VALUES = _NA_STRINGS + ['']
+
 class CSVStorageService(StorageService):
     """Base class for CSV-based storage models"""
     
@@ -31,6 +35,10 @@ class CSVStorageService(StorageService):
         self.columns = [f.name for f in fields(data_class)]
         self._backup_task = None
         self._backup_enabled = backup_enabled
+        # The CSV file is parsed once, afterwards reads are served from memory with a key -> row index
+        self._df: Optional[pd.DataFrame] = None
+        self._index: Dict[str, int] = {}
+        self._version = 0  # Bumped whenever the in-memory data changes
         self._ensure_file_exists()
         
     def _ensure_file_exists(self):
@@ -42,13 +50,35 @@ class CSVStorageService(StorageService):
             logger.info(f"Created new CSV file: {self.file_path}")
             
     def _read_df(self) -> pd.DataFrame:
+        """Get the in-memory DataFrame, reading the CSV file on first use.
+        
+        The returned DataFrame is shared, callers must not modify it in place.
+        """
+        if self._df is None:
+            self._set_df(self._load_df())
+        return self._df
+        
+    def _set_df(self, df: pd.DataFrame):
+        """Replace the in-memory DataFrame and rebuild the key index.
+        
+        Values are normalized like _load_df, so cached reads match a fresh load of the file.
+        """
+        df = df.fillna('').astype({col: str for col in self.columns if col in df.columns})
+        df = df.replace(_NA_STRINGS, '')
+        self._df = df
+        self._version += 1
+        self._index = {}
+        for row_idx, key in zip(df.index, df[self.key_column]):
+            self._index.setdefault(key, row_idx)  # First row wins for duplicate keys
+            
+    def _load_df(self) -> pd.DataFrame:
         """Read CSV file into DataFrame. All columns are read as strings."""
         try:
             # Read CSV with string type for all columns except specific numeric ones
             df = pd.read_csv(
                 self.file_path,
                 dtype={col: str for col in self.columns},  # Force string type for all columns
-                na_values=['nan', 'NaN', 'NAN', ''],  # Define what should be considered as NA
+                na_values=_NA_VALUES,  # Define what should be considered as NA
                 keep_default_na=False  # Don't use default NA values
             )
             # Replace NaN values with empty string
@@ -59,9 +89,10 @@ class CSVStorageService(StorageService):
             return pd.DataFrame(columns=self.columns)
             
     def _write_df(self, df: pd.DataFrame):
-        """Write DataFrame to CSV file"""
+        """Write DataFrame to CSV file and make it the in-memory state"""
         try:
             df.to_csv(self.file_path, index=False)
+            self._set_df(df)
         except Exception as e:
             logger.error(f"Error writing to CSV file: {e}")
             
@@ -128,29 +159,41 @@ class CSVStorageService(StorageService):
     async def get(self, key: str) -> Optional[Dict]:
         """Get a single row by key"""
         df = self._read_df()
-        row = df[df[self.key_column] == key]
-        if len(row) == 0:
+        row_idx = self._index.get(key)
+        if row_idx is None:
             return None
-        return row.iloc[0].to_dict()
+        return df.loc[row_idx].to_dict()
         
     async def set(self, key: str, value: Dict) -> None:
         """Set a single row"""
-        df = self._read_df()
-        value[self.key_column] = key
-        value['date_updated'] = datetime.now().isoformat()
+        await self.set_many({key: value})
         
-        # Find exact matches using equality comparison
-        mask = (df[self.key_column] == key)  # This ensures exact matching
+    async def set_many(self, values: Dict[str, Dict]) -> None:
+        """Set multiple rows with a single read and write of the file
         
-        # Update existing or append new
-        if mask.any():  # Check if we found any exact matches
-            row_idx = df.index[mask][0]
-            for col, val in value.items():
-                if col in df.columns:
-                    df.at[row_idx, col] = val
-        else:
-            value['date_created'] = value.get('date_created', value['date_updated'])
-            df = pd.concat([df, pd.DataFrame([value])], ignore_index=True)
+        Args:
+            values: Mapping of key to row values
+        """
+        df = self._read_df().copy()
+        now = datetime.now().isoformat()
+        new_rows = []
+        
+        for key, value in values.items():
+            value[self.key_column] = key
+            value['date_updated'] = now
+            
+            # Update existing or collect new rows to append at once
+            row_idx = self._index.get(key)
+            if row_idx is not None:
+                for col, val in value.items():
+                    if col in df.columns:
+                        df.at[row_idx, col] = val
+            else:
+                value['date_created'] = value.get('date_created', value['date_updated'])
+                new_rows.append(value)
+        
+        if new_rows:
+            df = pd.concat([df, pd.DataFrame(new_rows)], ignore_index=True)
             
         self._write_df(df)
         
@@ -1,8 +1,9 @@
 import logging
 import os
+import time
 from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from platformdirs import user_documents_dir
 
@@ -26,12 +27,23 @@ class JobHistoryStorage(CSVStorageService):
             data_class=JobHistoryEntry,
             backup_enabled=True
         )
+        # Search results keyed by search parameters, stored with the data version and time they were computed
+        self._search_cache: Dict[Tuple, Tuple[int, float, List[JobHistoryEntry]]] = {}
             
     async def add_or_update_job(self, entry: JobHistoryEntry) -> None:
         """Add or update a job in the history"""
         entry.date_updated = datetime.now().isoformat()
         await self.set(entry.job_id, asdict(entry))
         
+    async def add_or_update_jobs(self, entries: List[JobHistoryEntry]) -> None:
+        """Add or update multiple jobs in the history with a single write"""
+        now = datetime.now().isoformat()
+        values = {}
+        for entry in entries:
+            entry.date_updated = now
+            values[entry.job_id] = asdict(entry)  # Later updates of the same job win
+        await self.set_many(values)
+        
     async def update_application_status(self, job_id: str, status: str, notes: str = "") -> None:
         """Update application status and add notes"""
         entry = await self.get_job(job_id)
@@ -83,7 +95,23 @@ class JobHistoryStorage(CSVStorageService):
         return JobHistoryEntry(**data) if data else None
             
     async def search_jobs(self, query: str = "", status: str = None, days: int = None) -> List[JobHistoryEntry]:
-        """Search jobs with text query and/or status filter"""
+        """Search jobs with text query and/or status filter.
+        
+        Results are reused until the history is written or the TTL expires (the date cutoff moves with time).
+        """
+        cache_key = (query, status, days)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            version, computed_at, entries = cached
+            if version == self._version and time.monotonic() - computed_at < STORAGE_SETTINGS['history_search_ttl']:
+                return list(entries)
+                
+        entries = await self._search_jobs(query, status, days)
+        self._search_cache[cache_key] = (self._version, time.monotonic(), entries)
+        return list(entries)
+        
+    async def _search_jobs(self, query: str, status: Optional[str], days: Optional[int]) -> List[JobHistoryEntry]:
+        """Run a job search against the stored history"""
         filter_params = {}
         if status:
             filter_params['application_status'] = status
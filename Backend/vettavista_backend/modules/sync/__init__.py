@@ -1,5 +1,6 @@
 from vettavista_backend.modules.sync.base import SyncManager
+from vettavista_backend.modules.sync.debounced_broadcaster import DebouncedBroadcaster
 from vettavista_backend.modules.sync.websocket_manager import WebSocketSyncManager
 
-__all__ = ['SyncManager', 'WebSocketSyncManager']
+__all__ = ['SyncManager', 'WebSocketSyncManager', 'DebouncedBroadcaster']
 
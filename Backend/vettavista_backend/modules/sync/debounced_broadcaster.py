@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from vettavista_backend.modules.sync.base import DataBroadcaster
+
+logger = logging.getLogger(__name__)
+
+class DebouncedBroadcaster(DataBroadcaster):
+    """Broadcaster that coalesces updates arriving in a short window into a single broadcast"""
+
+    # Topics whose values are lists of changes and are concatenated. Other topics are snapshots, the latest one wins.
+    LIST_TOPICS = frozenset({"history_upsert"})
+
+    def __init__(self, broadcaster: DataBroadcaster, max_interval: float = 0.05, max_pending: int = 256):
+        """Initialize the debounced broadcaster
+
+        Args:
+            broadcaster: Broadcaster that receives the coalesced updates
+            max_interval: Maximum seconds an update waits before being broadcast
+            max_pending: Number of pending updates that triggers an immediate broadcast
+        """
+        self._broadcaster = broadcaster
+        self._max_interval = max_interval
+        self._max_pending = max_pending
+        self._pending: Dict = {}
+        self._pending_count = 0
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def broadcast_update(self, data: Dict) -> None:
+        """Merge the update into the pending broadcast"""
+        for topic, value in data.items():
+            if topic in self.LIST_TOPICS:
+                self._pending.setdefault(topic, []).extend(value)
+            else:
+                self._pending[topic] = value
+        self._pending_count += 1
+
+        if self._pending_count >= self._max_pending:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Broadcast all pending updates now"""
+        if not self._pending:
+            return
+        data, self._pending, self._pending_count = self._pending, {}, 0
+        await self._broadcaster.broadcast_update(data)
+
+    async def _flush_later(self) -> None:
+        """Flush pending updates after the debounce interval"""
+        await asyncio.sleep(self._max_interval)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Error broadcasting coalesced update: {e}")
@@ -1,10 +1,10 @@
+import asyncio
 import logging
 from typing import Dict, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 from vettavista_backend.modules.sync.base import SyncManager, DataBroadcaster
 from vettavista_backend.modules.storage import BlacklistStorage, JobHistoryStorage
-from vettavista_backend.modules.utils import DataClassJSONEncoder
-import json
+from vettavista_backend.modules.utils import dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,7 @@ class WebSocketSyncManager(SyncManager, DataBroadcaster):
         self.active_connections: Dict[str, WebSocket] = {}
         self.blacklist_storage = blacklist_storage
         self.job_history_storage = job_history_storage
+        self._snapshot_task: Optional[asyncio.Task] = None
         
     async def register_client(self, client_id: str, websocket: WebSocket) -> None:
         """Register a new client connection."""
@@ -41,15 +42,44 @@ class WebSocketSyncManager(SyncManager, DataBroadcaster):
             
     async def broadcast_update(self, data: Dict) -> None:
         """Broadcast message to all connected clients."""
-        message = {"type": "sync_response", "data": data}
+        # Serialize once for all clients, this also handles dataclasses and enums
+        message_text = dumps_json({"type": "sync_response", "data": data})
         for client_id, websocket in self.active_connections.items():
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(message_text)
                 logger.info(f"Update broadcast to client {client_id}")
             except Exception as e:
                 logger.error(f"Error broadcasting to client {client_id}: {e}")
                 # Don't raise here to continue broadcasting to other clients
                 
+    def start_snapshot_scheduler(self, interval: int) -> None:
+        """Start periodically broadcasting the full state so clients can reconcile missed deltas
+        
+        Args:
+            interval: Snapshot interval in seconds
+        """
+        if self._snapshot_task is None:
+            self._snapshot_task = asyncio.create_task(self._broadcast_snapshots(interval))
+            logger.info("Started sync snapshot scheduler")
+
+    def stop_snapshot_scheduler(self) -> None:
+        """Stop the snapshot scheduler"""
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+            logger.info("Stopped sync snapshot scheduler")
+
+    async def _broadcast_snapshots(self, interval: int) -> None:
+        """Periodically broadcast the full state to all connected clients"""
+        while True:
+            await asyncio.sleep(interval)
+            if not self.active_connections:
+                continue
+            try:
+                await self.broadcast_update(await self.get_client_state("snapshot"))
+            except Exception as e:
+                logger.error(f"Failed to broadcast sync snapshot: {e}")
+
     async def get_client_state(self, client_id: str) -> Dict:
         """Get the current state for a client."""
         try:
@@ -57,27 +87,12 @@ class WebSocketSyncManager(SyncManager, DataBroadcaster):
             blacklist = await self.blacklist_storage.get_all_companies()
             history = await self.job_history_storage.search_jobs(days=30)
             
-            # Create response data
-            data = {
+            # Dataclasses and enums are serialized by broadcast_update
+            return {
                 "blacklist": blacklist,
                 "history": history
             }
             
-            # Convert to JSON-serializable format and validate
-            try:
-                json_data = json.loads(
-                    json.dumps(data, cls=DataClassJSONEncoder)
-                )
-                logger.info(f"Prepared sync data: {json_data}")
-                return json_data
-            except Exception as e:
-                logger.error(f"JSON serialization error: {e}")
-                # Return empty lists as fallback
-                return {
-                    "blacklist": [],
-                    "history": []
-                }
-            
         except Exception as e:
             logger.error(f"Error getting state for client {client_id}: {e}")
             raise
@@ -1,11 +1,17 @@
-import json
 import re
-from dataclasses import is_dataclass, asdict, fields
+import sys
+from dataclasses import is_dataclass, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type, TypeVar
 from urllib.parse import urlparse
 
+import orjson
+
+# Matches numbers with optional thousands separators, e.g. "201" or "10,001"
+EMPLOYEE_COUNT_PATTERN = re.compile(r'\d{1,3}(?:,\d{3})*')
+
 
 def parse_employee_count(size_str: str) -> tuple[int, int]:
     """Parse employee count range from string like '201-500 employees' or '10,001+ employees'
@@ -20,7 +26,7 @@ def parse_employee_count(size_str: str) -> tuple[int, int]:
         return 0, 0
             
     # Extract numbers using regex, now supporting commas and looking for + suffix
-    number_strings = re.findall(r'\d{1,3}(?:,\d{3})*', size_str)
+    number_strings = EMPLOYEE_COUNT_PATTERN.findall(size_str)
     if not number_strings:
         return 0, 0
             
@@ -93,27 +99,25 @@ def _block_base_methods(cls, blocked_methods, allowed_methods):
         # If neither is specified, block all base methods
         blocked_methods = all_base_methods
 
-    def __getattribute__(self, name):
-        if name.startswith('_'):
-            return original_getattribute(self, name)
+    # Only base methods that the class doesn't override can be blocked, resolve them once here
+    guarded_methods = frozenset(
+        name for name in blocked_methods
+        if name not in cls.__dict__ and any(hasattr(base, name) for base in base_classes)
+    )
 
+    def __getattribute__(self, name):
         attr = original_getattribute(self, name)
 
-        # Check if it's an external call
-        import inspect
-        frame = inspect.currentframe()
-        is_internal = frame.f_back.f_locals.get('self', None) is self
+        # Fast path: frames are only inspected when accessing a guarded base method
+        if name not in guarded_methods or not callable(attr):
+            return attr
 
         # Block if it's an external call to a blocked base method
+        is_internal = sys._getframe(1).f_locals.get('self', None) is self
         if not is_internal:
-            is_base_method = any(hasattr(base, name) for base in base_classes)
-            if (callable(attr) and
-                    is_base_method and
-                    name in blocked_methods and
-                    not name in cls.__dict__):
-                raise AttributeError(
-                    f"Cannot call base class method '{name}' directly"
-                )
+            raise AttributeError(
+                f"Cannot call base class method '{name}' directly"
+            )
 
         return attr
 
@@ -121,43 +125,71 @@ def _block_base_methods(cls, blocked_methods, allowed_methods):
     cls._blocked_methods = blocked_methods
     return cls
 
-class DataClassJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if is_dataclass(obj):
-            return asdict(obj)
-        if isinstance(obj, Enum):
-            return obj.value
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+def _json_default(obj):
+    """Fallback for types orjson doesn't serialize natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, float):
+        return float(obj)  # Subclasses like numpy.float64, orjson only serializes exact floats
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps_json(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string with orjson, which handles dataclasses, enums and datetimes natively.
+    Indented output uses two spaces."""
+    return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else None).decode()
 
 T = TypeVar('T')
 
+# Field kinds of a dataclass, used as indices into _FIELD_HANDLERS
+_PASSTHROUGH, _NESTED_DATACLASS, _ENUM, _DATETIME = range(4)
+
+def _decode_nested(value: Any, field_type: Type) -> Any:
+    return decode_dataclass(field_type, value) if isinstance(value, dict) else value
+
+def _decode_enum(value: Any, field_type: Type) -> Any:
+    return field_type(value) if isinstance(value, str) else value
+
+def _decode_datetime(value: Any, field_type: Type) -> Any:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+_FIELD_HANDLERS = (None, _decode_nested, _decode_enum, _decode_datetime)
+
+@lru_cache(maxsize=None)
+def _get_field_kinds(cls: Type) -> Dict[str, Tuple[int, Type]]:
+    """Classify the fields of a dataclass once, mapping field name to (kind, type)"""
+    field_kinds = {}
+    for f in fields(cls):
+        field_type = f.type
+        # Handle nested dataclasses
+        if is_dataclass(field_type):
+            kind = _NESTED_DATACLASS
+        # Handle enums
+        elif isinstance(field_type, type) and issubclass(field_type, Enum):
+            kind = _ENUM
+        # Handle datetime
+        elif field_type == datetime:
+            kind = _DATETIME
+        else:
+            kind = _PASSTHROUGH
+        field_kinds[f.name] = (kind, field_type)
+    return field_kinds
+
 def decode_dataclass(cls: Type[T], data: Dict[str, Any]) -> T:
     """Recursively decode dictionary into dataclass instance"""
     if not is_dataclass(cls):
         return data
         
-    fieldtypes = {f.name: f.type for f in fields(cls)}
+    field_kinds = _get_field_kinds(cls)
     decoded_data = {}
     
     for key, value in data.items():
-        if key not in fieldtypes:
+        spec = field_kinds.get(key)
+        if spec is None:
             continue
-            
-        field_type = fieldtypes[key]
-        
-        # Handle nested dataclasses
-        if is_dataclass(field_type) and isinstance(value, dict):
-            decoded_data[key] = decode_dataclass(field_type, value)
-        # Handle enums
-        elif isinstance(field_type, type) and issubclass(field_type, Enum) and isinstance(value, str):
-            decoded_data[key] = field_type(value)
-        # Handle datetime
-        elif field_type == datetime and isinstance(value, str):
-            decoded_data[key] = datetime.fromisoformat(value)
-        else:
-            decoded_data[key] = value
+        kind, field_type = spec
+        decoded_data[key] = value if kind == _PASSTHROUGH else _FIELD_HANDLERS[kind](value, field_type)
             
     return cls(**decoded_data)
 
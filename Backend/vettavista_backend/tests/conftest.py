@@ -1,10 +1,37 @@
+import copy
+import orjson
+import pytest
+from functools import lru_cache
 from typing import Dict, Any, List
-from config import ResumeModel, ProjectEntry, ExperienceEntry
-from datetime import datetime, date
+from unittest.mock import AsyncMock, MagicMock
+from config import ResumeModel, ProjectEntry, ExperienceEntry, Education
+from datetime import datetime
 
-def create_test_resume(**kwargs) -> ResumeModel:
-    """Create a ResumeModel instance with test data"""
+def loads_json(raw):
+    """Parse a JSON payload sent by the server"""
+    return orjson.loads(raw)
+
+
+@pytest.fixture
+def mock_websocket():
+    """WebSocket mock keeping the parsed payloads it was sent in websocket.sent"""
+    # Only the methods the endpoints use are mocked, a spec would introspect the whole WebSocket class
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.receive_json = AsyncMock()
+    websocket.sent = []
+    async def _send(text):
+        websocket.sent.append(loads_json(text))
+    websocket.send_text = AsyncMock(side_effect=_send)
+    return websocket
+
+
+def _build_test_resume(**kwargs) -> ResumeModel:
+    """Build a ResumeModel instance with test data"""
     defaults = {
+        'website': 'https://example.com',
+        'linkedIn': 'https://www.linkedin.com/in/test-user',
         'skills': {
             'Programming Languages': ['Python', 'JavaScript'],
             'Frameworks': ['FastAPI', 'React'],
@@ -26,20 +53,41 @@ def create_test_resume(**kwargs) -> ResumeModel:
                 details=["Developed test functionality", "Implemented test features"]
             )
         ],
-        'preferred_titles': ['Software Engineer', 'Developer'],
-        'bad_words': [],
-        'skip_required_skill': [],
         'highest_degree': 'Bachelor',
         'educations': [
-            {
-                'degree': 'Bachelor of Science',
-                'major': 'Computer Science',
-                'school': 'Test University',
-                'graduation': date(2020, 1, 1)
-            }
+            Education(
+                degree='Bachelor of Science in Computer Science',
+                university='Test University',
+                extra='',
+                start=datetime(2016, 9, 1),
+                graduation=datetime(2020, 1, 1)
+            )
         ],
         'did_masters': False,
         'cover_letter_template': 'Dear Hiring Manager,\n\nTest template.'
     }
     defaults.update(kwargs)
-    return ResumeModel(**defaults) 
\ No newline at end of file
+    return ResumeModel(**defaults)
+
+
+@lru_cache(maxsize=1)
+def _default_test_resume() -> ResumeModel:
+    return _build_test_resume()
+
+
+def create_test_resume(**kwargs) -> ResumeModel:
+    """Create a ResumeModel instance with test data. Without overrides the same cached instance is returned."""
+    if not kwargs:
+        return _default_test_resume()
+    return _build_test_resume(**kwargs)
+
+
+def create_test_resume_copy() -> ResumeModel:
+    """Shallow copy of the default test resume, for tests that need their own instance"""
+    return copy.copy(_default_test_resume())
+
+
+@pytest.fixture(scope="session")
+def test_resume() -> ResumeModel:
+    """Default test resume, shared since ResumeModel is frozen"""
+    return create_test_resume()
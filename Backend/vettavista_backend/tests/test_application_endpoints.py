@@ -5,13 +5,13 @@ from fastapi.testclient import TestClient
 from fastapi import status, FastAPI
 from unittest.mock import AsyncMock, patch, MagicMock
 
-from config.global_constants import STORAGE_SETTINGS
-from modules.api.rest.application_endpoints import ApplicationEndpoints
-from modules.business.application.application_service import ApplicationService
-from modules.models.services import ApplyType
-from modules.business.cache.job_cache_service import JobCacheService
-from modules.storage.job_history_storage import JobHistoryStorage
-from modules.editor.manager import EditorManager
+from vettavista_backend.config.global_constants import STORAGE_SETTINGS
+from vettavista_backend.modules.api.rest.application_endpoints import ApplicationEndpoints
+from vettavista_backend.modules.business.application.application_service import ApplicationService
+from vettavista_backend.modules.models.services import ApplyType
+from vettavista_backend.modules.business.cache.job_cache_service import JobCacheService
+from vettavista_backend.modules.storage.job_history_storage import JobHistoryStorage
+from vettavista_backend.modules.editor.manager import EditorManager
 
 @pytest.fixture
 def temp_job_history_file():
@@ -22,7 +22,7 @@ def temp_job_history_file():
 
 @pytest.fixture
 def job_history(temp_job_history_file):
-    with patch('Auto_job_applier_linkedIn.modules.storage.job_history_storage.STORAGE_SETTINGS', 
+    with patch('vettavista_backend.modules.storage.job_history_storage.STORAGE_SETTINGS', 
               {'history_file': temp_job_history_file}):
         return JobHistoryStorage()
 
@@ -30,7 +30,7 @@ def job_history(temp_job_history_file):
 def job_cache():
     return JobCacheService()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_application_service():
     service = MagicMock(spec=ApplicationService)
     service.handle_apply = AsyncMock()
@@ -38,6 +38,12 @@ def mock_application_service():
     service.start_cover_letter_phase = AsyncMock()
     return service
 
+@pytest.fixture(autouse=True)
+def _reset_application_service(mock_application_service):
+    """Reset the shared service mock after each test"""
+    yield
+    mock_application_service.reset_mock(return_value=True, side_effect=True)
+
 @pytest.fixture
 def application_service(job_cache, job_history):
     return ApplicationService(
@@ -45,17 +51,18 @@ def application_service(job_cache, job_history):
         job_history=job_history
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def application_endpoints(mock_application_service):
     return ApplicationEndpoints(mock_application_service)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_client(application_endpoints):
+    # One app and client for the module, the routes don't change between tests
     app = FastAPI()
     app.include_router(application_endpoints.router)
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
-@pytest.mark.asyncio
 async def test_apply_for_job(test_client, mock_application_service):
     # Setup
     job_id = "test-job"
@@ -77,7 +84,6 @@ async def test_apply_for_job(test_client, mock_application_service):
     assert "editor_url" in response.json()
     mock_application_service.handle_apply.assert_called_once_with(job_id, apply_type)
 
-@pytest.mark.asyncio
 async def test_finalize_application(test_client, mock_application_service):
     # Setup
     session_id = "test-session"
@@ -91,7 +97,6 @@ async def test_finalize_application(test_client, mock_application_service):
     # Not implemented yet
     # mock_application_service.finalize_application.assert_called_once_with(session_id, content)
 
-@pytest.mark.asyncio
 async def test_handle_cover_letter_phase(test_client, mock_application_service):
     # Setup
     session_id = "test-session"
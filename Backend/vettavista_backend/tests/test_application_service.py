@@ -1,22 +1,21 @@
 import pytest
-import tempfile
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
-from config import resume
+from vettavista_backend.config import resume
 
-from modules.editor.types import ServerMessage, MessageType, PhaseData
-from modules.models.services import ApplyType, ProcessingStatus, ApplicationPhase, ActiveTask, JobDetailedInfo, \
+from vettavista_backend.modules.editor.types import MessageType
+from vettavista_backend.modules.models.services import ApplyType, ProcessingStatus, ApplicationPhase, ActiveTask, JobDetailedInfo, \
     CustomizedContent, GlassdoorRating
-from modules.ai.protocols import ClaudeServiceProtocol
-from modules.business.application.application_service import ApplicationService
-from modules.storage.job_history_storage import JobHistoryStorage
-from modules.editor.manager import EditorManager
+from vettavista_backend.modules.ai.protocols import ClaudeServiceProtocol
+from vettavista_backend.modules.business.application import application_service as application_service_module
+from vettavista_backend.modules.business.application.application_service import ApplicationService
+from vettavista_backend.modules.storage.job_history_storage import JobHistoryStorage
+from vettavista_backend.modules.editor.manager import EditorManager
 
-from config.global_constants import STORAGE_SETTINGS
-from tests.conftest import create_test_resume
+from vettavista_backend.config.global_constants import STORAGE_SETTINGS
 
+# Mocks are built once per module and reset between tests by _reset_mocks
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_job_info():
     return JobDetailedInfo(
         jobId="test-job",
@@ -31,35 +30,69 @@ def mock_job_info():
         glassdoorRating=GlassdoorRating(rating=3., reviewCount=10, isValid=False)
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_broadcaster():
-    # Create a basic mock object
+    # Broadcasts are never asserted on, so a plain coroutine function is enough
+    async def broadcast_update(data):
+        pass
+
     mock = MagicMock()
-    # Attach an AsyncMock for the async method
-    mock.broadcast_update = AsyncMock()
+    mock.broadcast_update = broadcast_update
     return mock
 
-@pytest.fixture
-def mock_claude():
-    mock = MagicMock(spec=ClaudeServiceProtocol)
-    mock.customize_resume = AsyncMock()
-    mock.customize_cover_letter = AsyncMock()
-    return mock
+class StubClaude:
+    """Plain ClaudeServiceProtocol stub that records calls and returns the configured results"""
 
-@pytest.fixture
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.calls = []
+        self.resume_result = None
+        self.cover_letter_result = None
+
+    async def customize_resume(self, *args, **kwargs):
+        self.calls.append(("customize_resume", args, kwargs))
+        return self.resume_result
+
+    async def customize_cover_letter(self, *args, **kwargs):
+        self.calls.append(("customize_cover_letter", args, kwargs))
+        return self.cover_letter_result
+
+    async def batch_extract_job_info(self, *args, **kwargs):
+        self.calls.append(("batch_extract_job_info", args, kwargs))
+
+    def assert_called_once(self, name: str):
+        count = sum(1 for call in self.calls if call[0] == name)
+        assert count == 1, f"Expected {name} to be called once. Called {count} times."
+
+@pytest.fixture(scope="module")
+def mock_claude() -> ClaudeServiceProtocol:
+    return StubClaude()
+
+@pytest.fixture(scope="module")
 def mock_job_cache():
+    async def set_job_info(*args, **kwargs):
+        pass
+
+    async def get_cover_letter(*args, **kwargs):
+        return None  # No cached Claude output, so cover letters are generated
+
     cache = AsyncMock()
+    # get_job_info stays an AsyncMock since tests set its return value and assert on it
     cache.get_job_info = AsyncMock()
-    cache.set_job_info = AsyncMock()
+    cache.set_job_info = set_job_info
+    cache.get_cover_letter = get_cover_letter
     return cache
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_job_history():
     history = MagicMock()
     history.add_or_update_job = AsyncMock()
+    history.search_jobs = AsyncMock(return_value=[])
     return history
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_editor_manager():
     manager = MagicMock(spec=EditorManager)
     manager.active_tasks = {}
@@ -67,8 +100,18 @@ def mock_editor_manager():
     manager.broadcast_update = AsyncMock()
     return manager
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_broadcaster, mock_claude, mock_job_cache, mock_job_history, mock_editor_manager):
+    """Reset the shared module mocks after each test"""
+    yield
+    for mock in (mock_broadcaster, mock_job_cache, mock_job_history, mock_editor_manager):
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_claude.reset()
+    mock_editor_manager.active_tasks.clear()
+
+@pytest.fixture(scope="module")
 def application_service(mock_job_cache, mock_job_history, mock_editor_manager, mock_broadcaster, mock_claude):
+    # ApplicationService only stores references, so one instance per module is enough
     return ApplicationService(
         job_cache=mock_job_cache,
         job_history=mock_job_history,
@@ -78,38 +121,62 @@ def application_service(mock_job_cache, mock_job_history, mock_editor_manager, m
     )
 
 @pytest.fixture
-async def active_application(application_service, mock_job_cache, mock_claude, mock_job_info) -> str:
+async def active_application(application_service, mock_job_cache, mock_claude, mock_job_info, test_resume) -> str:
     """Fixture to create an active application and return its session ID"""
-    mock_resume = create_test_resume()
-    mock_claude.customize_resume.return_value = (mock_resume, mock_resume)
+    mock_claude.resume_result = (test_resume, test_resume)
     mock_job_cache.get_job_info.return_value = mock_job_info
     
     result = await application_service.handle_apply("test-job", ApplyType.EASY)
     return result["session_id"]
 
 @pytest.fixture
-def temp_job_history_file():
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_path = temp_file.name
-    yield temp_path
-    # Clean up after test
-    Path(temp_path).unlink(missing_ok=True)
+def primed_task(request, application_service):
+    """Register an active task and return its session ID and the task.
+    Parametrize indirectly with a dict to override ActiveTask fields."""
+    session_id = "test-session"
+    fields = dict(
+        job_id="test-job",
+        apply_type=ApplyType.EASY,
+        status=ProcessingStatus.COMPLETED,
+        current_phase=ApplicationPhase.RESUME,
+        resume_data=CustomizedContent(
+            original="\\documentclass{article}\n\\begin{document}\nOriginal Resume\n\\end{document}",
+            customized="\\documentclass{article}\n\\begin{document}\nCustomized Resume\n\\end{document}"
+        )
+    )
+    fields.update(getattr(request, "param", {}))
+    task = ActiveTask(**fields)
+    application_service._editor_manager.active_tasks[session_id] = task
+    return session_id, task
+
+@pytest.fixture
+def finalize_io(application_service, tmp_path, monkeypatch):
+    """Stub PDF generation, file copies and the file browser, finalized files go to tmp_path"""
+    monkeypatch.setattr(application_service, 'finalized_dir', str(tmp_path))
+    monkeypatch.setattr(application_service._resume_generator, 'generate_pdf_from_latex',
+                        MagicMock(return_value="resume.pdf"))
+    monkeypatch.setattr(application_service._cover_letter_generator, 'generate_pdf_from_text',
+                        MagicMock(return_value="cover_letter.pdf"))
+    monkeypatch.setattr(application_service_module.shutil, 'copy2', MagicMock())
+    monkeypatch.setattr(application_service_module.subprocess, 'Popen', MagicMock())
+
+@pytest.fixture
+def temp_job_history_file(tmp_path):
+    # pytest cleans up tmp_path, the file itself is created by the storage
+    return str(tmp_path / "history.csv")
 
 @pytest.fixture
 def job_history(temp_job_history_file):
-    with patch('modules.storage.job_history_storage.STORAGE_SETTINGS', 
-              {'history_file': temp_job_history_file}):
+    with patch('vettavista_backend.modules.storage.job_history_storage.STORAGE_SETTINGS', 
+              {**STORAGE_SETTINGS, 'history_file': temp_job_history_file}):
         return JobHistoryStorage()
 
 class TestHandleApply:
-    @pytest.mark.asyncio
-    async def test_handle_apply_creates_task(self, application_service, mock_claude):
+    async def test_handle_apply_creates_task(self, application_service, mock_claude, test_resume):
         """Test that handle_apply creates a task with correct initial state"""
         # Setup
         job_id = "test-job"
-        mock_resume = create_test_resume()
-        mock_claude.customize_resume.return_value = (mock_resume, mock_resume)
+        mock_claude.resume_result = (test_resume, test_resume)
         
         # Test
         result = await application_service.handle_apply(job_id, ApplyType.EASY)
@@ -122,13 +189,11 @@ class TestHandleApply:
         assert task.status == ProcessingStatus.PENDING
         assert task.current_phase == ApplicationPhase.RESUME
 
-    @pytest.mark.asyncio
-    async def test_handle_apply_creates_editor_session(self, application_service, mock_editor_manager, mock_claude, mock_job_info):
+    async def test_handle_apply_creates_editor_session(self, application_service, mock_editor_manager, mock_claude, mock_job_info, test_resume):
         """Test that handle_apply properly initializes editor session"""
         # Setup
         job_id = "test-job"
-        mock_resume = create_test_resume()
-        mock_claude.customize_resume.return_value = (mock_resume, mock_resume)
+        mock_claude.resume_result = (test_resume, test_resume)
         application_service._job_cache.get_job_info.return_value = mock_job_info
         
         # Test
@@ -139,13 +204,11 @@ class TestHandleApply:
         call_args = mock_editor_manager.create_session.call_args[1]
         assert call_args["session_id"] == result["session_id"]
 
-    @pytest.mark.asyncio
-    async def test_handle_apply_caches_job_info(self, application_service, mock_job_cache, mock_claude):
+    async def test_handle_apply_caches_job_info(self, application_service, mock_job_cache, mock_claude, test_resume):
         """Test that handle_apply caches job information"""
         # Setup
         job_id = "test-job"
-        mock_resume = create_test_resume()
-        mock_claude.customize_resume.return_value = (mock_resume, mock_resume)
+        mock_claude.resume_result = (test_resume, test_resume)
         
         # Test
         await application_service.handle_apply(job_id, ApplyType.EASY)
@@ -154,24 +217,11 @@ class TestHandleApply:
         mock_job_cache.get_job_info.assert_called_once_with(job_id)
 
 class TestStartCoverLetterPhase:
-    @pytest.mark.asyncio
-    async def test_start_cover_letter_phase_updates_task(self, application_service, mock_claude):
+    async def test_start_cover_letter_phase_updates_task(self, application_service, mock_claude, primed_task):
         """Test that start_cover_letter_phase updates task state correctly"""
         # Setup
-        session_id = "test-session"
-        job_id = "test-job"
-        mock_resume = create_test_resume()
-        application_service._editor_manager.active_tasks[session_id] = ActiveTask(
-            job_id=job_id,
-            apply_type=ApplyType.EASY,
-            status=ProcessingStatus.COMPLETED,
-            current_phase=ApplicationPhase.RESUME,
-            resume_data=CustomizedContent(
-                original="Main letter content",
-                customized="Main letter content"
-            )
-        )
-        mock_claude.customize_cover_letter.return_value = "test letter"
+        session_id, _ = primed_task
+        mock_claude.cover_letter_result = "test letter"
         
         # Test
         result = await application_service.start_cover_letter_phase(session_id)
@@ -181,67 +231,39 @@ class TestStartCoverLetterPhase:
         task = application_service._editor_manager.active_tasks[session_id]
         assert task.current_phase == ApplicationPhase.COVER_LETTER
 
-    @pytest.mark.asyncio
     async def test_start_cover_letter_phase_invalid_session(self, application_service):
         """Test that start_cover_letter_phase handles invalid session IDs"""
         with pytest.raises(ValueError, match="No task found for session"):
             await application_service.start_cover_letter_phase("invalid-session")
 
-    @pytest.mark.asyncio
     async def test_start_cover_letter_phase_broadcasts_update(
-        self, application_service, mock_editor_manager, mock_claude
+        self, application_service, mock_editor_manager, mock_claude, mock_job_info, primed_task
     ):
         """Test that phase change is broadcast to editor"""
         # Setup
-        session_id = "test-session"
-        job_id = "test-job"
-        mock_resume = create_test_resume()
-        application_service._editor_manager.active_tasks[session_id] = ActiveTask(
-            job_id=job_id,
-            apply_type=ApplyType.EASY,
-            status=ProcessingStatus.COMPLETED,
-            current_phase=ApplicationPhase.RESUME,
-            resume_data=CustomizedContent(
-                original="\\documentclass{article}\n\\begin{document}\nOriginal Resume\n\\end{document}",
-                customized="\\documentclass{article}\n\\begin{document}\nCustomized Resume\n\\end{document}"
-            )
-        )
-        mock_claude.customize_cover_letter.return_value = "test letter"
+        session_id, _ = primed_task
+        mock_claude.cover_letter_result = "test letter"
+        application_service._job_cache.get_job_info.return_value = mock_job_info
         
         # Test
         await application_service.start_cover_letter_phase(session_id)
         
-        # Verify
-        mock_editor_manager.broadcast_update.assert_called_once_with(
-            ServerMessage(
-                type=MessageType.PHASE_CHANGE,
-                phase=ApplicationPhase.COVER_LETTER,
-                phase_data=PhaseData(
-                    original=resume.cover_letter_template,  # Use actual template
-                    customized="test letter"
-                )
-            )
-        )
+        # Verify, the generated body is wrapped in the letter header and footer
+        mock_editor_manager.broadcast_update.assert_called_once()
+        message = mock_editor_manager.broadcast_update.call_args[0][0]
+        assert message.type == MessageType.PHASE_CHANGE
+        assert message.phase == ApplicationPhase.COVER_LETTER
+        assert message.phase_data.original == resume.cover_letter_template
+        assert "test letter" in message.phase_data.customized
+        assert mock_job_info.company in message.phase_data.customized
 
 class TestFinalizeApplication:
-    @pytest.mark.asyncio
-    async def test_finalize_updates_job_history(self, application_service, mock_job_history, mock_job_info):
+    @pytest.mark.parametrize("primed_task", [{"current_phase": ApplicationPhase.COVER_LETTER}], indirect=True)
+    async def test_finalize_updates_job_history(self, application_service, mock_job_history, mock_job_info, primed_task, finalize_io):
         """Test that finalize_application updates job history"""
         # Setup
-        session_id = "test-session"
-        job_id = "test-job"
-        mock_resume = create_test_resume()
-        application_service._editor_manager.active_tasks[session_id] = ActiveTask(
-            job_id=job_id,
-            apply_type=ApplyType.EASY,
-            status=ProcessingStatus.COMPLETED,
-            current_phase=ApplicationPhase.COVER_LETTER,
-            resume_data={
-                'customized': mock_resume,
-                'original': mock_resume
-            },
-            cover_letter_data="test cover letter"
-        )
+        session_id, task = primed_task
+        task.cover_letter_data = CustomizedContent(original="template", customized="test cover letter")
         application_service._job_cache.get_job_info.return_value = mock_job_info
         
         # Test
@@ -250,30 +272,17 @@ class TestFinalizeApplication:
         # Verify
         mock_job_history.add_or_update_job.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_finalize_invalid_session(self, application_service):
         """Test that finalize_application handles invalid session IDs"""
         with pytest.raises(ValueError, match="No task found for session"):
             await application_service.finalize_application("invalid-session", "content")
 
-    @pytest.mark.asyncio
-    async def test_finalize_updates_task_status(self, application_service, mock_job_info):
+    @pytest.mark.parametrize("primed_task", [{"status": ProcessingStatus.PROCESSING, "current_phase": ApplicationPhase.COVER_LETTER}], indirect=True)
+    async def test_finalize_updates_task_status(self, application_service, mock_job_info, primed_task, finalize_io):
         """Test that finalize_application updates task status correctly"""
         # Setup
-        session_id = "test-session"
-        job_id = "test-job"
-        mock_resume = create_test_resume()
-        application_service._editor_manager.active_tasks[session_id] = ActiveTask(
-            job_id=job_id,
-            apply_type=ApplyType.EASY,
-            status=ProcessingStatus.PROCESSING,
-            current_phase=ApplicationPhase.COVER_LETTER,
-            resume_data={
-                'customized': mock_resume,
-                'original': mock_resume
-            },
-            cover_letter_data="test cover letter"
-        )
+        session_id, task = primed_task
+        task.cover_letter_data = CustomizedContent(original="template", customized="test cover letter")
         application_service._job_cache.get_job_info.return_value = mock_job_info
         
         # Test
@@ -0,0 +1,89 @@
+import orjson
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from vettavista_backend.modules.ai import claude_connections
+from vettavista_backend.modules.ai.claude_connections import ClaudeService
+from vettavista_backend.modules.ai.llm_cache import LLMCache
+from vettavista_backend.modules.models.services import VisaSupport
+
+_VALID_RESPONSE = orjson.dumps({
+    "skills": {"frameworks": ["FastAPI"]},
+    "experience": {"years": 3, "months": 0, "is_minimum": True, "context": "3+ years"},
+    "red_flags": {"score": 0, "reasons": []},
+    "supports_visa": "UNKNOWN"
+}).decode()
+
+# Long enough to be extracted, different so each job gets its own cache key
+_JOBS = [(f"Job {i} description. " * 20, "ENGLISH") for i in range(3)]
+
+
+def _entry(custom_id, result_type, text=None):
+    # With thinking enabled the answer is the second content block, so both blocks hold the text
+    message = SimpleNamespace(content=[SimpleNamespace(text=text), SimpleNamespace(text=text)])
+    return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type=result_type, message=message))
+
+
+class StubBatches:
+    """Stands in for anthropic.messages.batches, the batch reports the given status when retrieved"""
+
+    def __init__(self, status, entries=()):
+        self.status = status
+        self.entries = list(entries)
+        self.requests = None
+        self.cancel = AsyncMock()
+
+    async def create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status=self.status)
+
+    async def results(self, batch_id):
+        async def entries():
+            for entry in self.entries:
+                yield entry
+        return entries()
+
+
+@pytest.fixture
+def claude_service(tmp_path):
+    service = ClaudeService()
+    service.llm_cache = LLMCache(tmp_path)
+    # Fallback extraction of single jobs, records which jobs were not taken from the batch
+    service.batch_extract_job_info = AsyncMock(return_value="fallback")
+    with patch.object(claude_connections, 'BATCH_POLL_INTERVAL', 0):
+        yield service
+
+
+async def test_batch_results_are_used_and_failed_entries_extracted_again(claude_service):
+    batches = StubBatches("ended", [
+        _entry("0", "succeeded", _VALID_RESPONSE),
+        _entry("1", "errored"),
+        _entry("2", "succeeded", "no json here"),
+    ])
+    claude_service.anthropic = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+    results = await claude_service.batch_extract_many(_JOBS)
+
+    assert len(batches.requests) == 3
+    skills, exp, red_flags, visa = results[0]
+    assert "FastAPI" in skills["frameworks"]
+    assert exp["years"] == 3
+    assert visa == VisaSupport.UNKNOWN
+    assert results[1:] == ["fallback", "fallback"]
+    assert [call.args for call in claude_service.batch_extract_job_info.await_args_list] == list(_JOBS[1:])
+    batches.cancel.assert_not_awaited()
+
+
+async def test_batch_past_max_wait_is_cancelled(claude_service):
+    batches = StubBatches("in_progress", [_entry("0", "succeeded", _VALID_RESPONSE)])
+    claude_service.anthropic = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+    with patch.object(claude_connections, 'BATCH_MAX_WAIT', 0.01):
+        results = await claude_service.batch_extract_many(_JOBS)
+
+    batches.cancel.assert_awaited_once_with("batch-1")
+    assert results == ["fallback"] * 3
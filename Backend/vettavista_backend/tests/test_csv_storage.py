@@ -0,0 +1,21 @@
+from modules.models.storage import JobHistoryEntry
+from modules.storage.csv_storage import CSVStorageService
+
+
+def _create_storage(path):
+    return CSVStorageService(str(path), key_column='job_id', data_class=JobHistoryEntry)
+
+
+async def test_cached_rows_match_fresh_load(tmp_path):
+    path = tmp_path / "history.csv"
+    storage = _create_storage(path)
+    await storage.set_many({
+        "1": {"title": "Engineer", "date_applied": None, "user_notes": 42},
+        "2": {"title": "nan", "resume_path": float('nan')},
+    })
+    # Update an existing row, it is written into the cached frame in place
+    await storage.set("1", {"date_rejected": None, "skip_reason": 3.5})
+
+    cached = await storage.get_all()
+    assert cached == await _create_storage(path).get_all()
+    assert cached[0]["date_applied"] == ""
@@ -1,7 +1,5 @@
-import json
 import pytest
 from fastapi.testclient import TestClient
-from fastapi.websockets import WebSocket
 from modules.editor.manager import EditorManager
 from modules.editor.types import (
     ServerMessage,
@@ -17,8 +15,7 @@ from modules.models.services import (
     ProcessingStatus,
     CustomizedContent
 )
-from modules.utils import DataClassJSONEncoder
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 
 @pytest.fixture
 def active_tasks():
@@ -39,12 +36,6 @@ def editor_manager(active_tasks, mock_job_cache):
         manager.resume_generator = mock_generator
         yield manager
 
-@pytest.fixture
-def mock_websocket():
-    websocket = AsyncMock(spec=WebSocket)
-    websocket.send_text = AsyncMock()
-    return websocket
-
 @pytest.fixture
 def test_task(active_tasks):
     """Create a test task and add it to active_tasks"""
@@ -67,7 +58,6 @@ async def setup_session(editor_manager, mock_websocket, test_task):
     await editor_manager.register_client(session_id, mock_websocket)
     return session_id, mock_websocket
 
-@pytest.mark.asyncio
 async def test_broadcast_update_with_dict(editor_manager, mock_websocket):
     # Setup
     session_id = "test-session"
@@ -79,11 +69,10 @@ async def test_broadcast_update_with_dict(editor_manager, mock_websocket):
     
     # Verify
     mock_websocket.send_text.assert_called_once()
-    sent_message = json.loads(mock_websocket.send_text.call_args[0][0])
+    sent_message = mock_websocket.sent[-1]
     # The manager sends dict data directly without wrapping
     assert sent_message == test_data
 
-@pytest.mark.asyncio
 async def test_broadcast_update_with_server_message(editor_manager, mock_websocket):
     # Setup
     session_id = "test-session"
@@ -95,11 +84,10 @@ async def test_broadcast_update_with_server_message(editor_manager, mock_websock
     
     # Verify
     mock_websocket.send_text.assert_called_once()
-    sent_message = json.loads(mock_websocket.send_text.call_args[0][0])
+    sent_message = mock_websocket.sent[-1]
     assert sent_message["type"] == MessageType.PHASE_CHANGE
     assert sent_message["phase"] == ApplicationPhase.RESUME.value
 
-@pytest.mark.asyncio
 @patch('modules.generators.resume_generator.ResumeGenerator.generate_pdf_from_latex')
 @patch('modules.editor.manager.EditorManager._convert_pdf_to_preview')
 async def test_handle_update(mock_convert_pdf, mock_generate_pdf, editor_manager):
@@ -116,7 +104,6 @@ async def test_handle_update(mock_convert_pdf, mock_generate_pdf, editor_manager
     mock_generate_pdf.assert_called_once()
     mock_convert_pdf.assert_called_once_with("test.pdf")
 
-@pytest.mark.asyncio
 async def test_create_session(editor_manager, test_task):
     # Test
     session_id = "test-session"
@@ -132,12 +119,10 @@ async def test_create_session(editor_manager, test_task):
     assert task.resume_data.original == "original"
     assert task.resume_data.customized == "customized"
 
-@pytest.mark.asyncio
 async def test_get_nonexistent_session(editor_manager):
     task = editor_manager.get_task_by_session_id("nonexistent")
     assert task is None
 
-@pytest.mark.asyncio
 async def test_client_registration_lifecycle(editor_manager, mock_websocket):
     # Test registration
     session_id = "test-session"
@@ -148,9 +133,8 @@ async def test_client_registration_lifecycle(editor_manager, mock_websocket):
     await editor_manager.unregister_client(session_id)
     assert session_id not in editor_manager.active_connections
 
-@pytest.mark.asyncio
 async def test_handle_update(editor_manager, setup_session):
-    session_id, mock_websocket = await setup_session
+    session_id, mock_websocket = setup_session
     
     # Setup mock for PDF generation
     editor_manager.resume_generator.generate_pdf_from_latex.return_value = "test.pdf"
@@ -165,22 +149,20 @@ async def test_handle_update(editor_manager, setup_session):
         
         # Verify broadcast
         mock_websocket.send_text.assert_called_once()
-        sent_message = json.loads(mock_websocket.send_text.call_args[0][0])
+        sent_message = mock_websocket.sent[-1]
         assert sent_message["type"] == MessageType.UPDATE.value
         assert sent_message["phase_data"]["original"] == "original"
         assert sent_message["phase_data"]["customized"] == "updated latex"
         assert sent_message["phase_data"]["preview_data"] == "test-png-data"
 
-@pytest.mark.asyncio
 async def test_handle_update_invalid_session(editor_manager):
     update = EditorUpdate(session_id="nonexistent", new_value="test")
     response = await editor_manager.handle_update(update)
     assert not response.success
     assert "Session not found" in response.error_message
 
-@pytest.mark.asyncio
 async def test_handle_update_pdf_generation_failure(editor_manager, setup_session):
-    session_id, mock_websocket = await setup_session
+    session_id, mock_websocket = setup_session
     
     # Setup mock to simulate PDF generation failure
     editor_manager.resume_generator.generate_pdf_from_latex.side_effect = Exception("PDF generation failed")
@@ -196,9 +178,8 @@ async def test_handle_update_pdf_generation_failure(editor_manager, setup_sessio
     # Verify no broadcast was made
     mock_websocket.send_text.assert_not_called()
 
-@pytest.mark.asyncio
 async def test_broadcast_phase_change(editor_manager, setup_session):
-    session_id, mock_websocket = await setup_session
+    session_id, mock_websocket = setup_session
     
     # Test
     phase_data = PhaseData(original="original", customized="customized")
@@ -211,14 +192,13 @@ async def test_broadcast_phase_change(editor_manager, setup_session):
     
     # Verify
     mock_websocket.send_text.assert_called_once()
-    sent_message = json.loads(mock_websocket.send_text.call_args[0][0])
+    sent_message = mock_websocket.sent[-1]
     assert sent_message["type"] == MessageType.PHASE_CHANGE
     assert sent_message["phase"] == "cover_letter"
     assert "phase_data" in sent_message
 
-@pytest.mark.asyncio
 async def test_get_client_state(editor_manager, setup_session):
-    session_id, _ = await setup_session
+    session_id, _ = setup_session
     
     # Ensure task has proper data structure
     task = editor_manager.active_tasks[session_id]
@@ -235,7 +215,6 @@ async def test_get_client_state(editor_manager, setup_session):
     assert state["original_latex"] == "original"
     assert state["customized_latex"] == "customized"
 
-@pytest.mark.asyncio
 async def test_get_client_state_no_session(editor_manager):
     state = await editor_manager.get_client_state("nonexistent")
     assert state == {} 
\ No newline at end of file
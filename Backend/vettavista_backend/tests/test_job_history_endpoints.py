@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from modules.api.rest import job_history_endpoints
+from modules.api.rest.job_history_endpoints import JobHistoryEndpoints
+from modules.models.storage import JobHistoryEntry
+
+
+@pytest.fixture
+def endpoints():
+    storage = AsyncMock()
+    broadcaster = AsyncMock()
+    # Long batch window, so updates are only written early by stop()
+    with patch.dict(job_history_endpoints.STORAGE_SETTINGS, history_batch_wait=60, history_retry_wait=0):
+        yield JobHistoryEndpoints(storage, broadcaster)
+
+
+def _written_ids(storage):
+    return [[entry.job_id for entry in call.args[0]] for call in storage.add_or_update_jobs.await_args_list]
+
+
+async def test_stop_writes_queued_updates(endpoints):
+    for job_id in ("1", "2"):
+        endpoints._enqueue_update(JobHistoryEntry(job_id=job_id))
+    await endpoints.stop()
+
+    assert _written_ids(endpoints.job_history_storage) == [["1", "2"]]
+    endpoints.broadcaster.broadcast_update.assert_awaited_once()
+    assert endpoints._consumer_task.done()
+
+
+async def test_failed_batch_is_written_again(endpoints):
+    storage = endpoints.job_history_storage
+    storage.add_or_update_jobs.side_effect = [OSError("file locked"), None, None]
+    with patch.dict(job_history_endpoints.STORAGE_SETTINGS, history_batch_wait=0):
+        endpoints._enqueue_update(JobHistoryEntry(job_id="1"))
+        while not storage.add_or_update_jobs.await_count:
+            await asyncio.sleep(0)
+        endpoints._enqueue_update(JobHistoryEntry(job_id="2"))
+        await endpoints.stop()
+
+    written = _written_ids(storage)
+    assert written[0] == ["1"]
+    assert sorted(job_id for batch in written[1:] for job_id in batch) == ["1", "2"]
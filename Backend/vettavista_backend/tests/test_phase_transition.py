@@ -1,4 +1,3 @@
-import json
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch, MagicMock, create_autospec
@@ -9,18 +8,18 @@ import pytest
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
 
-from config import resume
-from config.global_constants import STORAGE_SETTINGS
-from modules.api.rest.application_endpoints import ApplicationEndpoints
-from modules.business.application.application_service import ApplicationService
-from modules.business.cache.job_cache_service import JobCacheService
-from modules.editor.manager import EditorManager
-from modules.editor.types import MessageType, PhaseData
-from modules.storage.job_history_storage import JobHistoryStorage
-from modules.ai.protocols import ClaudeServiceProtocol
-from modules.models.services import JobDetailedInfo, ApplicationPhase, ProcessingStatus, GlassdoorRating
-from tests.conftest import create_test_resume
-from modules.api.websocket.editor_endpoints import EditorEndpoints
+from vettavista_backend.config import resume
+from vettavista_backend.config.global_constants import STORAGE_SETTINGS
+from vettavista_backend.modules.api.rest.application_endpoints import ApplicationEndpoints
+from vettavista_backend.modules.business.application.application_service import ApplicationService
+from vettavista_backend.modules.business.cache.job_cache_service import JobCacheService
+from vettavista_backend.modules.editor.manager import EditorManager
+from vettavista_backend.modules.editor.types import MessageType, PhaseData
+from vettavista_backend.modules.storage.job_history_storage import JobHistoryStorage
+from vettavista_backend.modules.ai.protocols import ClaudeServiceProtocol
+from vettavista_backend.modules.models.services import JobDetailedInfo, ApplicationPhase, ProcessingStatus, GlassdoorRating
+from tests.conftest import create_test_resume, loads_json
+from vettavista_backend.modules.api.websocket.editor_endpoints import EditorEndpoints
 
 # Test data
 DUMMY_ORIGINAL_LATEX = "\\documentclass{article}\n\\begin{document}\nOriginal Resume\n\\end{document}"
@@ -55,7 +54,7 @@ def job_cache():
 @pytest.fixture
 def job_history(temp_job_history_file):
     """Create JobHistoryStorage with temporary file."""
-    with patch('modules.storage.job_history_storage.STORAGE_SETTINGS', 
+    with patch('vettavista_backend.modules.storage.job_history_storage.STORAGE_SETTINGS', 
               {'history_file': temp_job_history_file}):
         return JobHistoryStorage()
 
@@ -138,7 +137,6 @@ def test_client(app):
     """Create TestClient for REST endpoints."""
     return TestClient(app)
 
-@pytest.mark.asyncio
 async def test_initial_apply(test_client, application_service, job_cache):
     """Test the initial application flow including WebSocket initialization.
     
@@ -167,7 +165,7 @@ async def test_initial_apply(test_client, application_service, job_cache):
     # Test WebSocket connection through FastAPI TestClient
     with test_client.websocket_connect(f"/ws/editor/{session_id}") as websocket:
         # Receive and verify INIT message
-        init_message = json.loads(websocket.receive_text())
+        init_message = loads_json(websocket.receive_text())
         assert init_message["type"] == MessageType.INIT
         assert isinstance(init_message["phase_data"], dict)
         assert "original" in init_message["phase_data"]
@@ -200,7 +198,7 @@ async def test_initial_apply(test_client, application_service, job_cache):
         # Wait for response with timeout
         try:
             async with async_timeout.timeout(2.0):
-                update_response = json.loads(websocket.receive_text())
+                update_response = loads_json(websocket.receive_text())
                 assert update_response["type"] == MessageType.UPDATE
                 assert isinstance(update_response["phase_data"], dict)
                 assert "customized" in update_response["phase_data"]
@@ -209,7 +207,6 @@ async def test_initial_apply(test_client, application_service, job_cache):
         except asyncio.TimeoutError:
             pytest.fail("Timeout waiting for WebSocket response")
 
-@pytest.mark.asyncio
 async def test_phase_transition(test_client, application_service, job_cache):
     """Test transition from resume to cover letter phase."""
     # Setup cache first
@@ -221,7 +218,7 @@ async def test_phase_transition(test_client, application_service, job_cache):
     application_service._claude.customize_cover_letter.return_value = DUMMY_COVER_LETTER_BODY
     
     # Mock PDF generation and preview conversion
-    application_service._editor_manager.cover_letter_generator.generate_pdf_from_latex = MagicMock(return_value="mock.pdf")
+    application_service._editor_manager.cover_letter_generator.generate_pdf_from_text = MagicMock(return_value="mock.pdf")
     application_service._editor_manager._convert_pdf_to_preview = MagicMock(return_value="mock_preview_data")
     
     # Test apply endpoint
@@ -240,7 +237,7 @@ async def test_phase_transition(test_client, application_service, job_cache):
     
     with test_client.websocket_connect(f"/ws/editor/{session_id}") as websocket:
         # Clear initial INIT message
-        init_message = json.loads(websocket.receive_text())
+        init_message = loads_json(websocket.receive_text())
         assert init_message["type"] == MessageType.INIT
         print(f"Received INIT message: {init_message}")
         
@@ -252,7 +249,7 @@ async def test_phase_transition(test_client, application_service, job_cache):
 
         # Get phase change message
         print("Waiting for phase change message")
-        phase_message = json.loads(websocket.receive_text())
+        phase_message = loads_json(websocket.receive_text())
         print(f"Received phase message: {phase_message}")
         assert phase_message["type"] == MessageType.PHASE_CHANGE
         assert phase_message["phase"] == ApplicationPhase.COVER_LETTER.value
@@ -270,7 +267,7 @@ async def test_phase_transition(test_client, application_service, job_cache):
             "new_value": "Updated Cover Letter"
         }
         websocket.send_json(test_update)
-        update_response = json.loads(websocket.receive_text())
+        update_response = loads_json(websocket.receive_text())
         assert update_response["type"] == MessageType.UPDATE
         assert "preview_data" in update_response["phase_data"]
         assert update_response["phase_data"]["preview_data"] == "mock_preview_data"
@@ -279,7 +276,6 @@ async def test_phase_transition(test_client, application_service, job_cache):
         assert task.current_phase == ApplicationPhase.COVER_LETTER
         assert task.status == ProcessingStatus.PROCESSING
 
-@pytest.mark.asyncio
 async def test_invalid_session_phase_transition(test_client):
     """Test phase transition with invalid session ID."""
     response = test_client.post("/api/apply/cover-letter/invalid-session")
@@ -287,7 +283,6 @@ async def test_invalid_session_phase_transition(test_client):
     assert response.status_code == 400
     assert "No task found for session" in response.json()['detail']
 
-@pytest.mark.asyncio
 async def test_websocket_disconnect_cleanup(test_client, application_service, job_cache):
     """Test cleanup after WebSocket disconnection."""
     # Setup initial connection
@@ -0,0 +1,57 @@
+import zlib
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from vettavista_backend.modules.business.utils import title_matcher
+from vettavista_backend.modules.business.utils.title_matcher import AdvancedEmbeddingMatcher
+
+
+class _StubModel:
+    """Deterministic, non-normalized embeddings so the tests don't load a real model"""
+
+    def encode(self, texts):
+        return np.array([np.random.default_rng(zlib.crc32(t.encode())).uniform(0.5, 3.0, 16) for t in texts])
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    with patch.object(title_matcher, 'load_model_prefer_cache', return_value=_StubModel()):
+        yield AdvancedEmbeddingMatcher(["Software Engineer", "Data Scientist"])
+
+
+def test_similarity_not_scaled_after_get_domain(matcher):
+    job_title = "quantum widget designer"
+    # get_domain goes through the temperature-scaled encode() first
+    job_domain = matcher.get_domain(job_title)
+    results = matcher.get_similarity_with_preferred(job_title)
+
+    job_embedding = _StubModel().encode([job_title])[0]
+    expected = matcher.preferred_embeddings @ (job_embedding / np.linalg.norm(job_embedding))
+    assert [details['domain1'] for _, details in results] == [job_domain] * len(expected)
+    assert [details['base_similarity'] for _, details in results] == pytest.approx(expected.tolist(), abs=1e-5)
+
+def test_encode_after_scoring_is_temperature_scaled(matcher):
+    job_title = "widget quantum architect"
+    matcher.get_similarity_with_preferred(job_title)
+    assert np.linalg.norm(matcher.encode(job_title)) == pytest.approx(matcher.temperature, abs=1e-5)
+
+
+
+
+def test_old_title_keeps_best_score_past_cache_size():
+    with patch.object(title_matcher, 'load_model_prefer_cache', return_value=_StubModel()), \
+            patch.dict(title_matcher.TITLE_MATCH_SETTINGS, cache_size=10):
+        matcher = AdvancedEmbeddingMatcher(["Software Engineer", "Data Scientist", "Frontend Developer"])
+        job_title = "senior python backend engineer"
+        best_score = max(score for score, _ in matcher.get_similarity_with_preferred(job_title))
+
+        # Evict one more title each round, the old title must never come back with a lower score
+        for n in range(2 * title_matcher.TITLE_MATCH_SETTINGS['cache_size']):
+            matcher.cache.clear()
+            matcher.match_title(job_title)
+            matcher.match_title(job_title)
+            for i in range(n):
+                matcher.match_title(f"widget designer {i}")
+            assert matcher.match_title(job_title) == pytest.approx(best_score)
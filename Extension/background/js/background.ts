@@ -60,6 +60,20 @@ class WebSocketClient {
                             updatedStorage.job_history = data.data.history;
                         }
 
+                        // Merge changed history entries by job_id
+                        if (data.data.history_upsert !== undefined) {
+                            const history: JobHistoryEntry[] = [...(updatedStorage.job_history ?? [])];
+                            for (const entry of data.data.history_upsert as JobHistoryEntry[]) {
+                                const index = history.findIndex(e => e.job_id === entry.job_id);
+                                if (index >= 0) {
+                                    history[index] = entry;
+                                } else {
+                                    history.push(entry);
+                                }
+                            }
+                            updatedStorage.job_history = history;
+                        }
+
                         await chrome.storage.local.set(updatedStorage);
                         console.log('Synced with server:', {
                             blacklist: updatedStorage.blacklist?.length ?? 0,